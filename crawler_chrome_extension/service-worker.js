@@ -2206,11 +2206,24 @@ async function postResultPdf(cfg, jobId, pdfUrl, runId) {
   }
 }
 
+// Gzip the HTML so /crawl/result can take it as a compressed body; null if unsupported
+async function gzipHtml(html) {
+  if (typeof CompressionStream === 'undefined') return null;
+  try {
+    const stream = new Blob([html || '']).stream().pipeThrough(new CompressionStream('gzip'));
+    return await new Response(stream).arrayBuffer();
+  } catch (e) {
+    console.log('[gg-sw] gzip failed, sending JSON', { err: String(e) });
+    return null;
+  }
+}
+
 async function postResult(cfg, jobId, html, runId) {
   const base = (cfg.serverBaseUrl || '').replace(/\/$/, '');
   const url = `${base}/crawl/result`;
   const payload = { jobId, html };
   const htmlBytes = (html && html.length) || 0;
+  const gzBody = await gzipHtml(html);
   console.log('[gg-sw] postResult begin', { jobId, url, htmlBytes });
   await logActivity('INFO', `Submitting HTML for job ${jobId}`, { sizeBytes: htmlBytes });
   
@@ -2223,10 +2236,15 @@ async function postResult(cfg, jobId, html, runId) {
       const controller = new AbortController();
       const timeoutId = setTimeout(() => controller.abort(), 30000);
       const headers = await getAuthHeaders();
+      if (gzBody) {
+        headers['Content-Type'] = 'application/octet-stream';
+        headers['Content-Encoding'] = 'gzip';
+        headers['X-Job-Id'] = jobId;
+      }
       const resp = await fetch(url, {
         method: 'POST',
         headers,
-        body: JSON.stringify(payload),
+        body: gzBody || JSON.stringify(payload),
         signal: controller.signal,
       });
       clearTimeout(timeoutId);
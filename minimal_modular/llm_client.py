@@ -1,5 +1,6 @@
 """Multi-provider LLM client supporting OpenAI, Gemini, Anthropic Claude, and DeepSeek with caching."""
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from config import (
     LLM_PROVIDER,
@@ -11,6 +12,13 @@ from config import (
 )
 from cache_utils import get_gpt_cache, set_gpt_cache
 
+# Shared keep-alive session so repeated prompts (e.g. AI report generation)
+# reuse TLS connections instead of handshaking with the provider on every call.
+# Reuse is independent of use_cache: cache misses still go through this pool.
+_SESSION = requests.Session()
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(_scheme, HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 def call_openai_api(system_prompt: str, user_prompt: str, model: str, timeout: int) -> dict:
     """Call OpenAI Chat Completions API"""
@@ -30,7 +38,7 @@ def call_openai_api(system_prompt: str, user_prompt: str, model: str, timeout: i
         ],
     }
     
-    resp = requests.post(
+    resp = _SESSION.post(
         OPENAI_API_URL,
         headers=headers,
         json=payload,
@@ -62,7 +70,7 @@ def call_gemini_api(system_prompt: str, user_prompt: str, model: str, timeout: i
     }
     
     # Add API key as query parameter for Gemini
-    resp = requests.post(
+    resp = _SESSION.post(
         f"{url}?key={GEMINI_API_KEY}",
         headers=headers,
         json=payload,
@@ -120,7 +128,7 @@ def call_anthropic_api(system_prompt: str, user_prompt: str, model: str, timeout
         # Extended thinking requires higher max_tokens
         payload["max_tokens"] = max(16000, ANTHROPIC_THINKING_BUDGET + 8192)
     
-    resp = requests.post(
+    resp = _SESSION.post(
         ANTHROPIC_API_URL,
         headers=headers,
         json=payload,
@@ -176,7 +184,7 @@ def call_deepseek_api(system_prompt: str, user_prompt: str, model: str, timeout:
         ],
     }
     
-    resp = requests.post(
+    resp = _SESSION.post(
         DEEPSEEK_API_URL,
         headers=headers,
         json=payload,
@@ -14,12 +14,26 @@ import hashlib
 import secrets
 import shutil
 import re
+import asyncio
+import atexit
+import base64
+import gzip
+import itertools
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from functools import wraps
+from pathlib import Path
 from flask import Flask, request, jsonify, Response, send_file, stream_with_context, g
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import sqlite3
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # JWT secret key - in production, use environment variable
 JWT_SECRET = os.environ.get("JWT_SECRET", "cretextract-dev-secret-key-change-in-production")
@@ -55,9 +69,16 @@ os.makedirs(IPC_DIR, exist_ok=True)
 
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 
-# Global log buffer for SSE
-log_buffer = []
+# Global log buffer for SSE (entries carry a process-local sequence id)
+log_buffer = deque(maxlen=1000)
 log_buffer_lock = threading.Lock()
+log_sequence = itertools.count(1)
+
+# Pending log rows, persisted in batches by the log writer thread
+log_queue = queue.SimpleQueue()
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+LOG_FLUSH_BATCH_SIZE = 500
+LOG_QUEUE_MAX_BACKLOG = 10000  # append_run_logs answers 503 beyond this so clients retry later
 
 # Active run processes
 active_processes = {}  # run_id -> subprocess.Popen
@@ -66,14 +87,108 @@ active_processes = {}  # run_id -> subprocess.Popen
 # Database Setup
 # ============================================================================
 
-def get_db():
-    """Get thread-local database connection with timeout for concurrency."""
-    conn = sqlite3.connect(DB_PATH, timeout=30.0)
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+_iso_second = (None, "")
+
+def iso_now() -> str:
+    """Current UTC time as an ISO-8601 string with a 'Z' suffix (same shape as ISO_UTC_FORMAT).
+    
+    The date/time prefix is formatted once per second and reused; only the microseconds change per call.
+    """
+    global _iso_second
+    t = time.time()
+    sec = int(t)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+        _iso_second = (sec, prefix)
+    return f"{prefix}{int((t - sec) * 1_000_000):06d}Z"
+
+def _configure_connection(conn, readonly: bool = False):
+    """Apply per-connection pragmas: WAL so readers don't block on writers, NORMAL sync, larger page cache."""
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    if not readonly:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
     conn.execute("PRAGMA busy_timeout=30000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
     return conn
 
+def get_db():
+    """Get thread-local database connection with timeout for concurrency."""
+    return _configure_connection(sqlite3.connect(DB_PATH, timeout=30.0))
+
+def _open_pooled_connection(readonly: bool = False):
+    """Open a connection that may be shared across request threads via a pool."""
+    if readonly:
+        uri = Path(os.path.abspath(DB_PATH)).as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, timeout=30.0, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(DB_PATH, timeout=30.0, check_same_thread=False)
+    return _configure_connection(conn, readonly)
+
+class ConnectionPool:
+    """Bounded pool of reusable SQLite connections.
+    
+    Connections are opened lazily up to max_size and handed back after use, so hot
+    endpoints skip reopening the database (and its -wal/-shm files) per request.
+    """
+    
+    def __init__(self, readonly: bool = False, max_size: int = 20, acquire_timeout: float = 30.0):
+        self.readonly = readonly
+        self.acquire_timeout = acquire_timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+    
+    def acquire(self):
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise sqlite3.OperationalError("Timed out waiting for a pooled database connection")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return _open_pooled_connection(self.readonly)
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def release(self, conn):
+        try:
+            # Anything a handler left uncommitted is discarded, as closing would have done
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+        else:
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+# Pools used by the crawl/PDF paths via borrow_conn(). The single pooled writer only serializes
+# those callers with each other; handlers using get_db() still open their own write connections
+# and contend through busy_timeout. The read pool keeps their SELECTs off the writer.
+_write_pool = ConnectionPool(readonly=False, max_size=1)
+_read_pool = ConnectionPool(readonly=True)
+
+@contextmanager
+def borrow_conn(readonly: bool = False):
+    """Check out a pooled connection for the duration of a with-block."""
+    pool = _read_pool if readonly else _write_pool
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+def analyze_crawl_jobs(conn):
+    """Refresh planner statistics for crawl_jobs after a bulk insert (sampled, so cost is bounded)."""
+    conn.execute("PRAGMA analysis_limit = 1000")
+    conn.execute("ANALYZE crawl_jobs")
+
 def init_db():
     """Initialize database tables."""
     conn = get_db()
@@ -199,6 +314,9 @@ def init_db():
         except Exception:
             pass
 
+    # Per-run source listing, PDF conversion and skip_crawling all filter sources by run_id
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_sources_run ON sources(run_id)")
+
     # Idempotent schema upgrades for runs (meta_source_id)
     try:
         cur.execute("ALTER TABLE runs ADD COLUMN meta_source_id TEXT")
@@ -252,7 +370,7 @@ def init_db():
             query TEXT NOT NULL,
             search_config TEXT,
             result_text TEXT,
-            extracted_links TEXT,
+            extracted_links BLOB,
             logs TEXT,
             created_at TEXT,
             started_at TEXT,
@@ -337,6 +455,7 @@ def init_db():
             FOREIGN KEY (run_id) REFERENCES runs(id)
         )
     """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_files_run ON files(run_id, file_type)")
     
     # Crawl jobs table - jobs for Chrome extension to process
     cur.execute("""
@@ -379,9 +498,72 @@ def init_db():
     """)
     
     # Create indexes for crawl_jobs
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_user_status ON crawl_jobs(user_id, status)")
+    # (user_id, status) and (run_id) lookups are served by the leading columns of the composites below
+    cur.execute("DROP INDEX IF EXISTS idx_crawl_jobs_user_status")
+    cur.execute("DROP INDEX IF EXISTS idx_crawl_jobs_run")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_user_status_created ON crawl_jobs(user_id, status, created_at, id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_run_user_status ON crawl_jobs(run_id, user_id, status)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_user_dr_status ON crawl_jobs(user_id, deep_research_id, status)")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_deep_research ON crawl_jobs(deep_research_id)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_run ON crawl_jobs(run_id)")
+    
+    # Encoding of crawl_jobs.html: 'gzip' for compressed BLOBs, NULL/'utf-8' for legacy text
+    try:
+        cur.execute("ALTER TABLE crawl_jobs ADD COLUMN html_encoding TEXT")
+    except sqlite3.OperationalError:
+        pass
+    
+    # Virtual generated flag for PDF-looking URLs, with a partial index so purges seek instead of scan
+    try:
+        cur.execute("""
+            ALTER TABLE crawl_jobs ADD COLUMN is_pdf INTEGER GENERATED ALWAYS AS (
+                CASE WHEN lower(url) LIKE '%.pdf' OR lower(url) LIKE '%/pdf/%' OR lower(url) LIKE '%pdf?%' THEN 1 ELSE 0 END
+            ) VIRTUAL
+        """)
+    except sqlite3.OperationalError:
+        pass
+    try:
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_user_is_pdf ON crawl_jobs(user_id, deep_research_id) WHERE is_pdf = 1")
+    except sqlite3.OperationalError:
+        pass  # SQLite without generated columns; purge falls back to a Python URL filter
+    
+    # Per-user status counters for crawl_jobs, kept current by triggers
+    cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='crawl_job_counts'")
+    seed_crawl_job_counts = cur.fetchone() is None
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_job_counts (
+            user_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            n INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, status)
+        )
+    """)
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_crawl_jobs_count_ins AFTER INSERT ON crawl_jobs
+        BEGIN
+            INSERT INTO crawl_job_counts (user_id, status, n) VALUES (NEW.user_id, COALESCE(NEW.status, ''), 1)
+            ON CONFLICT(user_id, status) DO UPDATE SET n = n + 1;
+        END
+    """)
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_crawl_jobs_count_del AFTER DELETE ON crawl_jobs
+        BEGIN
+            UPDATE crawl_job_counts SET n = n - 1 WHERE user_id = OLD.user_id AND status = COALESCE(OLD.status, '');
+        END
+    """)
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_crawl_jobs_count_upd AFTER UPDATE OF status, user_id ON crawl_jobs
+        WHEN OLD.status IS NOT NEW.status OR OLD.user_id IS NOT NEW.user_id
+        BEGIN
+            UPDATE crawl_job_counts SET n = n - 1 WHERE user_id = OLD.user_id AND status = COALESCE(OLD.status, '');
+            INSERT INTO crawl_job_counts (user_id, status, n) VALUES (NEW.user_id, COALESCE(NEW.status, ''), 1)
+            ON CONFLICT(user_id, status) DO UPDATE SET n = n + 1;
+        END
+    """)
+    if seed_crawl_job_counts:
+        cur.execute("""
+            INSERT INTO crawl_job_counts (user_id, status, n)
+            SELECT user_id, COALESCE(status, ''), COUNT(*) FROM crawl_jobs GROUP BY user_id, COALESCE(status, '')
+        """)
     
     # Migrate: Add new columns if they don't exist
     try:
@@ -504,7 +686,8 @@ def process_pdf_sources_for_run(run_id: str, user_id: str = None):
                 pass
 
             try:
-                pdf_text = convert_pdf_to_text(pdf_path, use_cache=True)
+                with _pdf_convert_slots:
+                    pdf_text = convert_pdf_to_text(pdf_path, use_cache=True)
                 if not pdf_text or len(str(pdf_text).strip()) == 0:
                     raise ValueError("Empty PDF text")
 
@@ -641,10 +824,13 @@ def verify_password(password: str, password_hash: str) -> bool:
     try:
         salt, stored_hash = password_hash.split(":")
         hash_obj = hashlib.sha256((salt + password).encode())
-        return hash_obj.hexdigest() == stored_hash
+        return secrets.compare_digest(hash_obj.hexdigest(), stored_hash)
     except:
         return False
 
+# Verified against on unknown-email sign-ins so they cost the same as a wrong password
+_DUMMY_HASH = hash_password(secrets.token_hex(32))
+
 def create_token(user_id: str, email: str) -> str:
     """Create a simple JWT-like token (base64 encoded JSON with signature)."""
     import base64
@@ -724,8 +910,23 @@ def optional_auth(f):
         return f(*args, **kwargs)
     return decorated
 
+HAS_SOURCES_TABLE = False
+HAS_CRAWL_JOBS_IS_PDF = False
+
+def refresh_schema_flags():
+    """Detect optional tables/columns once so handlers don't need per-call try/except guards."""
+    global HAS_SOURCES_TABLE, HAS_CRAWL_JOBS_IS_PDF
+    conn = get_db()
+    cur = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='sources'")
+    HAS_SOURCES_TABLE = cur.fetchone() is not None
+    # Generated columns only show up in table_xinfo (needs SQLite >= 3.31)
+    cur = conn.execute("SELECT 1 FROM pragma_table_xinfo('crawl_jobs') WHERE name = 'is_pdf'")
+    HAS_CRAWL_JOBS_IS_PDF = cur.fetchone() is not None
+    conn.close()
+
 # Initialize DB on startup
 init_db()
+refresh_schema_flags()
 
 def seed_default_config():
     """Seed global default configuration values for CreteXtract production deployment."""
@@ -1100,7 +1301,7 @@ def seed_default_config():
     
     conn = get_db()
     cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     
     for cfg in defaults:
         # Check if key already exists (NULL user_id = global)
@@ -1186,21 +1387,55 @@ def log_message(message: str, level: str = "INFO", run_id: str = None):
     timestamp = now.strftime("[%d/%m/%Y -- %H:%M:%S]")
     timestamped_message = f"{timestamp} {message}"
     
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO logs (created_at, level, message, run_id) VALUES (?, ?, ?, ?)",
-        (now_iso, level, timestamped_message, run_id)
-    )
-    conn.commit()
-    log_id = cur.lastrowid
-    conn.close()
+    # Persisted asynchronously by the log writer thread
+    log_queue.put((now_iso, level, timestamped_message, run_id, "server", None))
     
     # Add to SSE buffer
     with log_buffer_lock:
-        log_buffer.append({"id": log_id, "createdAt": now_iso, "level": level, "message": timestamped_message, "runId": run_id})
-        if len(log_buffer) > 1000:
-            log_buffer.pop(0)
+        log_buffer.append({"id": next(log_sequence), "createdAt": now_iso, "level": level, "message": timestamped_message, "runId": run_id})
+
+def _drain_log_queue(first_entry=None, timeout: float = 0.0) -> list:
+    """Collect up to LOG_FLUSH_BATCH_SIZE queued log rows, waiting at most timeout seconds."""
+    batch = [first_entry] if first_entry is not None else []
+    deadline = time.monotonic() + timeout
+    while len(batch) < LOG_FLUSH_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        try:
+            batch.append(log_queue.get(timeout=remaining) if remaining > 0 else log_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+def _write_log_batch(conn, batch: list):
+    """Insert a batch of log rows in a single transaction."""
+    try:
+        conn.executemany(
+            "INSERT INTO logs (created_at, level, message, run_id, source, context) VALUES (?, ?, ?, ?, ?, ?)",
+            batch
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"[LOGS] Failed to persist {len(batch)} log entries: {e}")
+
+def _log_writer_loop():
+    """Persist queued log rows in batches, one commit per LOG_FLUSH_INTERVAL window."""
+    conn = get_db()
+    while True:
+        batch = _drain_log_queue(log_queue.get(), LOG_FLUSH_INTERVAL)
+        _write_log_batch(conn, batch)
+
+def _flush_log_queue():
+    """Persist any log rows still queued at interpreter shutdown."""
+    conn = get_db()
+    batch = _drain_log_queue()
+    while batch:
+        _write_log_batch(conn, batch)
+        batch = _drain_log_queue()
+    conn.close()
+
+threading.Thread(target=_log_writer_loop, name="log-writer", daemon=True).start()
+atexit.register(_flush_log_queue)
 
 def paginate(query_result, page: int, page_size: int):
     """Paginate a list of results."""
@@ -1264,6 +1499,15 @@ def to_camel_dict(d):
         return [to_camel_dict(i) for i in d]
     return d
 
+def _json_response(obj, status: int = 200) -> Response:
+    """Serialize obj with orjson into a JSON response (faster than jsonify for large payloads)."""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
+def _conditional_response(resp: Response) -> Response:
+    """Tag a GET response with a body ETag and answer a matching If-None-Match with 304."""
+    resp.add_etag()
+    return resp.make_conditional(request)
+
 def register_file(filepath: str, original_name: str, file_type: str, run_id: str = None, mime_type: str = None) -> str:
     """Register a file in the database and return its ID. Path is stored internally, never exposed."""
     file_id = str(uuid.uuid4())
@@ -1898,10 +2142,12 @@ def list_runs():
     If authenticated, returns only the user's runs.
     If not authenticated, returns all runs (for backward compatibility).
     Use ?all=true to get all runs regardless of ownership (if authenticated).
+    Use ?id=<run_id> to check a single run's presence without paging the list.
     """
     page = int(request.args.get("page", 1))
     page_size = int(request.args.get("pageSize", 10))
     q = request.args.get("q", "")
+    run_id_filter = request.args.get("id")
     sort = request.args.get("sort")
     show_all = request.args.get("all", "false").lower() == "true"
     
@@ -1913,18 +2159,18 @@ def list_runs():
     order_col, order_dir = _parse_runs_sort(sort)
     offset = max(0, (page - 1) * page_size)
 
-    where_clause = ""
+    conditions = []
     params = []
     if user and not show_all:
-        where_clause = "WHERE user_id = ?"
+        conditions.append("user_id = ?")
         params.append(user["id"])
-        if q:
-            where_clause += " AND name LIKE ?"
-            params.append(f"%{q}%")
-    else:
-        if q:
-            where_clause = "WHERE name LIKE ?"
-            params.append(f"%{q}%")
+    if q:
+        conditions.append("name LIKE ?")
+        params.append(f"%{q}%")
+    if run_id_filter:
+        conditions.append("id = ?")
+        params.append(run_id_filter)
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
     cur.execute(f"SELECT COUNT(*) as total FROM runs {where_clause}", tuple(params))
     total = int(cur.fetchone()[0])
@@ -1957,7 +2203,7 @@ def list_runs():
         
         results.append(result)
 
-    return jsonify({"items": results, "total": total, "page": page, "pageSize": page_size})
+    return _conditional_response(jsonify({"items": results, "total": total, "page": page, "pageSize": page_size}))
 
 @app.route("/runs/nuke", methods=["POST"])
 def nuke_all_runs():
@@ -2007,6 +2253,7 @@ def nuke_all_runs():
                     uploads_deleted += 1
                 except:
                     pass
+    _known_dirs.clear()
     
     # Delete all export directories
     exports_deleted = 0
@@ -2051,7 +2298,11 @@ def nuke_all_runs():
 
 @app.route("/runs/<run_id>", methods=["GET"])
 def get_run(run_id):
-    """Get run details by ID. Paths are NOT exposed - use file IDs instead."""
+    """Get run details by ID. Paths are NOT exposed - use file IDs instead.
+    
+    ?expand=engine adds the engine status inline (plus stderrTail for failed runs),
+    saving a separate /engine/status or /engine/logs round trip.
+    """
     conn = get_db()
     cur = conn.cursor()
     cur.execute("SELECT * FROM runs WHERE id = ?", (run_id,))
@@ -2095,6 +2346,11 @@ def get_run(run_id):
         "deepResearchQuery": run.get("deep_research_query"),
         "deepResearchResult": run.get("deep_research_result"),
     }
+    if request.args.get("expand") == "engine":
+        engine = _engine_status(run["id"], run["status"])
+        if engine["crashed"]:
+            engine["stderrTail"] = _engine_stderr_tail(run["id"])
+        result["engine"] = engine
     
     return jsonify(result)
 
@@ -2321,11 +2577,12 @@ def create_run():
         
         log_message(f"Run created: {name} ({pdf_count} PDFs uploaded)", "INFO", run_id)
 
-        # Start background conversion for PDF sources so they transition to READY
+        # Queue background conversion for PDF sources so they transition to READY
         try:
-            threading.Thread(target=process_pdf_sources_for_run, args=(run_id, user_id), daemon=True).start()
-        except Exception:
-            pass
+            PDF_WORK_QUEUE.put((process_pdf_sources_for_run, (run_id, user_id)), timeout=5)
+        except queue.Full:
+            log_message("PDF work queue full; PDF sources left for conversion at extraction start", "WARN", run_id)
+            return jsonify({"error": "PDF work queue is full, retry later", "id": run_id}), 503
         
         # Build response without exposing paths
         result = {
@@ -2403,7 +2660,7 @@ def create_run_from_search():
         return jsonify({"error": "GEMINI_API_KEY not configured. Set it in Config > API Keys."}), 400
     
     run_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     
     # Create run directories
     run_upload_dir = os.path.join(UPLOAD_FOLDER, run_id)
@@ -2660,18 +2917,18 @@ def create_run_from_search():
             
             cur3.execute("UPDATE runs SET sources_count = ? WHERE id = ?", (html_count + pdf_count, run_id))
             conn3.commit()
+            analyze_crawl_jobs(conn3)
             conn3.close()
             
             log_message(f"Created {html_count} HTML crawl jobs and {pdf_count} PDF jobs", "SUCCESS", run_id)
             
-            # Start background thread to download PDFs if any
+            # Queue background PDF download if any
             if pdf_count > 0:
-                threading.Thread(
-                    target=process_pdf_jobs_for_run,
-                    args=(run_id, user_id),
-                    daemon=True
-                ).start()
-                log_message(f"Started background PDF download for {pdf_count} PDF(s)", "INFO", run_id)
+                try:
+                    PDF_WORK_QUEUE.put((process_pdf_jobs_for_run, (run_id, user_id)), timeout=5)
+                    log_message(f"Started background PDF download for {pdf_count} PDF(s)", "INFO", run_id)
+                except queue.Full:
+                    log_message(f"PDF work queue full; {pdf_count} PDF job(s) left as PDF_PENDING", "WARN", run_id)
             
         except Exception as e:
             log_message(f"Deep Research failed: {str(e)}", "ERROR", run_id)
@@ -2775,7 +3032,7 @@ def create_run_from_links():
     validation_max_retries = int(request.form.get("validationMaxRetries", "3"))
     
     run_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     
     # Create run directories
     run_upload_dir = os.path.join(UPLOAD_FOLDER, run_id)
@@ -2860,6 +3117,7 @@ def create_run_from_links():
                 crawl_job_id=job_id,
                 pdf_file_id=None,
                 meta_source_id=meta_source_id,
+                cur=cur,
             )
         else:
             job_id = str(uuid.uuid4())
@@ -2879,20 +3137,22 @@ def create_run_from_links():
                 crawl_job_id=job_id,
                 pdf_file_id=None,
                 meta_source_id=meta_source_id,
+                cur=cur,
             )
     
     conn.commit()
+    analyze_crawl_jobs(conn)
     conn.close()
     
     log_message(f"Manual Links run created: {name} with {len(valid_links)} URLs ({html_count} HTML, {pdf_count} PDFs)", "INFO", run_id)
     
-    # Start background thread to download PDFs if any
+    # Queue background PDF download if any
     if pdf_count > 0:
-        threading.Thread(
-            target=process_pdf_jobs_for_run,
-            args=(run_id, user_id),
-            daemon=True
-        ).start()
+        try:
+            PDF_WORK_QUEUE.put((process_pdf_jobs_for_run, (run_id, user_id)), timeout=5)
+        except queue.Full:
+            log_message(f"PDF work queue full; {pdf_count} PDF job(s) left as PDF_PENDING", "WARN", run_id)
+            return jsonify({"error": "PDF work queue is full, retry later", "id": run_id}), 503
         log_message(f"Started background PDF download for {pdf_count} PDF(s)", "INFO", run_id)
     
     return jsonify({
@@ -3059,16 +3319,29 @@ def get_engine_status(run_id):
     if not row:
         return jsonify({"error": "Run not found"}), 404
     
-    status = row["status"]
+    return jsonify(_engine_status(run_id, row["status"]))
+
+def _engine_status(run_id: str, status: str) -> dict:
+    """Engine status payload, derived from the run's status."""
     crashed = status == "failed"
-    
-    return jsonify({
+    return {
         "runId": run_id,
         "state": status,
         "crashed": crashed,
         "crashCount": 1 if crashed else 0,
         "crashes": []
-    })
+    }
+
+def _engine_stderr_tail(run_id: str, max_chars: int = 500) -> str:
+    """Last max_chars of the engine's stderr.log (reads only the file's tail)."""
+    stderr_path = os.path.join(IPC_DIR, run_id, "stderr.log")
+    try:
+        with open(stderr_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - max_chars * 4))
+            return f.read().decode("utf-8", errors="replace")[-max_chars:]
+    except OSError:
+        return ""
 
 @app.route("/runs/<run_id>/engine/data", methods=["GET"])
 def get_engine_data(run_id):
@@ -3852,11 +4125,12 @@ def retry_run(run_id):
 
         log_message(f"Run retried from {run_id}: {name}", "INFO", new_run_id)
 
-        # Start background conversion for PDF sources so they transition to READY
+        # Queue background conversion for PDF sources so they transition to READY
         try:
-            threading.Thread(target=process_pdf_sources_for_run, args=(new_run_id, user_id), daemon=True).start()
-        except Exception:
-            pass
+            PDF_WORK_QUEUE.put((process_pdf_sources_for_run, (new_run_id, user_id)), timeout=5)
+        except queue.Full:
+            log_message("PDF work queue full; PDF sources left for conversion at extraction start", "WARN", new_run_id)
+            return jsonify({"error": "PDF work queue is full, retry later", "id": new_run_id}), 503
 
         if auto_start:
             # Parse cache flags from source run
@@ -3955,10 +4229,15 @@ def retry_run(run_id):
                 )
                 html_count += 1
         conn.commit()
+        analyze_crawl_jobs(conn)
         conn.close()
 
         if pdf_count > 0:
-            threading.Thread(target=process_pdf_jobs_for_run, args=(new_run_id, user_id), daemon=True).start()
+            try:
+                PDF_WORK_QUEUE.put((process_pdf_jobs_for_run, (new_run_id, user_id)), timeout=5)
+            except queue.Full:
+                log_message(f"PDF work queue full; {pdf_count} PDF job(s) left as PDF_PENDING", "WARN", new_run_id)
+                return jsonify({"error": "PDF work queue is full, retry later", "id": new_run_id}), 503
 
         log_message(f"Links run retried from {run_id}: {name}", "INFO", new_run_id)
         return jsonify(
@@ -4123,6 +4402,7 @@ def retry_run(run_id):
                         cur=cur3,
                     )
                 conn3.commit()
+                analyze_crawl_jobs(conn3)
                 conn3.close()
                 
                 log_message(f"Created {len(unique_links)} crawl jobs for extension to process", "SUCCESS", new_run_id)
@@ -5680,7 +5960,7 @@ def export_run(run_id):
     cur = conn.cursor()
     cur.execute(
         "INSERT INTO exports (run_id, created_at, file_path) VALUES (?, ?, ?)",
-        (run_id, datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), filepath)
+        (run_id, iso_now(), filepath)
     )
     conn.commit()
     conn.close()
@@ -5748,7 +6028,7 @@ def export_run_pdf(run_id):
     cur = conn.cursor()
     cur.execute(
         "INSERT INTO exports (run_id, created_at, file_path) VALUES (?, ?, ?)",
-        (run_id, datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), filepath)
+        (run_id, iso_now(), filepath)
     )
     export_id = cur.lastrowid
     conn.commit()
@@ -5762,6 +6042,15 @@ def export_run_pdf(run_id):
     })
 
 
+def _decoded_crawl_job(row) -> dict:
+    """crawl_jobs row as a dict with html as text (gzip BLOBs decompressed)."""
+    job = dict(row)
+    if job.get("html_encoding") == "gzip" and job.get("html") is not None:
+        job["html"] = gzip.decompress(job["html"]).decode("utf-8", errors="replace")
+        job["html_encoding"] = "utf-8"
+    return job
+
+
 @app.route("/runs/<run_id>/export-zip", methods=["POST"])
 @optional_auth
 def export_run_zip(run_id):
@@ -5824,9 +6113,9 @@ def export_run_zip(run_id):
     cur.execute("SELECT * FROM files WHERE run_id = ?", (run_id,))
     files = [dict(r) for r in cur.fetchall()]
     
-    # Crawl jobs
+    # Crawl jobs (gzip-stored HTML decoded so the dumps hold readable text)
     cur.execute("SELECT * FROM crawl_jobs WHERE run_id = ?", (run_id,))
-    crawl_jobs = [dict(r) for r in cur.fetchall()]
+    crawl_jobs = [_decoded_crawl_job(r) for r in cur.fetchall()]
     
     conn.close()
     
@@ -6240,7 +6529,7 @@ def export_run_zip(run_id):
     cur = conn.cursor()
     cur.execute(
         "INSERT INTO exports (run_id, created_at, file_path) VALUES (?, ?, ?)",
-        (run_id, datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), filepath)
+        (run_id, iso_now(), filepath)
     )
     export_id = cur.lastrowid
     conn.commit()
@@ -6316,14 +6605,14 @@ def list_config():
         rows.append(row)
     
     conn.close()
-    return jsonify(rows)
+    return _conditional_response(jsonify(rows))
 
 @app.route("/config", methods=["POST"])
 @optional_auth
 def upsert_config():
     """Create or update a config entry for current user."""
     data = request.json
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     user = g.current_user
     user_id = user["id"] if user else None
     
@@ -6483,7 +6772,7 @@ def reset_config(key):
         return jsonify({"error": "Config key not found"}), 404
     
     default_value = row["default_value"] or ""
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     
     if user_id:
         # Delete user override to revert to global
@@ -6502,7 +6791,7 @@ def reset_config(key):
 def import_config():
     """Import config from JSON for current user."""
     data = request.json.get("data", {})
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     user = g.current_user
     user_id = user["id"] if user else None
     
@@ -6680,7 +6969,8 @@ def run_sources_list(run_id):
                     if not pdf_path or not os.path.exists(pdf_path):
                         continue
                     try:
-                        pdf_text = convert_pdf_to_text(pdf_path, use_cache=True)
+                        with _pdf_convert_slots:
+                            pdf_text = convert_pdf_to_text(pdf_path, use_cache=True)
                     except Exception:
                         continue
                     if not pdf_text or len(str(pdf_text).strip()) == 0:
@@ -6956,7 +7246,7 @@ def list_cache_providers():
             "lastAccessed": now
         })
     
-    return jsonify(providers)
+    return _conditional_response(jsonify(providers))
 
 @app.route("/cache/entries", methods=["GET"])
 def list_cache_entries():
@@ -6991,7 +7281,7 @@ def list_cache_entries():
     # Sort by last accessed descending
     entries.sort(key=lambda x: x["lastAccessed"], reverse=True)
     
-    return jsonify(paginate(entries, page, page_size))
+    return _conditional_response(jsonify(paginate(entries, page, page_size)))
 
 @app.route("/cache/entries/<path:entry_id>", methods=["DELETE"])
 def delete_cache_entry(entry_id):
@@ -7100,6 +7390,51 @@ def server_logs_stream():
         }
     )
 
+RUN_EVENTS_POLL_SECONDS = 1.0
+RUN_EVENTS_HEARTBEAT_SECONDS = 15
+FINAL_RUN_STATUSES = ("completed", "failed", "aborted")
+
+@app.route("/runs/<run_id>/events", methods=["GET"])
+def run_events_stream(run_id):
+    """SSE stream of a run's status transitions; ends once the run reaches a final status.
+    
+    Emits `event: status` with {"id", "status"} whenever the status changes, and a comment
+    heartbeat otherwise. Each check is a primary-key read of one column on the read pool,
+    far cheaper than clients re-fetching GET /runs/<run_id> on a timer.
+    """
+    with borrow_conn(readonly=True) as conn:
+        if not conn.execute("SELECT 1 FROM runs WHERE id = ?", (run_id,)).fetchone():
+            return jsonify({"error": "Run not found"}), 404
+    
+    def generate():
+        status = None
+        last_sent = time.monotonic()
+        while True:
+            with borrow_conn(readonly=True) as conn:
+                row = conn.execute("SELECT status FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return
+            if row["status"] != status:
+                status = row["status"]
+                yield f"event: status\ndata: {json.dumps({'id': run_id, 'status': status})}\n\n"
+                last_sent = time.monotonic()
+                if status in FINAL_RUN_STATUSES:
+                    return
+            elif time.monotonic() - last_sent >= RUN_EVENTS_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            time.sleep(RUN_EVENTS_POLL_SECONDS)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
 # ============================================================================
 # API Routes - Auth
 # ============================================================================
@@ -7129,7 +7464,7 @@ def signup():
     # Create user
     user_id = str(uuid.uuid4())
     password_hash = hash_password(password)
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     
     cur.execute("""
         INSERT INTO users (id, email, password_hash, created_at, is_active)
@@ -7168,14 +7503,13 @@ def signin():
     row = cur.fetchone()
     conn.close()
     
-    if not row:
+    # Always verify, even for unknown emails, so timing doesn't reveal which accounts exist
+    password_ok = verify_password(password, row["password_hash"] if row else _DUMMY_HASH)
+    if not row or not password_ok:
         return jsonify({"error": "Invalid email or password"}), 401
     
     user = dict(row)
     
-    if not verify_password(password, user["password_hash"]):
-        return jsonify({"error": "Invalid email or password"}), 401
-    
     if not user["is_active"]:
         return jsonify({"error": "Account is disabled"}), 403
     
@@ -7228,6 +7562,23 @@ def get_me():
 
 DEEP_RESEARCH_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/interactions"
 
+# (connect, read) timeouts for Gemini calls; link extraction reads a much larger response
+DEEP_RESEARCH_TIMEOUT = (5, 60)
+GEMINI_EXTRACT_TIMEOUT = (5, 120)
+
+# Markdown code fences (```json ... ```) around model JSON output
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```\s*$', re.MULTILINE)
+
+# Shared keep-alive session so polling reuses TLS connections instead of
+# handshaking with generativelanguage.googleapis.com on every call.
+# 429 is left out of the retry list so the poll loop sees the HTTPError and honours Retry-After.
+_gemini_session = requests.Session()
+_gemini_session.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+))
+
 def get_gemini_api_key(user_id=None):
     """Get Gemini API key from user config, global config, or environment.
     
@@ -7256,7 +7607,6 @@ def get_gemini_api_key(user_id=None):
 
 def deep_research_start(query: str, api_key: str) -> dict:
     """Start a Deep Research task with Gemini API."""
-    import requests as req
     headers = {
         "Content-Type": "application/json",
         "x-goog-api-key": api_key
@@ -7266,24 +7616,20 @@ def deep_research_start(query: str, api_key: str) -> dict:
         "agent": "deep-research-pro-preview-12-2025",
         "background": True
     }
-    resp = req.post(DEEP_RESEARCH_BASE_URL, headers=headers, json=payload, timeout=60)
+    resp = _gemini_session.post(DEEP_RESEARCH_BASE_URL, headers=headers, json=payload, timeout=DEEP_RESEARCH_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
 def deep_research_status(interaction_id: str, api_key: str) -> dict:
     """Check status of a Deep Research task."""
-    import requests as req
     headers = {"x-goog-api-key": api_key}
     url = f"{DEEP_RESEARCH_BASE_URL}/{interaction_id}"
-    resp = req.get(url, headers=headers, timeout=30)
+    resp = _gemini_session.get(url, headers=headers, timeout=DEEP_RESEARCH_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
 def extract_links_with_gemini(report_text: str, api_key: str) -> dict:
     """Extract links from research report using Gemini."""
-    import requests as req
-    import re
-    
     gemini_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent?key={api_key}"
     
     extraction_prompt = f"""
@@ -7304,24 +7650,143 @@ def extract_links_with_gemini(report_text: str, api_key: str) -> dict:
         }]
     }
     
-    resp = req.post(gemini_url, headers={"Content-Type": "application/json"}, json=payload, timeout=120)
+    resp = _gemini_session.post(gemini_url, headers={"Content-Type": "application/json"}, json=payload, timeout=GEMINI_EXTRACT_TIMEOUT)
     resp.raise_for_status()
     data = resp.json()
     
     try:
         gemini_text = data['candidates'][0]['content']['parts'][0]['text']
-        gemini_text = re.sub(r'```json\s*', '', gemini_text)
-        gemini_text = re.sub(r'```\s*', '', gemini_text)
-        return json.loads(gemini_text)
+        try:
+            return json.loads(gemini_text)
+        except json.JSONDecodeError:
+            # Model wrapped the JSON in markdown code fences
+            return json.loads(_FENCE_RE.sub('', gemini_text).strip())
     except Exception:
         return {"extracted_links": [], "error": "Failed to parse extraction response"}
 
-def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
-    """Background thread to poll Deep Research status and update database."""
-    import requests as req
+
+# Deep Research polling runs as coroutines on one background event loop: a run
+# spends almost all of its life waiting between polls, so each pending run is a
+# coroutine instead of a dedicated OS thread. Blocking HTTP and SQLite work is
+# handed to a small bounded executor.
+_deep_research_loop = None
+_deep_research_loop_lock = threading.Lock()
+_deep_research_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="deep-research")
+
+
+def _get_deep_research_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared Deep Research event loop, starting it on first use."""
+    global _deep_research_loop
+    with _deep_research_loop_lock:
+        if _deep_research_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="deep-research-loop", daemon=True).start()
+            _deep_research_loop = loop
+    return _deep_research_loop
+
+
+def schedule_deep_research_poll(run_id: str, interaction_id: str, api_key: str, user_id: str):
+    """Schedule polling of a Deep Research interaction on the shared event loop."""
+    return asyncio.run_coroutine_threadsafe(
+        poll_deep_research(run_id, interaction_id, api_key, user_id),
+        _get_deep_research_loop()
+    )
+
+
+def _execute_deep_research_update(sql: str, params: tuple):
+    """Run a single write statement against the database and commit."""
+    conn = get_db()
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+# Links served as PDFs: ".pdf" suffix, a "/pdf/" path segment, or "pdf?" query
+_PDF_LINK_RE = re.compile(r'\.pdf$|/pdf/|pdf\?', re.IGNORECASE)
+
+# Stored extracted_links BLOBs keep the link list as the last key, so a payload
+# that starts with it holds nothing else and the list can be sliced out and
+# served without a parse/serialize round-trip
+_EXTRACTED_LINKS_PREFIX = b'{"extracted_links":['
+
+
+def _encode_extracted_links(extracted_links: dict) -> bytes:
+    """Serialize extracted links for storage, with the link list as the last key."""
+    stored = {k: v for k, v in extracted_links.items() if k != "extracted_links"}
+    stored["extracted_links"] = extracted_links.get("extracted_links", [])
+    return orjson.dumps(stored)
+
+
+def _extracted_links_passthrough(raw) -> bytes | None:
+    """Return the serialized link list from a stored BLOB, or None if it must be parsed.
+    
+    Legacy TEXT rows and payloads carrying other keys (e.g. an extraction error)
+    return None so the caller falls back to parsing.
+    """
+    if isinstance(raw, bytes) and raw.startswith(_EXTRACTED_LINKS_PREFIX):
+        return raw[len(_EXTRACTED_LINKS_PREFIX) - 1:-1]
+    return None
+
+
+def _complete_deep_research_run(run_id: str, user_id: str, result_text: str, extracted_links: dict,
+                                logs: list, now: str, add_log):
+    """Persist a completed Deep Research run and create crawl jobs for its HTML links."""
+    conn = get_db()
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE deep_research_runs 
+        SET status = 'completed', result_text = ?, extracted_links = ?, 
+            logs = ?, completed_at = ?
+        WHERE id = ?
+    """, (
+        result_text or "",
+        _encode_extracted_links(extracted_links),
+        "\n".join(logs),
+        now,
+        run_id
+    ))
+    
+    # Auto-create crawl jobs for extracted links (HTML only - PDFs use Surya pipeline)
+    links_list = extracted_links.get("extracted_links", [])
+    if links_list and user_id:
+        html_count = 0
+        pdf_count = 0
+        for link_item in links_list:
+            link_url = link_item.get("url", "") if isinstance(link_item, dict) else str(link_item)
+            link_title = link_item.get("title", "") if isinstance(link_item, dict) else ""
+            if not link_url:
+                continue
+            
+            # Skip PDF links - they should use Surya server-side processing
+            if _PDF_LINK_RE.search(link_url):
+                pdf_count += 1
+                continue
+            
+            job_id = str(uuid.uuid4())
+            cur.execute("""
+                INSERT INTO crawl_jobs (id, deep_research_id, run_id, user_id, url, title, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, 'PENDING', ?)
+            """, (job_id, run_id, run_id, user_id, link_url, link_title, now))
+            html_count += 1
+        
+        add_log(f"Created {html_count} HTML crawl jobs (skipped {pdf_count} PDFs for Surya pipeline)", "SUCCESS")
+    
+    conn.commit()
+    analyze_crawl_jobs(conn)
+    conn.close()
+
+
+async def poll_deep_research(run_id: str, interaction_id: str, api_key: str, user_id: str):
+    """Poll Deep Research status on the shared event loop and update database."""
+    loop = asyncio.get_running_loop()
+    
+    def run_blocking(fn, *args):
+        return loop.run_in_executor(_deep_research_executor, fn, *args)
     
     max_wait = 3600  # 1 hour
-    poll_interval = 20
+    # Exponential backoff: short runs are noticed quickly, long runs are polled less
+    poll_interval = 5
+    max_poll_interval = 60
     start_time = time.time()
     logs = []
     
@@ -7331,16 +7796,16 @@ def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
     
     add_log(f"Starting polling for interaction {interaction_id}")
     
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("UPDATE deep_research_runs SET status = 'running', started_at = ? WHERE id = ?",
-                (datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), run_id))
-    conn.commit()
-    conn.close()
+    await run_blocking(
+        _execute_deep_research_update,
+        "UPDATE deep_research_runs SET status = 'running', started_at = ? WHERE id = ?",
+        (iso_now(), run_id)
+    )
     
     while time.time() - start_time < max_wait:
+        retry_after = 0
         try:
-            status = deep_research_status(interaction_id, api_key)
+            status = await run_blocking(deep_research_status, interaction_id, api_key)
             state = status.get("state", status.get("status", "UNKNOWN")).upper()
             add_log(f"Current state: {state}")
             
@@ -7372,6 +7837,7 @@ def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
                 
                 # Extract links - first check if API returned them directly
                 extracted_links = {"extracted_links": []}
+                seen_urls = set()
                 
                 # Check for groundingMetadata.sources from Gemini API
                 grounding = status.get("groundingMetadata", {})
@@ -7382,7 +7848,8 @@ def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
                         if isinstance(src, dict):
                             url = src.get("uri") or src.get("url") or src.get("link", "")
                             title = src.get("title") or src.get("name", "")
-                            if url:
+                            if url and url not in seen_urls:
+                                seen_urls.add(url)
                                 extracted_links["extracted_links"].append({
                                     "url": url,
                                     "title": title,
@@ -7397,7 +7864,8 @@ def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
                         if isinstance(cite, dict):
                             url = cite.get("uri") or cite.get("url") or cite.get("link", "")
                             title = cite.get("title") or cite.get("name", "")
-                            if url and url not in [l["url"] for l in extracted_links["extracted_links"]]:
+                            if url and url not in seen_urls:
+                                seen_urls.add(url)
                                 extracted_links["extracted_links"].append({
                                     "url": url,
                                     "title": title,
@@ -7408,7 +7876,7 @@ def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
                 if not extracted_links["extracted_links"] and result_text:
                     add_log(f"Extracting links from {len(result_text)} chars of report via Gemini")
                     try:
-                        gemini_links = extract_links_with_gemini(result_text, api_key)
+                        gemini_links = await run_blocking(extract_links_with_gemini, result_text, api_key)
                         extracted_links = gemini_links
                         link_count = len(extracted_links.get("extracted_links", []))
                         add_log(f"Extracted {link_count} links via Gemini", "SUCCESS")
@@ -7418,96 +7886,48 @@ def poll_deep_research(run_id: str, interaction_id: str, api_key: str):
                     add_log(f"Total links from API metadata: {len(extracted_links['extracted_links'])}", "SUCCESS")
                 
                 # Update database
-                conn = get_db()
-                cur = conn.cursor()
-                now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-                cur.execute("""
-                    UPDATE deep_research_runs 
-                    SET status = 'completed', result_text = ?, extracted_links = ?, 
-                        logs = ?, completed_at = ?
-                    WHERE id = ?
-                """, (
-                    result_text or "",
-                    json.dumps(extracted_links),
-                    "\n".join(logs),
-                    now,
-                    run_id
-                ))
-                
-                # Get user_id for this deep research run
-                cur.execute("SELECT user_id FROM deep_research_runs WHERE id = ?", (run_id,))
-                dr_row = cur.fetchone()
-                user_id = dr_row["user_id"] if dr_row else None
-                
-                # Auto-create crawl jobs for extracted links (HTML only - PDFs use Surya pipeline)
-                links_list = extracted_links.get("extracted_links", [])
-                if links_list and user_id:
-                    html_count = 0
-                    pdf_count = 0
-                    for link_item in links_list:
-                        link_url = link_item.get("url", "") if isinstance(link_item, dict) else str(link_item)
-                        link_title = link_item.get("title", "") if isinstance(link_item, dict) else ""
-                        if not link_url:
-                            continue
-                        
-                        # Skip PDF links - they should use Surya server-side processing
-                        url_lower = link_url.lower()
-                        if url_lower.endswith('.pdf') or '/pdf/' in url_lower or 'pdf?' in url_lower:
-                            pdf_count += 1
-                            continue
-                        
-                        job_id = str(uuid.uuid4())
-                        cur.execute("""
-                            INSERT INTO crawl_jobs (id, deep_research_id, run_id, user_id, url, title, status, created_at)
-                            VALUES (?, ?, ?, ?, ?, ?, 'PENDING', ?)
-                        """, (job_id, run_id, run_id, user_id, link_url, link_title, now))
-                        html_count += 1
-                    
-                    add_log(f"Created {html_count} HTML crawl jobs (skipped {pdf_count} PDFs for Surya pipeline)", "SUCCESS")
-                
-                conn.commit()
-                conn.close()
+                await run_blocking(
+                    _complete_deep_research_run,
+                    run_id, user_id, result_text, extracted_links, logs, iso_now(), add_log
+                )
                 return
             
-            elif state == "FAILED":
-                error_msg = status.get("error", "Unknown error")
+            elif state in ("FAILED", "CANCELLED"):
+                error_msg = status.get("error", "Unknown error" if state == "FAILED" else "Research was cancelled")
                 add_log(f"Research failed: {error_msg}", "ERROR")
                 
-                conn = get_db()
-                cur = conn.cursor()
-                cur.execute("""
+                await run_blocking(_execute_deep_research_update, """
                     UPDATE deep_research_runs 
                     SET status = 'failed', error = ?, logs = ?, completed_at = ?
                     WHERE id = ?
-                """, (error_msg, "\n".join(logs), datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), run_id))
-                conn.commit()
-                conn.close()
+                """, (error_msg, "\n".join(logs), iso_now(), run_id))
                 return
             
             # Update logs periodically
-            conn = get_db()
-            cur = conn.cursor()
-            cur.execute("UPDATE deep_research_runs SET logs = ? WHERE id = ?", ("\n".join(logs), run_id))
-            conn.commit()
-            conn.close()
+            await run_blocking(
+                _execute_deep_research_update,
+                "UPDATE deep_research_runs SET logs = ? WHERE id = ?",
+                ("\n".join(logs), run_id)
+            )
             
+        except requests.HTTPError as e:
+            add_log(f"Poll error: {e}", "ERROR")
+            retry_after_header = e.response.headers.get("Retry-After", "") if e.response is not None else ""
+            retry_after = int(retry_after_header) if retry_after_header.isdigit() else 0
         except Exception as e:
             add_log(f"Poll error: {e}", "ERROR")
         
-        time.sleep(poll_interval)
+        await asyncio.sleep(max(poll_interval, retry_after))
+        poll_interval = min(max_poll_interval, poll_interval * 2)
     
     # Timeout
     add_log("Timeout reached", "WARNING")
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("""
+    await run_blocking(_execute_deep_research_update, """
         UPDATE deep_research_runs 
         SET status = 'timeout', error = 'Research did not complete within timeout', 
             logs = ?, completed_at = ?
         WHERE id = ?
-    """, ("\n".join(logs), datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), run_id))
-    conn.commit()
-    conn.close()
+    """, ("\n".join(logs), iso_now(), run_id))
 
 
 @app.route("/deep-research", methods=["GET"])
@@ -7522,46 +7942,42 @@ def list_deep_research_runs():
     
     # Get user's runs if authenticated, otherwise all runs
     user_id = g.current_user["id"] if g.current_user else None
+    where_sql, params = ("WHERE user_id = ?", (user_id,)) if user_id else ("", ())
     
-    if user_id:
-        cur.execute("SELECT COUNT(*) FROM deep_research_runs WHERE user_id = ?", (user_id,))
-    else:
-        cur.execute("SELECT COUNT(*) FROM deep_research_runs")
-    total = cur.fetchone()[0]
-    
+    # Query truncation and the total count are computed by SQLite in the same pass
     offset = (page - 1) * page_size
-    if user_id:
-        cur.execute("""
-            SELECT id, name, status, interaction_id, query, created_at, started_at, completed_at, error
-            FROM deep_research_runs WHERE user_id = ?
-            ORDER BY created_at DESC LIMIT ? OFFSET ?
-        """, (user_id, page_size, offset))
-    else:
-        cur.execute("""
-            SELECT id, name, status, interaction_id, query, created_at, started_at, completed_at, error
-            FROM deep_research_runs
-            ORDER BY created_at DESC LIMIT ? OFFSET ?
-        """, (page_size, offset))
-    
+    cur.execute(f"""
+        SELECT id, name, status, interaction_id,
+               CASE WHEN length(query) > 200 THEN substr(query, 1, 200) || '...' ELSE query END AS query,
+               created_at, started_at, completed_at, error,
+               COUNT(*) OVER () AS total
+        FROM deep_research_runs {where_sql}
+        ORDER BY created_at DESC LIMIT ? OFFSET ?
+    """, (*params, page_size, offset))
     rows = cur.fetchall()
+    
+    if rows:
+        total = rows[0]["total"]
+    elif offset:
+        # Page past the end returns no rows to carry the window count
+        cur.execute(f"SELECT COUNT(*) FROM deep_research_runs {where_sql}", params)
+        total = cur.fetchone()[0]
+    else:
+        total = 0
     conn.close()
     
-    items = []
-    for row in rows:
-        items.append({
+    return _json_response({
+        "items": [{
             "id": row["id"],
             "name": row["name"],
             "status": row["status"],
             "interactionId": row["interaction_id"],
-            "query": row["query"][:200] + "..." if len(row["query"] or "") > 200 else row["query"],
+            "query": row["query"],
             "createdAt": row["created_at"],
             "startedAt": row["started_at"],
             "completedAt": row["completed_at"],
             "error": row["error"]
-        })
-    
-    return jsonify({
-        "items": items,
+        } for row in rows],
         "total": total,
         "page": page,
         "pageSize": page_size
@@ -7588,11 +8004,11 @@ def create_deep_research_run():
     
     data = request.json
     if not data:
-        return jsonify({"error": "Request body required"}), 400
+        return _json_response({"error": "Request body required"}, 400)
     
     query = data.get("query", "").strip()
     if not query:
-        return jsonify({"error": "Query is required"}), 400
+        return _json_response({"error": "Query is required"}, 400)
     
     name = data.get("name", "Deep Research Run").strip()
     search_config = data.get("searchConfig", {})
@@ -7600,7 +8016,7 @@ def create_deep_research_run():
     # Get API key - check user config first, then global, then env
     api_key = get_gemini_api_key(user_id)
     if not api_key:
-        return jsonify({"error": "GEMINI_API_KEY not configured. Set it in Config > API Keys."}), 400
+        return _json_response({"error": "GEMINI_API_KEY not configured. Set it in Config > API Keys."}, 400)
     
     # Build system context wrapper
     target_count = search_config.get("target_source_count", "a comprehensive list")
@@ -7631,7 +8047,7 @@ def create_deep_research_run():
     """
     
     run_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     user_id = g.current_user["id"] if g.current_user else None
     
     try:
@@ -7640,7 +8056,7 @@ def create_deep_research_run():
         interaction_id = result.get("id", "")
         
         if not interaction_id:
-            return jsonify({"error": "Failed to start research - no interaction ID received"}), 500
+            return _json_response({"error": "Failed to start research - no interaction ID received"}, 500)
         
         # Save to database
         conn = get_db()
@@ -7649,31 +8065,26 @@ def create_deep_research_run():
             INSERT INTO deep_research_runs 
             (id, name, status, interaction_id, query, search_config, created_at, user_id)
             VALUES (?, ?, 'pending', ?, ?, ?, ?, ?)
-        """, (run_id, name, interaction_id, query, json.dumps(search_config), now, user_id))
+        """, (run_id, name, interaction_id, query, orjson.dumps(search_config).decode(), now, user_id))
         conn.commit()
         conn.close()
         
-        # Start background polling thread
-        poll_thread = threading.Thread(
-            target=poll_deep_research,
-            args=(run_id, interaction_id, api_key),
-            daemon=True
-        )
-        poll_thread.start()
+        # Schedule polling on the shared Deep Research event loop
+        schedule_deep_research_poll(run_id, interaction_id, api_key, user_id)
         
         log_message(f"Deep Research started: {name}", "INFO")
         
-        return jsonify({
+        return _json_response({
             "id": run_id,
             "name": name,
             "status": "pending",
             "interactionId": interaction_id,
             "createdAt": now
-        }), 201
+        }, 201)
         
     except Exception as e:
         log_message(f"Deep Research creation failed: {e}", "ERROR")
-        return jsonify({"error": f"Failed to start research: {str(e)}"}), 500
+        return _json_response({"error": f"Failed to start research: {str(e)}"}, 500)
 
 
 @app.route("/deep-research/<run_id>", methods=["GET"])
@@ -7687,7 +8098,7 @@ def get_deep_research_run(run_id):
     conn.close()
     
     if not row:
-        return jsonify({"error": "Deep Research run not found"}), 404
+        return _json_response({"error": "Deep Research run not found"}, 404)
     
     result = {
         "id": row["id"],
@@ -7695,9 +8106,9 @@ def get_deep_research_run(run_id):
         "status": row["status"],
         "interactionId": row["interaction_id"],
         "query": row["query"],
-        "searchConfig": json.loads(row["search_config"]) if row["search_config"] else {},
+        "searchConfig": orjson.loads(row["search_config"]) if row["search_config"] else {},
         "resultText": row["result_text"],
-        "extractedLinks": json.loads(row["extracted_links"]) if row["extracted_links"] else {},
+        "extractedLinks": orjson.Fragment(row["extracted_links"]) if row["extracted_links"] else {},
         "logs": row["logs"],
         "createdAt": row["created_at"],
         "startedAt": row["started_at"],
@@ -7705,7 +8116,7 @@ def get_deep_research_run(run_id):
         "error": row["error"]
     }
     
-    return jsonify(result)
+    return _json_response(result)
 
 
 @app.route("/deep-research/<run_id>/links", methods=["GET"])
@@ -7719,13 +8130,19 @@ def get_deep_research_links(run_id):
     
     if not row:
         conn.close()
-        return jsonify({"error": "Deep Research run not found"}), 404
+        return _json_response({"error": "Deep Research run not found"}, 404)
     
     if row["status"] != "completed":
         conn.close()
-        return jsonify({"error": f"Research not completed. Status: {row['status']}"}), 400
+        return _json_response({"error": f"Research not completed. Status: {row['status']}"}, 400)
+    
+    # Serve the stored list bytes as-is when the payload is in canonical form
+    links_bytes = _extracted_links_passthrough(row["extracted_links"])
+    if links_bytes is not None and links_bytes != b"[]":
+        conn.close()
+        return Response(b'{"extractedLinks":' + links_bytes + b"}", mimetype="application/json")
     
-    links_data = json.loads(row["extracted_links"]) if row["extracted_links"] else {}
+    links_data = orjson.loads(row["extracted_links"]) if row["extracted_links"] else {}
     
     # Handle multiple possible structures
     links_list = []
@@ -7746,7 +8163,7 @@ def get_deep_research_links(run_id):
             links_list = [{"url": r["url"], "title": r["title"] or "", "relevance_score": 70} for r in job_rows]
     
     conn.close()
-    return jsonify({"extractedLinks": links_list})
+    return _json_response({"extractedLinks": links_list})
 
 
 @app.route("/deep-research/<run_id>/report", methods=["GET"])
@@ -7760,12 +8177,12 @@ def get_deep_research_report(run_id):
     conn.close()
     
     if not row:
-        return jsonify({"error": "Deep Research run not found"}), 404
+        return _json_response({"error": "Deep Research run not found"}, 404)
     
     if row["status"] != "completed":
-        return jsonify({"error": f"Research not completed. Status: {row['status']}"}), 400
+        return _json_response({"error": f"Research not completed. Status: {row['status']}"}, 400)
     
-    return jsonify({
+    return _json_response({
         "name": row["name"],
         "report": row["result_text"]
     })
@@ -7782,9 +8199,9 @@ def get_deep_research_logs(run_id):
     conn.close()
     
     if not row:
-        return jsonify({"error": "Deep Research run not found"}), 404
+        return _json_response({"error": "Deep Research run not found"}, 404)
     
-    return jsonify({
+    return _json_response({
         "status": row["status"],
         "logs": row["logs"] or ""
     })
@@ -7802,7 +8219,7 @@ def delete_deep_research_run(run_id):
     conn.close()
     
     if deleted == 0:
-        return jsonify({"error": "Deep Research run not found"}), 404
+        return _json_response({"error": "Deep Research run not found"}, 404)
     
     log_message(f"Deep Research run deleted: {run_id}", "INFO")
     return "", 204
@@ -7813,6 +8230,53 @@ def delete_deep_research_run(run_id):
 # ============================================================================
 
 CLAIM_EXPIRY_SECONDS = 600  # 10 minutes
+DEFAULT_MAX_CLAIM_AGE_SECONDS = 300
+CLAIM_SWEEP_INTERVAL_SECONDS = 60
+
+def _claim_expiry_threshold(max_claim_age: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(seconds=max_claim_age)).strftime(ISO_UTC_FORMAT)
+
+def _claim_sweep_loop():
+    """Periodically return stale CLAIMED jobs to PENDING so polls don't have to write."""
+    conn = get_db()
+    while True:
+        time.sleep(CLAIM_SWEEP_INTERVAL_SECONDS)
+        try:
+            conn.execute("""
+                UPDATE crawl_jobs 
+                SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, attempts = attempts + 1
+                WHERE status = 'CLAIMED' AND claimed_at < ?
+            """, (_claim_expiry_threshold(DEFAULT_MAX_CLAIM_AGE_SECONDS),))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"[CRAWL] Claim expiry sweep failed: {e}")
+
+threading.Thread(target=_claim_sweep_loop, name="claim-sweep", daemon=True).start()
+
+_CRAWL_JOB_JSON = """json_object(
+    'id', id, 'jobId', id, 'deepResearchId', deep_research_id, 'runId', run_id,
+    'run_id', run_id, 'url', url, 'title', title, 'status', status, 'attempts', attempts,
+    'createdAt', created_at, 'completedAt', completed_at, 'error', error
+)"""
+
+def _crawl_jobs_page(cur, where: str, params: list):
+    """Build a page of crawl jobs as a JSON array inside SQLite.
+    
+    Returns (jobs_json, count, last_created_at, last_id); the last two feed the keyset cursor.
+    """
+    cur.execute(f"""
+        SELECT jobs, json_array_length(jobs), json_extract(jobs, '$[#-1].createdAt'), json_extract(jobs, '$[#-1].id')
+        FROM (
+            SELECT json_group_array({_CRAWL_JOB_JSON}) AS jobs
+            FROM (
+                SELECT id, deep_research_id, run_id, url, title, status, attempts, created_at, completed_at, error
+                FROM crawl_jobs WHERE {where}
+                ORDER BY created_at ASC, id ASC LIMIT ?
+            )
+        )
+    """, params)
+    return tuple(cur.fetchone())
 
 @app.route("/crawl/jobs", methods=["GET"])
 @require_auth
@@ -7826,127 +8290,144 @@ def list_crawl_jobs():
     - includeScripts: if '1', include domain scripts in response
     - scriptsEtag: etag for scripts cache
     - since: ISO timestamp for incremental script sync
+    - cursor: opaque nextCursor from a previous page (keyset on created_at, id)
     """
     user_id = g.current_user["id"]
     limit = min(int(request.args.get("limit", 10)), 50)
+    cursor = request.args.get("cursor")
+    cursor_key = None
+    if cursor:
+        try:
+            cursor_created, cursor_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+            cursor_key = (cursor_created, cursor_id)
+        except Exception:
+            return jsonify({"error": "Invalid cursor"}), 400
     mode = request.args.get("mode", "peek")
-    max_claim_age = int(request.args.get("maxClaimAgeSec", 300))
+    max_claim_age = int(request.args.get("maxClaimAgeSec", DEFAULT_MAX_CLAIM_AGE_SECONDS))
     include_scripts = request.args.get("includeScripts") == "1"
     deep_research_id = request.args.get("deepResearchId")
     status_filter = request.args.get("status")
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
     
-    # Reset expired claims back to PENDING (only when not filtering by deepResearchId)
+    # Reset expired claims back to PENDING (only when not filtering by deepResearchId).
+    # The background sweep handles the default age; probe on a reader and only take the writer when something expired.
     if not deep_research_id:
-        expiry_threshold = (datetime.now(timezone.utc) - timedelta(seconds=max_claim_age)).isoformat().replace("+00:00", "Z")
-        cur.execute("""
-            UPDATE crawl_jobs 
-            SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, attempts = attempts + 1
-            WHERE user_id = ? AND status = 'CLAIMED' AND claimed_at < ?
-        """, (user_id, expiry_threshold))
-        conn.commit()
+        expiry_threshold = _claim_expiry_threshold(max_claim_age)
+        with borrow_conn(readonly=True) as conn:
+            expired = conn.execute("""
+                SELECT 1 FROM crawl_jobs
+                WHERE user_id = ? AND status = 'CLAIMED' AND claimed_at < ? LIMIT 1
+            """, (user_id, expiry_threshold)).fetchone()
+        if expired:
+            with borrow_conn() as conn:
+                conn.execute("""
+                    UPDATE crawl_jobs 
+                    SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, attempts = attempts + 1
+                    WHERE user_id = ? AND status = 'CLAIMED' AND claimed_at < ?
+                """, (user_id, expiry_threshold))
+                conn.commit()
     
-    # Build query based on filters
-    query = """
-        SELECT id, deep_research_id, run_id, url, title, status, attempts, created_at, completed_at, error
-        FROM crawl_jobs 
-        WHERE user_id = ?
-    """
+    # Build candidate filter shared by peek and claim
+    where = "user_id = ?"
     params = [user_id]
     
     if deep_research_id:
-        query += " AND deep_research_id = ?"
+        where += " AND deep_research_id = ?"
         params.append(deep_research_id)
     
     if status_filter:
-        query += " AND status = ?"
+        where += " AND status = ?"
         params.append(status_filter)
     elif not deep_research_id:
-        query += " AND status = 'PENDING'"
+        where += " AND status = 'PENDING'"
     
-    query += " ORDER BY created_at ASC LIMIT ?"
-    params.append(limit)
+    if cursor_key:
+        where += " AND (created_at, id) > (?, ?)"
+        params.extend(cursor_key)
     
-    cur.execute(query, params)
-    rows = cur.fetchall()
+    order_limit = "ORDER BY created_at ASC, id ASC LIMIT ?"
     
-    jobs = []
-    for row in rows:
-        job = {
-            "id": row["id"],
-            "jobId": row["id"],
-            "deepResearchId": row["deep_research_id"],
-            "runId": row["run_id"],
-            "run_id": row["run_id"],  # Also include snake_case for extension compatibility
-            "url": row["url"],
-            "title": row["title"],
-            "status": row["status"],
-            "attempts": row["attempts"],
-            "createdAt": row["created_at"],
-            "completedAt": row["completed_at"],
-            "error": row["error"]
-        }
-        jobs.append(job)
-    
-    # Auto-claim if mode=claim
-    if mode == "claim" and jobs:
-        job_ids = [j["jobId"] for j in jobs]
-        claim_expires = (datetime.now(timezone.utc) + timedelta(seconds=CLAIM_EXPIRY_SECONDS)).isoformat().replace("+00:00", "Z")
-        placeholders = ",".join(["?" for _ in job_ids])
-        cur.execute(f"""
-            UPDATE crawl_jobs 
-            SET status = 'CLAIMED', claimed_at = ?, claim_expires_at = ?
-            WHERE id IN ({placeholders})
-        """, [now, claim_expires] + job_ids)
-
-        # Update corresponding sources status
-        try:
-            cur.execute(f"UPDATE sources SET status = 'PROCESSING', updated_at = ? WHERE id IN ({placeholders})", [now] + job_ids)
-        except Exception:
-            pass
-        conn.commit()
-        for job in jobs:
-            job["status"] = "CLAIMED"
+    if mode == "claim" and limit > 0:
+        # Claim in one statement so concurrent pollers can't grab the same jobs
+        claim_expires = (datetime.now(timezone.utc) + timedelta(seconds=CLAIM_EXPIRY_SECONDS)).strftime(ISO_UTC_FORMAT)
+        with borrow_conn() as conn, conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            cur.execute(f"""
+                UPDATE crawl_jobs
+                SET status = 'CLAIMED', claimed_at = ?, claim_expires_at = ?
+                WHERE id IN (SELECT id FROM crawl_jobs WHERE {where} {order_limit})
+                RETURNING id
+            """, [now, claim_expires] + params + [limit])
+            claimed_ids = json.dumps([r[0] for r in cur.fetchall()])
+            
+            # Update corresponding sources status
+            if HAS_SOURCES_TABLE:
+                cur.execute("""
+                    UPDATE sources SET status = 'PROCESSING', updated_at = ?
+                    WHERE id IN (SELECT value FROM json_each(?))
+                """, (now, claimed_ids))
+            
+            jobs_json, job_count, last_created, last_id = _crawl_jobs_page(
+                cur, "id IN (SELECT value FROM json_each(?))", [claimed_ids, limit]
+            )
+    else:
+        with borrow_conn(readonly=True) as conn:
+            jobs_json, job_count, last_created, last_id = _crawl_jobs_page(conn.cursor(), where, params + [limit])
+    
+    next_cursor = None
+    if job_count and job_count == limit:
+        next_cursor = base64.urlsafe_b64encode(f"{last_created}|{last_id}".encode()).decode()
     
     # Get domain scripts if requested
     scripts = []
     scripts_etag = None
+    scripts_not_modified = False
     if include_scripts:
-        since = request.args.get("since", "0000-01-01T00:00:00Z")
-        cur.execute("""
-            SELECT id, domain, script, condition, wait_before_ms, wait_after_ms, created_at, updated_at
-            FROM domain_scripts
-            WHERE (user_id IS NULL OR user_id = ?) AND updated_at > ?
-            ORDER BY domain
-        """, (user_id, since))
-        script_rows = cur.fetchall()
-        for sr in script_rows:
-            scripts.append({
-                "domain": sr["domain"],
-                "script": sr["script"],
-                "condition": sr["condition"],
-                "waitBeforeMs": sr["wait_before_ms"],
-                "waitAfterMs": sr["wait_after_ms"],
-                "hash": sr["id"],
-                "createdAt": sr["created_at"],
-                "updatedAt": sr["updated_at"]
-            })
-        # Simple etag based on count and latest update
-        if scripts:
-            scripts_etag = f"{len(scripts)}-{scripts[-1]['updatedAt']}"
-    
-    conn.close()
+        with borrow_conn(readonly=True) as conn:
+            cur = conn.cursor()
+            # Cheap etag over the visible script set; skip the full fetch when the client is current
+            cur.execute("""
+                SELECT COUNT(*), MAX(updated_at) FROM domain_scripts
+                WHERE user_id IS NULL OR user_id = ?
+            """, (user_id,))
+            script_count, latest_update = cur.fetchone()
+            if script_count:
+                scripts_etag = f"{script_count}-{latest_update}"
+            # Only the explicit query arg counts: browsers attach If-None-Match on their own (even on a cache-empty full sync)
+            client_etag = request.args.get("scriptsEtag")
+            scripts_not_modified = scripts_etag is not None and client_etag == scripts_etag
+            
+            if not scripts_not_modified:
+                since = request.args.get("since", "0000-01-01T00:00:00Z")
+                cur.execute("""
+                    SELECT id, domain, script, condition, wait_before_ms, wait_after_ms, created_at, updated_at
+                    FROM domain_scripts
+                    WHERE (user_id IS NULL OR user_id = ?) AND updated_at > ?
+                    ORDER BY domain
+                """, (user_id, since))
+                for (sid, domain, script, condition, wait_before, wait_after, created, updated) in cur.fetchall():
+                    scripts.append({
+                        "domain": domain,
+                        "script": script,
+                        "condition": condition,
+                        "waitBeforeMs": wait_before,
+                        "waitAfterMs": wait_after,
+                        "hash": sid,
+                        "createdAt": created,
+                        "updatedAt": updated
+                    })
     
-    response = {"jobs": jobs}
+    response = {"jobs": orjson.Fragment(jobs_json), "nextCursor": next_cursor}
     if include_scripts:
         response["scripts"] = scripts
         if scripts_etag:
             response["scriptsEtag"] = scripts_etag
+        if scripts_not_modified:
+            response["scriptsNotModified"] = True
     
-    return jsonify(response)
+    return _json_response(response)
 
 
 @app.route("/crawl/claim", methods=["POST"])
@@ -7960,34 +8441,30 @@ def claim_crawl_job():
     if not job_id:
         return jsonify({"error": "jobId required"}), 400
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    claim_expires = (datetime.now(timezone.utc) + timedelta(seconds=CLAIM_EXPIRY_SECONDS)).isoformat().replace("+00:00", "Z")
-    
-    # Only claim if PENDING and belongs to user
-    cur.execute("""
-        UPDATE crawl_jobs 
-        SET status = 'CLAIMED', claimed_at = ?, claim_expires_at = ?
-        WHERE id = ? AND user_id = ? AND status = 'PENDING'
-    """, (now, claim_expires, job_id, user_id))
-
-    try:
-        cur.execute("UPDATE sources SET status = 'PROCESSING', updated_at = ? WHERE id = ?", (now, job_id))
-    except Exception:
-        pass
-    
-    if cur.rowcount == 0:
-        # Check if already claimed or doesn't exist
-        cur.execute("SELECT status FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
-        row = cur.fetchone()
-        conn.close()
-        if not row:
-            return jsonify({"error": "Job not found", "status": "NOT_FOUND"}), 404
-        return jsonify({"status": row["status"], "message": "Job not in PENDING state"})
-    
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        now = iso_now()
+        claim_expires = (datetime.now(timezone.utc) + timedelta(seconds=CLAIM_EXPIRY_SECONDS)).strftime(ISO_UTC_FORMAT)
+        
+        with conn:
+            # Only claim if PENDING and belongs to user
+            cur.execute("""
+                UPDATE crawl_jobs 
+                SET status = 'CLAIMED', claimed_at = ?, claim_expires_at = ?
+                WHERE id = ? AND user_id = ? AND status = 'PENDING'
+            """, (now, claim_expires, job_id, user_id))
+            claimed = cur.rowcount > 0
+            
+            if claimed and HAS_SOURCES_TABLE:
+                cur.execute("UPDATE sources SET status = 'PROCESSING', updated_at = ? WHERE id = ?", (now, job_id))
+        
+        if not claimed:
+            # Check if already claimed or doesn't exist
+            cur.execute("SELECT status FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
+            row = cur.fetchone()
+            if not row:
+                return jsonify({"error": "Job not found", "status": "NOT_FOUND"}), 404
+            return jsonify({"status": row["status"], "message": "Job not in PENDING state"})
     
     return jsonify({"status": "CLAIMED", "jobId": job_id})
 
@@ -7998,14 +8475,13 @@ def get_crawl_job_status(job_id):
     """Get status of a specific crawl job."""
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT id, status, attempts, error, claimed_at, completed_at
-        FROM crawl_jobs WHERE id = ? AND user_id = ?
-    """, (job_id, user_id))
-    row = cur.fetchone()
-    conn.close()
+    with borrow_conn(readonly=True) as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT id, status, attempts, error, claimed_at, completed_at
+            FROM crawl_jobs WHERE id = ? AND user_id = ?
+        """, (job_id, user_id))
+        row = cur.fetchone()
     
     if not row:
         return jsonify({"error": "Job not found"}), 404
@@ -8026,26 +8502,21 @@ def reset_crawl_job(job_id):
     """Reset a failed or stuck job back to PENDING."""
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("""
-        UPDATE crawl_jobs 
-        SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, error = NULL
-        WHERE id = ? AND user_id = ? AND status IN ('CLAIMED', 'FAILED')
-    """, (job_id, user_id))
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            UPDATE crawl_jobs 
+            SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, error = NULL
+            WHERE id = ? AND user_id = ? AND status IN ('CLAIMED', 'FAILED')
+        """, (job_id, user_id))
+        
+        if cur.rowcount == 0:
+            return jsonify({"error": "Job not found or not resettable"}), 404
 
-    try:
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        cur.execute("UPDATE sources SET status = 'PENDING', error = NULL, updated_at = ? WHERE id = ?", (now, job_id))
-    except Exception:
-        pass
-    
-    if cur.rowcount == 0:
-        conn.close()
-        return jsonify({"error": "Job not found or not resettable"}), 404
-    
-    conn.commit()
-    conn.close()
+        if HAS_SOURCES_TABLE:
+            cur.execute("UPDATE sources SET status = 'PENDING', error = NULL, updated_at = ? WHERE id = ?", (iso_now(), job_id))
+        
+        conn.commit()
     
     return jsonify({"status": "PENDING", "jobId": job_id})
 
@@ -8058,28 +8529,24 @@ def fail_crawl_job(job_id):
     data = request.json or {}
     error = data.get("error", "Unknown error")
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    
-    cur.execute("""
-        UPDATE crawl_jobs 
-        SET status = 'FAILED', error = ?, completed_at = ?
-        WHERE id = ? AND user_id = ?
-    """, (error[:500], now, job_id, user_id))
-    
-    # Also update the corresponding source
-    try:
-        cur.execute("UPDATE sources SET status = 'FAILED', error = ?, updated_at = ? WHERE id = ?", (error[:500], now, job_id))
-    except Exception:
-        pass
-    
-    if cur.rowcount == 0:
-        conn.close()
-        return jsonify({"error": "Job not found"}), 404
-    
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        now = iso_now()
+        
+        cur.execute("""
+            UPDATE crawl_jobs 
+            SET status = 'FAILED', error = ?, completed_at = ?
+            WHERE id = ? AND user_id = ?
+        """, (error[:500], now, job_id, user_id))
+        
+        if cur.rowcount == 0:
+            return jsonify({"error": "Job not found"}), 404
+        
+        # Also update the corresponding source
+        if HAS_SOURCES_TABLE:
+            cur.execute("UPDATE sources SET status = 'FAILED', error = ?, updated_at = ? WHERE id = ?", (error[:500], now, job_id))
+        
+        conn.commit()
     
     log_message(f"Crawl job {job_id} marked as FAILED: {error[:100]}", "WARN")
     
@@ -8094,39 +8561,37 @@ def reset_all_crawl_jobs():
     data = request.json or {}
     deep_research_id = data.get("deepResearchId")
     
-    conn = get_db()
-    cur = conn.cursor()
-    
-    if deep_research_id:
-        cur.execute("""
-            UPDATE crawl_jobs 
-            SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, error = NULL
-            WHERE user_id = ? AND deep_research_id = ? AND status IN ('CLAIMED', 'FAILED')
-        """, (user_id, deep_research_id))
-    else:
-        cur.execute("""
-            UPDATE crawl_jobs 
-            SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, error = NULL
-            WHERE user_id = ? AND status IN ('CLAIMED', 'FAILED')
-        """, (user_id,))
-    
-    reset_count = cur.rowcount
-
-    try:
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        
         if deep_research_id:
-            cur.execute("SELECT id FROM crawl_jobs WHERE user_id = ? AND deep_research_id = ?", (user_id, deep_research_id))
-            ids = [r["id"] for r in cur.fetchall()]
+            cur.execute("""
+                UPDATE crawl_jobs 
+                SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, error = NULL
+                WHERE user_id = ? AND deep_research_id = ? AND status IN ('CLAIMED', 'FAILED')
+            """, (user_id, deep_research_id))
         else:
-            cur.execute("SELECT id FROM crawl_jobs WHERE user_id = ?", (user_id,))
-            ids = [r["id"] for r in cur.fetchall()]
-        if ids:
-            placeholders = ",".join(["?" for _ in ids])
-            cur.execute(f"UPDATE sources SET status = 'PENDING', error = NULL, updated_at = ? WHERE id IN ({placeholders})", [now] + ids)
-    except Exception:
-        pass
-    conn.commit()
-    conn.close()
+            cur.execute("""
+                UPDATE crawl_jobs 
+                SET status = 'PENDING', claimed_at = NULL, claim_expires_at = NULL, error = NULL
+                WHERE user_id = ? AND status IN ('CLAIMED', 'FAILED')
+            """, (user_id,))
+        
+        reset_count = cur.rowcount
+
+        if HAS_SOURCES_TABLE:
+            now = iso_now()
+            if deep_research_id:
+                cur.execute("""
+                    UPDATE sources SET status = 'PENDING', error = NULL, updated_at = ?
+                    WHERE id IN (SELECT id FROM crawl_jobs WHERE user_id = ? AND deep_research_id = ?)
+                """, (now, user_id, deep_research_id))
+            else:
+                cur.execute("""
+                    UPDATE sources SET status = 'PENDING', error = NULL, updated_at = ?
+                    WHERE id IN (SELECT id FROM crawl_jobs WHERE user_id = ?)
+                """, (now, user_id))
+        conn.commit()
     
     return jsonify({"status": "ok", "resetCount": reset_count})
 
@@ -8141,38 +8606,33 @@ def skip_crawling(run_id):
     """
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    
-    # Verify run belongs to user
-    cur.execute("SELECT id, status FROM runs WHERE id = ? AND user_id = ?", (run_id, user_id))
-    run = cur.fetchone()
-    if not run:
-        conn.close()
-        return jsonify({"error": "Run not found"}), 404
-    
-    # Mark all pending crawl jobs as SKIPPED
-    cur.execute("""
-        UPDATE crawl_jobs 
-        SET status = 'SKIPPED', completed_at = ?, error = 'Skipped by user'
-        WHERE run_id = ? AND user_id = ? AND status IN ('PENDING', 'CLAIMED', 'PDF_PENDING')
-    """, (now, run_id, user_id))
-    skipped_jobs = cur.rowcount
-    
-    # Update corresponding sources to SKIPPED
-    cur.execute("""
-        UPDATE sources 
-        SET status = 'SKIPPED', error = 'Skipped by user', updated_at = ?
-        WHERE run_id = ? AND status IN ('PENDING', 'PDF_PENDING')
-    """, (now, run_id))
-    skipped_sources = cur.rowcount
-    
-    # Update run status to 'waiting' (ready for extraction)
-    cur.execute("UPDATE runs SET status = 'waiting' WHERE id = ?", (run_id,))
-    
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        now = iso_now()
+        
+        with conn:
+            cur.execute("BEGIN IMMEDIATE")
+            
+            # Update run status to 'waiting' (ready for extraction); doubles as the ownership check
+            cur.execute("UPDATE runs SET status = 'waiting' WHERE id = ? AND user_id = ?", (run_id, user_id))
+            if cur.rowcount == 0:
+                return jsonify({"error": "Run not found"}), 404
+            
+            # Mark all pending crawl jobs as SKIPPED
+            cur.execute("""
+                UPDATE crawl_jobs 
+                SET status = 'SKIPPED', completed_at = ?, error = 'Skipped by user'
+                WHERE run_id = ? AND user_id = ? AND status IN ('PENDING', 'CLAIMED', 'PDF_PENDING')
+            """, (now, run_id, user_id))
+            skipped_jobs = cur.rowcount
+            
+            # Update corresponding sources to SKIPPED
+            cur.execute("""
+                UPDATE sources 
+                SET status = 'SKIPPED', error = 'Skipped by user', updated_at = ?
+                WHERE run_id = ? AND status IN ('PENDING', 'PDF_PENDING')
+            """, (now, run_id))
+            skipped_sources = cur.rowcount
     
     log_message(f"Crawling skipped: {skipped_jobs} jobs, {skipped_sources} sources marked as SKIPPED", "INFO", run_id)
     
@@ -8190,34 +8650,24 @@ def get_queue_stats():
     """Get crawl job queue statistics for the user."""
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        SELECT 
-            COUNT(*) as total,
-            SUM(CASE WHEN status = 'PENDING' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN status = 'CLAIMED' THEN 1 ELSE 0 END) as claimed,
-            SUM(CASE WHEN status = 'DONE' THEN 1 ELSE 0 END) as done,
-            SUM(CASE WHEN status = 'FAILED' THEN 1 ELSE 0 END) as failed,
-            SUM(CASE WHEN status = 'SKIPPED' THEN 1 ELSE 0 END) as skipped,
-            SUM(CASE WHEN status = 'PDF_PENDING' THEN 1 ELSE 0 END) as pdf_pending
-        FROM crawl_jobs 
-        WHERE user_id = ?
-    """, (user_id,))
-    
-    row = cur.fetchone()
-    conn.close()
+    with borrow_conn(readonly=True) as conn:
+        cur = conn.cursor()
+        
+        cur.execute("""
+            SELECT json_object(
+                'total', COALESCE(SUM(n), 0),
+                'pending', COALESCE(SUM(CASE WHEN status = 'PENDING' THEN n END), 0),
+                'claimed', COALESCE(SUM(CASE WHEN status = 'CLAIMED' THEN n END), 0),
+                'done', COALESCE(SUM(CASE WHEN status = 'DONE' THEN n END), 0),
+                'failed', COALESCE(SUM(CASE WHEN status = 'FAILED' THEN n END), 0),
+                'skipped', COALESCE(SUM(CASE WHEN status = 'SKIPPED' THEN n END), 0),
+                'pdfPending', COALESCE(SUM(CASE WHEN status = 'PDF_PENDING' THEN n END), 0)
+            )
+            FROM crawl_job_counts WHERE user_id = ?
+        """, (user_id,))
+        stats_json = cur.fetchone()[0]
     
-    return jsonify({
-        "total": row["total"] or 0,
-        "pending": row["pending"] or 0,
-        "claimed": row["claimed"] or 0,
-        "done": row["done"] or 0,
-        "failed": row["failed"] or 0,
-        "skipped": row["skipped"] or 0,
-        "pdfPending": row["pdf_pending"] or 0
-    })
+    return Response(stats_json, mimetype="application/json")
 
 
 @app.route("/crawl/queue/clear", methods=["POST"])
@@ -8234,32 +8684,30 @@ def clear_queue():
     status_filter = data.get("status")
     clear_all = data.get("clearAll", False)
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    
-    if clear_all:
-        # Delete all jobs for user
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        now = iso_now()
+        
+        if clear_all:
+            # Delete all jobs for user
+            cur.execute("SELECT COUNT(*) FROM crawl_jobs WHERE user_id = ?", (user_id,))
+            total = cur.fetchone()[0]
+            cur.execute("DELETE FROM crawl_jobs WHERE user_id = ?", (user_id,))
+            cleared = cur.rowcount
+        elif status_filter:
+            # Delete jobs with specific status
+            cur.execute("SELECT COUNT(*) FROM crawl_jobs WHERE user_id = ? AND status = ?", (user_id, status_filter))
+            total = cur.fetchone()[0]
+            cur.execute("DELETE FROM crawl_jobs WHERE user_id = ? AND status = ?", (user_id, status_filter))
+            cleared = cur.rowcount
+        else:
+            return jsonify({"error": "Specify 'status' or 'clearAll'"}), 400
+        
+        # Get remaining count
         cur.execute("SELECT COUNT(*) FROM crawl_jobs WHERE user_id = ?", (user_id,))
-        total = cur.fetchone()[0]
-        cur.execute("DELETE FROM crawl_jobs WHERE user_id = ?", (user_id,))
-        cleared = cur.rowcount
-    elif status_filter:
-        # Delete jobs with specific status
-        cur.execute("SELECT COUNT(*) FROM crawl_jobs WHERE user_id = ? AND status = ?", (user_id, status_filter))
-        total = cur.fetchone()[0]
-        cur.execute("DELETE FROM crawl_jobs WHERE user_id = ? AND status = ?", (user_id, status_filter))
-        cleared = cur.rowcount
-    else:
-        conn.close()
-        return jsonify({"error": "Specify 'status' or 'clearAll'"}), 400
-    
-    # Get remaining count
-    cur.execute("SELECT COUNT(*) FROM crawl_jobs WHERE user_id = ?", (user_id,))
-    remaining = cur.fetchone()[0]
-    
-    conn.commit()
-    conn.close()
+        remaining = cur.fetchone()[0]
+        
+        conn.commit()
     
     return jsonify({
         "cleared": cleared,
@@ -8273,18 +8721,17 @@ def fix_crawl_job_run_ids():
     """Fix crawl jobs that have null run_id by copying from deep_research_id."""
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        UPDATE crawl_jobs 
-        SET run_id = deep_research_id
-        WHERE user_id = ? AND run_id IS NULL AND deep_research_id IS NOT NULL
-    """, (user_id,))
-    
-    fixed_count = cur.rowcount
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        
+        cur.execute("""
+            UPDATE crawl_jobs 
+            SET run_id = deep_research_id
+            WHERE user_id = ? AND run_id IS NULL AND deep_research_id IS NOT NULL
+        """, (user_id,))
+        
+        fixed_count = cur.rowcount
+        conn.commit()
     
     return jsonify({"status": "ok", "fixedCount": fixed_count})
 
@@ -8296,93 +8743,228 @@ def purge_pdf_crawl_jobs():
     user_id = g.current_user["id"]
     deep_research_id = request.json.get("deepResearchId") if request.json else None
     
-    conn = get_db()
-    cur = conn.cursor()
-    
-    # Find and delete PDF jobs
-    if deep_research_id:
-        cur.execute("""
-            DELETE FROM crawl_jobs 
-            WHERE user_id = ? AND deep_research_id = ? AND (
-                LOWER(url) LIKE '%.pdf' OR 
-                LOWER(url) LIKE '%/pdf/%' OR 
-                LOWER(url) LIKE '%pdf?%'
-            )
-        """, (user_id, deep_research_id))
-    else:
-        cur.execute("""
-            DELETE FROM crawl_jobs 
-            WHERE user_id = ? AND (
-                LOWER(url) LIKE '%.pdf' OR 
-                LOWER(url) LIKE '%/pdf/%' OR 
-                LOWER(url) LIKE '%pdf?%'
-            )
-        """, (user_id,))
-    
-    deleted_count = cur.rowcount
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        
+        scope = "user_id = ?"
+        params = [user_id]
+        if deep_research_id:
+            scope += " AND deep_research_id = ?"
+            params.append(deep_research_id)
+        
+        # Find and delete PDF jobs
+        if HAS_CRAWL_JOBS_IS_PDF:
+            cur.execute(f"DELETE FROM crawl_jobs WHERE {scope} AND is_pdf = 1", params)
+            deleted_count = cur.rowcount
+        else:
+            # No generated column on this SQLite: sniff URLs in Python, lowercasing once per row
+            cur.execute(f"SELECT id, url FROM crawl_jobs WHERE {scope}", params)
+            pdf_ids = [
+                (jid,) for jid, url in cur.fetchall()
+                if (u := (url or "").lower()).endswith(".pdf") or "/pdf/" in u or "pdf?" in u
+            ]
+            cur.executemany("DELETE FROM crawl_jobs WHERE id = ?", pdf_ids)
+            deleted_count = len(pdf_ids)
+        
+        conn.commit()
     
     return jsonify({"status": "ok", "deletedCount": deleted_count})
 
 
-def process_pdf_jobs_for_run(run_id: str, user_id: str):
-    """Background task to download and process all PDF_PENDING jobs for a run.
-    
-    Downloads PDFs directly from URLs, processes via Surya for text extraction,
-    and creates source entries. This runs in a background thread.
+PDF_DOWNLOAD_WORKERS = 8
+# Surya conversions allowed at once across all PDF workers and request handlers
+PDF_CONVERT_CONCURRENCY = 2
+_pdf_convert_slots = threading.BoundedSemaphore(PDF_CONVERT_CONCURRENCY)
+SMALL_PDF_BYTES = 1 << 20
+
+_NETLOC_RE = re.compile(r"^[a-z][a-z0-9+.-]*://([^/?#]+)", re.I)
+
+def _url_domain(url: str) -> str:
+    """Return the netloc of an absolute URL, or '' if it has none."""
+    m = _NETLOC_RE.match(url or "")
+    return m.group(1) if m else ""
+
+def _uuid7() -> str:
+    """Time-ordered UUIDv7 (RFC 9562): 48-bit ms timestamp then random bits, so new ids append to the PK index."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+# Directories this process has already created; saves a stat+mkdir per PDF on the ingestion paths
+_known_dirs = set()
+
+def _ensure_dir(path: str) -> str:
+    """os.makedirs(path, exist_ok=True) once per process; returns path."""
+    if path not in _known_dirs:
+        os.makedirs(path, exist_ok=True)
+        _known_dirs.add(path)
+    return path
+
+_pdf_session = requests.Session()
+_pdf_session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+# Up to PDF_WORKER_COUNT runs download at once, each with PDF_DOWNLOAD_WORKERS threads sharing this pool
+for _scheme in ("http://", "https://"):
+    _pdf_session.mount(_scheme, HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+
+
+def _stream_response_to_file(response, path: str) -> int:
+    """Copy a streamed response body to disk in 1 MiB chunks; returns the bytes written.
+    
+    The body goes to a .part file that is preallocated from Content-Length when known, synced once,
+    and renamed into place, so a crash mid-download never leaves a truncated PDF under the real name.
     """
-    import requests
-    from urllib.parse import urlparse
-    
-    conn = None
+    response.raw.decode_content = True
+    tmp_path = path + ".part"
     try:
-        conn = get_db()
+        with response, open(tmp_path, 'wb') as f:
+            # With a Content-Encoding the decoded size differs from the header, so it can't be trusted
+            content_length = response.headers.get("Content-Length", "")
+            expected = int(content_length) if content_length.isdigit() and not response.headers.get("Content-Encoding") else None
+            if expected is not None and expected < SMALL_PDF_BYTES:
+                # Small body: one read and one write, nothing worth preallocating
+                f.write(response.raw.read())
+            else:
+                if expected and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, expected)
+                    except OSError:
+                        pass  # filesystem without fallocate support; plain writes still work
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
+                f.truncate()
+            size = f.tell()
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return size
+
+
+def _save_upload(file_storage, path: str) -> int:
+    """Write an uploaded file to disk without FileStorage.save()'s Python copy loop; returns the bytes written.
+    
+    Werkzeug spools uploads into a SpooledTemporaryFile: small bodies are still a BytesIO and go out
+    in one write of its buffer, larger ones already sit in a temp file and are copied fd-to-fd with sendfile
+    (Linux only; Windows and macOS fall back to a 1 MiB copyfileobj).
+    """
+    src = file_storage.stream
+    spooled = getattr(src, "_file", src)
+    with open(path, 'wb') as f:
+        if hasattr(spooled, "getbuffer"):
+            with spooled.getbuffer() as buf:
+                f.write(buf)
+            return f.tell()
+        src.flush()
+        src.seek(0)
+        if hasattr(os, "sendfile"):
+            src_fd, dst_fd = src.fileno(), f.fileno()
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return offset
+            except OSError:
+                # e.g. macOS only sends to sockets; nothing was written yet on that path
+                if offset:
+                    raise
+        shutil.copyfileobj(src, f, length=1 << 20)
+        return f.tell()
+
+
+def _download_pdf_job(job, run_id: str):
+    """Download one PDF_PENDING job into the run's pdfs folder; returns (pdf_id, pdf_filename, pdf_path, pdf_size, downloaded_at)."""
+    job_id, url, title = job
+    log_message(f"Downloading PDF: {url[:100]}...", "INFO", run_id)
+    
+    response = _pdf_session.get(url, timeout=60, stream=True)
+    response.raise_for_status()
+    
+    # Save PDF to run uploads folder
+    pdf_id = _uuid7()
+    pdf_filename = f"{pdf_id}.pdf"
+    pdfs_dir = _ensure_dir(os.path.join(UPLOAD_FOLDER, run_id, "pdfs"))
+    pdf_path = os.path.join(pdfs_dir, pdf_filename)
+    
+    pdf_size = _stream_response_to_file(response, pdf_path)
+    log_message(f"PDF downloaded: {pdf_size} bytes", "SUCCESS", run_id)
+    return pdf_id, pdf_filename, pdf_path, pdf_size, iso_now()
+
+
+def _fail_pdf_job(job, run_id: str, error: Exception):
+    """Mark a PDF job and its source FAILED."""
+    job_id, url, _ = job
+    error_msg = str(error)
+    log_message(f"PDF download failed for {url[:100]}: {error_msg}", "ERROR", run_id)
+    
+    now = iso_now()
+    with borrow_conn() as conn:
         cur = conn.cursor()
-        
-        # Get all PDF_PENDING jobs for this run
         cur.execute("""
-            SELECT id, url, title FROM crawl_jobs 
-            WHERE run_id = ? AND user_id = ? AND status = 'PDF_PENDING'
-        """, (run_id, user_id))
-        
-        pdf_jobs = cur.fetchall()
-        
-        if not pdf_jobs:
-            log_message("No PDF jobs to process", "INFO", run_id)
-            return
-        
-        log_message(f"Processing {len(pdf_jobs)} PDF job(s)", "INFO", run_id)
-        
-        for job in pdf_jobs:
-            job_id = job["id"]
-            url = job["url"]
-            title = job["title"] or "PDF Document"
+            UPDATE crawl_jobs 
+            SET status = 'FAILED', completed_at = ?, error = ?
+            WHERE id = ?
+        """, (now, error_msg[:500], job_id))
+
+        if HAS_SOURCES_TABLE:
+            cur.execute("UPDATE sources SET status = 'FAILED', error = ?, updated_at = ? WHERE id = ?", (error_msg[:500], now, job_id))
+        conn.commit()
+
+
+def _process_pdf_job(job, run_id: str, download):
+    """Extract text from a downloaded PDF job via Surya, then register the file and update job and source."""
+    job_id, url, title = job
+    pdf_id, pdf_filename, pdf_path, pdf_size, now = download
+    domain = _url_domain(url)
+    title = title or "PDF Document"
+    
+    try:
+        # Process PDF via Surya to extract text
+        html_content = None
+        try:
+            from pdf_converter import convert_pdf_to_text
             
-            try:
-                log_message(f"Downloading PDF: {url[:100]}...", "INFO", run_id)
-                
-                # Download PDF
-                response = requests.get(url, timeout=60, stream=True, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
-                response.raise_for_status()
-                
-                # Save PDF to run uploads folder
-                pdf_id = str(uuid.uuid4())
-                pdf_filename = f"{pdf_id}.pdf"
-                run_upload_dir = os.path.join(UPLOAD_FOLDER, run_id)
-                pdfs_dir = os.path.join(run_upload_dir, "pdfs")
-                os.makedirs(pdfs_dir, exist_ok=True)
-                pdf_path = os.path.join(pdfs_dir, pdf_filename)
-                
-                with open(pdf_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                pdf_size = os.path.getsize(pdf_path)
-                now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-                
+            log_message(f"Processing PDF via Surya: {pdf_path}", "INFO", run_id)
+            with _pdf_convert_slots:
+                pdf_text = convert_pdf_to_text(pdf_path, use_cache=True)
+            
+            if pdf_text and len(pdf_text.strip()) > 100:
+                # Wrap text in basic HTML structure
+                html_content = f"""<!DOCTYPE html>
+<html>
+<head><title>{title}</title></head>
+<body>
+<source>
+<h1>{title}</h1>
+<div class="pdf-content">
+{pdf_text}
+</div>
+</source>
+</body>
+</html>"""
+                log_message(f"PDF processed via Surya: {len(pdf_text)} chars extracted", "SUCCESS", run_id)
+            else:
+                log_message(f"PDF processing yielded insufficient content", "WARN", run_id)
+        except Exception as e:
+            log_message(f"PDF Surya processing failed: {str(e)}", "ERROR", run_id)
+        
+        # File row, job status and extracted source go out in one commit once extraction is done
+        with borrow_conn() as conn:
+            with conn:
+                cur = conn.cursor()
+                cur.execute("BEGIN IMMEDIATE")
                 # Register file (use file_type='pdf' so download works via /files/<id>/download)
                 cur.execute("""
                     INSERT INTO files (id, filename, original_name, mime_type, size_bytes, file_type, run_id, created_at)
@@ -8396,77 +8978,135 @@ def process_pdf_jobs_for_run(run_id: str, user_id: str):
                     WHERE id = ?
                 """, (pdf_path, now, job_id))
                 
-                conn.commit()
-                
-                log_message(f"PDF downloaded: {pdf_size} bytes", "SUCCESS", run_id)
-                
-                # Process PDF via Surya to extract text
-                source_id = None
-                try:
-                    from pdf_converter import convert_pdf_to_text
-                    
-                    log_message(f"Processing PDF via Surya: {pdf_path}", "INFO", run_id)
-                    pdf_text = convert_pdf_to_text(pdf_path, use_cache=True)
-                    
-                    if pdf_text and len(pdf_text.strip()) > 100:
-                        source_id = str(uuid.uuid4())
-                        domain = ""
-                        try:
-                            domain = urlparse(url).netloc
-                        except:
-                            pass
-                        
-                        # Wrap text in basic HTML structure
-                        html_content = f"""<!DOCTYPE html>
-<html>
-<head><title>{title}</title></head>
-<body>
-<source>
-<h1>{title}</h1>
-<div class="pdf-content">
-{pdf_text}
-</div>
-</source>
-</body>
-</html>"""
-                        
-                        # Update existing source row created at input time
-                        cur.execute(
-                            """
-                            UPDATE sources
-                            SET domain = ?, title = ?, html_content = ?, pdf_file_id = ?, source_type = 'pdf', content_type = 'pdf', status = 'READY', error = NULL, updated_at = ?
-                            WHERE id = ?
-                            """,
-                            (domain, title, html_content, pdf_id, now, job_id),
-                        )
-                        conn.commit()
-                        
-                        log_message(f"PDF processed via Surya: {len(pdf_text)} chars extracted", "SUCCESS", run_id)
-                    else:
-                        log_message(f"PDF processing yielded insufficient content", "WARN", run_id)
-                except Exception as e:
-                    log_message(f"PDF Surya processing failed: {str(e)}", "ERROR", run_id)
+                if html_content:
+                    # Update existing source row created at input time
+                    cur.execute(
+                        """
+                        UPDATE sources
+                        SET domain = ?, title = ?, html_content = ?, pdf_file_id = ?, source_type = 'pdf', content_type = 'pdf', status = 'READY', error = NULL, updated_at = ?
+                        WHERE id = ?
+                        """,
+                        (domain, title, html_content, pdf_id, now, job_id),
+                    )
+        
+    except Exception as e:
+        _fail_pdf_job(job, run_id, e)
+
+
+def _download_submitted_pdf(job_id: str, pdf_url: str, run_id: str, user_id: str, title: str):
+    """Download a PDF submitted by the extension and attach it to its job and source."""
+    try:
+        log_message(f"Downloading PDF: {pdf_url[:100]}...", "INFO", run_id)
+        
+        response = _pdf_session.get(pdf_url, timeout=120, stream=True)
+        response.raise_for_status()
+        
+        # Save PDF
+        pdf_id = _uuid7()
+        pdf_filename = f"{pdf_id}.pdf"
+        pdfs_dir = _ensure_dir(os.path.join(UPLOAD_FOLDER, run_id, "pdfs"))
+        pdf_path = os.path.join(pdfs_dir, pdf_filename)
+        
+        pdf_size = _stream_response_to_file(response, pdf_path)
+        dl_now = iso_now()
+        
+        with borrow_conn() as conn:
+            with conn:
+                cur = conn.cursor()
+                cur.execute("BEGIN IMMEDIATE")
+                # Register file
+                cur.execute("""
+                    INSERT INTO files (id, filename, original_name, mime_type, size_bytes, file_type, run_id, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (pdf_id, pdf_filename, title + ".pdf", "application/pdf", pdf_size, "pdf", run_id, dl_now))
                 
-            except Exception as e:
-                error_msg = str(e)
-                log_message(f"PDF download failed for {url[:100]}: {error_msg}", "ERROR", run_id)
+                # Update job status
+                cur.execute("""
+                    UPDATE crawl_jobs 
+                    SET status = 'DONE', pdf_path = ?, completed_at = ?, error = NULL
+                    WHERE id = ?
+                """, (pdf_path, dl_now, job_id))
                 
-                # Mark job as failed
-                now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+                # Update source with PDF file reference
                 cur.execute("""
-                    UPDATE crawl_jobs 
-                    SET status = 'FAILED', completed_at = ?, error = ?
+                    UPDATE sources
+                    SET pdf_file_id = ?, status = 'READY', updated_at = ?
                     WHERE id = ?
-                """, (now, error_msg[:500], job_id))
+                """, (pdf_id, dl_now, job_id))
+                
+                # Check if all jobs complete
+                check_and_update_run_crawl_status(conn, run_id, user_id)
+            log_message(f"PDF downloaded: {pdf_size} bytes", "SUCCESS", run_id)
+        
+    except Exception as e:
+        log_message(f"PDF download failed: {str(e)}", "ERROR", run_id)
+        with borrow_conn() as conn:
+            conn.execute("UPDATE crawl_jobs SET status = 'FAILED', error = ? WHERE id = ?", (str(e), job_id))
+            conn.execute("UPDATE sources SET status = 'FAILED', error = ? WHERE id = ?", (str(e), job_id))
+            conn.commit()
+
+
+PDF_WORKER_COUNT = 4
+PDF_WORK_QUEUE = queue.Queue(maxsize=1000)
+
+def _pdf_worker_loop():
+    """Run queued PDF tasks one at a time; a fixed set of these bounds PDF concurrency."""
+    while True:
+        fn, args = PDF_WORK_QUEUE.get()
+        try:
+            fn(*args)
+        except Exception as e:
+            print(f"[PDF] Worker task {getattr(fn, '__name__', fn)} failed: {e}")
+        finally:
+            PDF_WORK_QUEUE.task_done()
+
+for _i in range(PDF_WORKER_COUNT):
+    threading.Thread(target=_pdf_worker_loop, name=f"pdf-worker-{_i}", daemon=True).start()
 
+
+def process_pdf_jobs_for_run(run_id: str, user_id: str):
+    """Background task to download and process all PDF_PENDING jobs for a run.
+    
+    Downloads PDFs directly from URLs, processes via Surya for text extraction,
+    and creates source entries. This runs in a background thread; downloads
+    share a pooled session and run concurrently, while conversions are capped
+    by PDF_CONVERT_CONCURRENCY across all runs. Commits per job.
+    """
+    conn = None
+    try:
+        conn = get_db()
+        cur = conn.cursor()
+        
+        # Get all PDF_PENDING jobs for this run
+        cur.execute("""
+            SELECT id, url, title FROM crawl_jobs 
+            WHERE run_id = ? AND user_id = ? AND status = 'PDF_PENDING'
+        """, (run_id, user_id))
+        
+        pdf_jobs = cur.fetchall()
+        
+        if not pdf_jobs:
+            log_message("No PDF jobs to process", "INFO", run_id)
+            return
+        
+        log_message(f"Processing {len(pdf_jobs)} PDF job(s)", "INFO", run_id)
+        
+        # The pool only downloads; each finished download is converted here under the
+        # process-wide conversion semaphore, so Surya load does not scale with the pool.
+        with ThreadPoolExecutor(max_workers=PDF_DOWNLOAD_WORKERS) as ex:
+            futures = {ex.submit(_download_pdf_job, job, run_id): job for job in pdf_jobs}
+            for future in as_completed(futures):
+                job = futures[future]
                 try:
-                    cur.execute("UPDATE sources SET status = 'FAILED', error = ?, updated_at = ? WHERE id = ?", (error_msg[:500], now, job_id))
-                except Exception:
-                    pass
-                conn.commit()
+                    download = future.result()
+                except Exception as e:
+                    _fail_pdf_job(job, run_id, e)
+                    continue
+                _process_pdf_job(job, run_id, download)
         
         # Check if all jobs complete (HTML + PDF)
         check_and_update_run_crawl_status(conn, run_id, user_id)
+        conn.commit()
         
         log_message(f"PDF processing complete for run", "SUCCESS", run_id)
         
@@ -8480,112 +9120,106 @@ def process_pdf_jobs_for_run(run_id: str, user_id: str):
 def check_and_update_run_crawl_status(conn, run_id, user_id):
     """Check if all crawl jobs for a run are complete and update run status.
     
-    When all HTML crawl jobs are DONE, updates run status from 'crawling' to 'waiting'.
-    This signals that the run is ready for extraction to start.
+    When no HTML or PDF crawl job is still pending, moves the run from 'crawling'
+    to 'waiting' with a single conditional UPDATE. This signals that the run is
+    ready for extraction to start. Runs inside the caller's transaction; the
+    caller commits.
     """
     if not run_id:
         return
     
     cur = conn.cursor()
     
-    # Get run info
-    cur.execute("SELECT status, source_type FROM runs WHERE id = ?", (run_id,))
-    run = cur.fetchone()
-    
-    if not run or run["status"] != "crawling":
-        return
-    
-    # Count all job statuses - PDFs are now processed server-side
+    # PDFs are processed server-side, so PDF_PENDING means still downloading
     cur.execute("""
-        SELECT 
-            COUNT(*) as total,
-            SUM(CASE WHEN status IN ('PENDING', 'CLAIMED') THEN 1 ELSE 0 END) as html_pending,
-            SUM(CASE WHEN status = 'PDF_PENDING' THEN 1 ELSE 0 END) as pdf_pending,
-            SUM(CASE WHEN status = 'DONE' THEN 1 ELSE 0 END) as done,
-            SUM(CASE WHEN status = 'FAILED' THEN 1 ELSE 0 END) as failed
-        FROM crawl_jobs 
-        WHERE run_id = ? AND user_id = ?
-    """, (run_id, user_id))
-    
-    counts = cur.fetchone()
-    total = counts["total"] or 0
-    html_pending = counts["html_pending"] or 0
-    pdf_pending = counts["pdf_pending"] or 0
-    done = counts["done"] or 0
-    failed = counts["failed"] or 0
-    
-    # All jobs complete when no HTML pending AND no PDF pending
-    # (PDFs are processed server-side, so PDF_PENDING means still downloading)
-    if html_pending == 0 and pdf_pending == 0 and total > 0:
-        # Update run status to 'waiting' (ready for extraction)
-        cur.execute("UPDATE runs SET status = 'waiting' WHERE id = ?", (run_id,))
-        conn.commit()
-        log_message(f"All crawl jobs complete ({done} done, {failed} failed). Run ready for extraction.", "SUCCESS", run_id)
+        UPDATE runs SET status = 'waiting'
+        WHERE id = ? AND status = 'crawling'
+          AND EXISTS (SELECT 1 FROM crawl_jobs WHERE run_id = ? AND user_id = ?)
+          AND NOT EXISTS (
+              SELECT 1 FROM crawl_jobs
+              WHERE run_id = ? AND user_id = ? AND status IN ('PENDING', 'CLAIMED', 'PDF_PENDING')
+          )
+    """, (run_id, run_id, user_id, run_id, user_id))
+    
+    if cur.rowcount:
+        cur.execute("""
+            SELECT 
+                SUM(CASE WHEN status = 'DONE' THEN 1 ELSE 0 END) as done,
+                SUM(CASE WHEN status = 'FAILED' THEN 1 ELSE 0 END) as failed
+            FROM crawl_jobs 
+            WHERE run_id = ? AND user_id = ?
+        """, (run_id, user_id))
+        done, failed = cur.fetchone()
+        log_message(f"All crawl jobs complete ({done or 0} done, {failed or 0} failed). Run ready for extraction.", "SUCCESS", run_id)
 
 
 @app.route("/crawl/result", methods=["POST"])
 @require_auth
 def submit_crawl_result():
-    """Receive crawled HTML from extension."""
+    """Receive crawled HTML from extension.
+    
+    Accepts either JSON {jobId, html} or a gzip-compressed HTML body
+    (Content-Encoding: gzip) with the job id in the X-Job-Id header.
+    The crawl_jobs copy is stored gzip-compressed.
+    """
     user_id = g.current_user["id"]
-    data = request.json or {}
-    job_id = data.get("jobId")
-    html = data.get("html", "")
+    if request.content_encoding == "gzip":
+        job_id = request.headers.get("X-Job-Id")
+        html_gz = request.get_data(cache=False)
+        try:
+            html = gzip.decompress(html_gz).decode("utf-8", errors="replace")
+        except (OSError, EOFError) as e:
+            return jsonify({"error": f"Invalid gzip body: {e}"}), 400
+    else:
+        data = request.json or {}
+        job_id = data.get("jobId")
+        html = data.get("html", "")
+        html_gz = gzip.compress(html.encode("utf-8"), compresslevel=1)
     
     if not job_id:
         return jsonify({"error": "jobId required"}), 400
     
-    conn = None
     try:
-        conn = get_db()
-        cur = conn.cursor()
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        
-        # Verify job belongs to user and is claimed
-        cur.execute("SELECT id, url, deep_research_id, run_id FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
-        job = cur.fetchone()
-        
-        if not job:
-            return jsonify({"error": "Job not found"}), 404
-        
-        # Update job with result
-        cur.execute("""
-            UPDATE crawl_jobs 
-            SET status = 'DONE', html = ?, completed_at = ?, error = NULL
-            WHERE id = ?
-        """, (html, now, job_id))
-        
-        domain = ""
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(job["url"]).netloc
-        except:
-            pass
+        with borrow_conn() as conn:
+            cur = conn.cursor()
+            now = iso_now()
+            
+            # Verify job belongs to user and is claimed
+            cur.execute("SELECT id, url, deep_research_id, run_id FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
+            job = cur.fetchone()
+            
+            if not job:
+                return jsonify({"error": "Job not found"}), 404
+            
+            domain = _url_domain(job["url"])
+            
+            # Job result, source content and run completion commit together
+            with conn:
+                cur.execute("""
+                    UPDATE crawl_jobs 
+                    SET status = 'DONE', html = ?, html_encoding = 'gzip', completed_at = ?, error = NULL
+                    WHERE id = ?
+                """, (sqlite3.Binary(html_gz), now, job_id))
 
-        # Update existing source row created at input time
-        cur.execute(
-            """
-            UPDATE sources
-            SET domain = ?, html_content = ?, source_type = 'link', content_type = 'html', status = 'READY', error = NULL, updated_at = ?
-            WHERE id = ?
-            """,
-            (domain, html, now, job_id),
-        )
-        
-        conn.commit()
-        
-        log_message(f"Crawl result received for job {job_id}, {len(html)} bytes", "INFO")
-        
-        # Check if all crawl jobs for this run are complete
-        check_and_update_run_crawl_status(conn, job["run_id"], user_id)
-        
-        return jsonify({"status": "DONE", "jobId": job_id, "sourceId": job_id})
+                # Update existing source row created at input time
+                cur.execute(
+                    """
+                    UPDATE sources
+                    SET domain = ?, html_content = ?, source_type = 'link', content_type = 'html', status = 'READY', error = NULL, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (domain, html, now, job_id),
+                )
+                
+                # Check if all crawl jobs for this run are complete
+                check_and_update_run_crawl_status(conn, job["run_id"], user_id)
+            
+            log_message(f"Crawl result received for job {job_id}, {len(html)} bytes", "INFO")
+            
+            return jsonify({"status": "DONE", "jobId": job_id, "sourceId": job_id})
     except Exception as e:
         log_message(f"Error in submit_crawl_result: {str(e)}", "ERROR")
         return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
 
 
 @app.route("/crawl/result/pdf", methods=["POST"])
@@ -8606,117 +9240,50 @@ def submit_crawl_result_pdf():
     if not pdf_url:
         return jsonify({"error": "url required"}), 400
     
-    conn = None
     try:
-        conn = get_db()
-        cur = conn.cursor()
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        
-        # Verify job belongs to user
-        cur.execute("SELECT id, url, run_id, title FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
-        job = cur.fetchone()
-        
-        if not job:
-            return jsonify({"error": "Job not found"}), 404
-        
-        run_id = job["run_id"]
-        title = job["title"] or "PDF Document"
-        
-        # Mark job as PDF_PENDING for server-side download
-        cur.execute("""
-            UPDATE crawl_jobs 
-            SET status = 'PDF_PENDING', url = ?
-            WHERE id = ?
-        """, (pdf_url, job_id))
-        
-        # Update source to PDF type
-        cur.execute("""
-            UPDATE sources
-            SET source_type = 'pdf', status = 'PDF_PENDING', url = ?, updated_at = ?
-            WHERE id = ?
-        """, (pdf_url, now, job_id))
-        
-        conn.commit()
-        
-        log_message(f"PDF URL received for job {job_id}: {pdf_url[:100]}...", "INFO", run_id)
-        
-        # Start background download for this single PDF
-        def download_single_pdf():
-            import requests as req
-            conn2 = None
+        with borrow_conn() as conn:
+            cur = conn.cursor()
+            now = iso_now()
+            
+            # Verify job belongs to user
+            cur.execute("SELECT id, url, run_id, title FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
+            job = cur.fetchone()
+            
+            if not job:
+                return jsonify({"error": "Job not found"}), 404
+            
+            run_id = job["run_id"]
+            title = job["title"] or "PDF Document"
+            
+            # Mark job as PDF_PENDING for server-side download
+            cur.execute("""
+                UPDATE crawl_jobs 
+                SET status = 'PDF_PENDING', url = ?
+                WHERE id = ?
+            """, (pdf_url, job_id))
+            
+            # Update source to PDF type
+            cur.execute("""
+                UPDATE sources
+                SET source_type = 'pdf', status = 'PDF_PENDING', url = ?, updated_at = ?
+                WHERE id = ?
+            """, (pdf_url, now, job_id))
+            
+            conn.commit()
+            
+            log_message(f"PDF URL received for job {job_id}: {pdf_url[:100]}...", "INFO", run_id)
+            
+            # Hand the download to the bounded PDF worker pool
             try:
-                conn2 = get_db()
-                cur2 = conn2.cursor()
-                
-                log_message(f"Downloading PDF: {pdf_url[:100]}...", "INFO", run_id)
-                
-                response = req.get(pdf_url, timeout=120, stream=True, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
-                response.raise_for_status()
-                
-                # Save PDF
-                pdf_id = str(uuid.uuid4())
-                pdf_filename = f"{pdf_id}.pdf"
-                run_upload_dir = os.path.join(UPLOAD_FOLDER, run_id)
-                pdfs_dir = os.path.join(run_upload_dir, "pdfs")
-                os.makedirs(pdfs_dir, exist_ok=True)
-                pdf_path = os.path.join(pdfs_dir, pdf_filename)
-                
-                with open(pdf_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                pdf_size = os.path.getsize(pdf_path)
-                dl_now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-                
-                # Register file
-                cur2.execute("""
-                    INSERT INTO files (id, filename, original_name, mime_type, size_bytes, file_type, run_id, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (pdf_id, pdf_filename, title + ".pdf", "application/pdf", pdf_size, "pdf", run_id, dl_now))
-                
-                # Update job status
-                cur2.execute("""
-                    UPDATE crawl_jobs 
-                    SET status = 'DONE', pdf_path = ?, completed_at = ?, error = NULL
-                    WHERE id = ?
-                """, (pdf_path, dl_now, job_id))
-                
-                # Update source with PDF file reference
-                cur2.execute("""
-                    UPDATE sources
-                    SET pdf_file_id = ?, status = 'READY', updated_at = ?
-                    WHERE id = ?
-                """, (pdf_id, dl_now, job_id))
-                
-                conn2.commit()
-                log_message(f"PDF downloaded: {pdf_size} bytes", "SUCCESS", run_id)
-                
-                # Check if all jobs complete
-                check_and_update_run_crawl_status(conn2, run_id, user_id)
-                
-            except Exception as e:
-                log_message(f"PDF download failed: {str(e)}", "ERROR", run_id)
-                if conn2:
-                    cur2 = conn2.cursor()
-                    cur2.execute("UPDATE crawl_jobs SET status = 'FAILED', error = ? WHERE id = ?", (str(e), job_id))
-                    cur2.execute("UPDATE sources SET status = 'FAILED', error = ? WHERE id = ?", (str(e), job_id))
-                    conn2.commit()
-            finally:
-                if conn2:
-                    conn2.close()
-        
-        import threading
-        threading.Thread(target=download_single_pdf, daemon=True).start()
-        
-        return jsonify({"status": "PDF_PENDING", "jobId": job_id, "message": "PDF download started"})
+                PDF_WORK_QUEUE.put((_download_submitted_pdf, (job_id, pdf_url, run_id, user_id, title)), timeout=5)
+            except queue.Full:
+                log_message(f"PDF work queue full; job {job_id} left as PDF_PENDING", "WARN", run_id)
+                return jsonify({"error": "PDF work queue is full, retry later", "jobId": job_id}), 503
+            
+            return jsonify({"status": "PDF_PENDING", "jobId": job_id, "message": "PDF download started"})
     except Exception as e:
         log_message(f"Error in submit_crawl_result_pdf: {str(e)}", "ERROR")
         return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
 
 
 @app.route("/crawl/result/pdf-binary", methods=["POST"])
@@ -8742,15 +9309,14 @@ def submit_crawl_result_pdf_binary():
     
     pdf_file = request.files["pdfFile"]
     
-    conn = None
     try:
-        conn = get_db()
-        cur = conn.cursor()
-        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        now = iso_now()
         
         # Verify job belongs to user
-        cur.execute("SELECT id, url, run_id, title FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id))
-        job = cur.fetchone()
+        with borrow_conn(readonly=True) as conn:
+            job = conn.execute(
+                "SELECT id, url, run_id, title FROM crawl_jobs WHERE id = ? AND user_id = ?", (job_id, user_id)
+            ).fetchone()
         
         if not job:
             return jsonify({"error": "Job not found"}), 404
@@ -8759,53 +9325,52 @@ def submit_crawl_result_pdf_binary():
         title = job["title"] or "PDF Document"
         original_url = pdf_url or job["url"]
         
-        log_message(f"Receiving PDF binary for job {job_id} ({len(pdf_file.read())} bytes)", "INFO", run_id)
-        pdf_file.seek(0)  # Reset after reading length
+        # Size is logged once saved; multipart parts rarely carry their own Content-Length
+        log_message(f"Receiving PDF binary for job {job_id}", "INFO", run_id)
         
         # Save PDF
-        pdf_id = str(uuid.uuid4())
+        pdf_id = _uuid7()
         pdf_filename = f"{pdf_id}.pdf"
-        run_upload_dir = os.path.join(UPLOAD_FOLDER, run_id)
-        pdfs_dir = os.path.join(run_upload_dir, "pdfs")
-        os.makedirs(pdfs_dir, exist_ok=True)
+        pdfs_dir = _ensure_dir(os.path.join(UPLOAD_FOLDER, run_id, "pdfs"))
         pdf_path = os.path.join(pdfs_dir, pdf_filename)
         
-        pdf_file.save(pdf_path)
-        pdf_size = os.path.getsize(pdf_path)
-        
-        # Register file
-        cur.execute("""
-            INSERT INTO files (id, filename, original_name, mime_type, size_bytes, file_type, run_id, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (pdf_id, pdf_filename, title + ".pdf", "application/pdf", pdf_size, "pdf", run_id, now))
-        
-        # Update job status to DONE
-        cur.execute("""
-            UPDATE crawl_jobs 
-            SET status = 'DONE', pdf_path = ?, completed_at = ?, error = NULL
-            WHERE id = ?
-        """, (pdf_path, now, job_id))
+        pdf_size = _save_upload(pdf_file, pdf_path)
         
-        # Update source with PDF file reference
-        cur.execute("""
-            UPDATE sources
-            SET pdf_file_id = ?, source_type = 'pdf', status = 'READY', url = ?, updated_at = ?
-            WHERE id = ?
-        """, (pdf_id, original_url, now, job_id))
+        # Only hold the writer for the DB updates, not while the upload is written to disk;
+        # the three writes and the run completion check share one IMMEDIATE transaction
+        with borrow_conn() as conn:
+            with conn:
+                cur = conn.cursor()
+                cur.execute("BEGIN IMMEDIATE")
+                # Register file
+                cur.execute("""
+                    INSERT INTO files (id, filename, original_name, mime_type, size_bytes, file_type, run_id, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (pdf_id, pdf_filename, title + ".pdf", "application/pdf", pdf_size, "pdf", run_id, now))
+                
+                # Update job status to DONE
+                cur.execute("""
+                    UPDATE crawl_jobs 
+                    SET status = 'DONE', pdf_path = ?, completed_at = ?, error = NULL
+                    WHERE id = ? AND user_id = ?
+                """, (pdf_path, now, job_id, user_id))
+                
+                # Update source with PDF file reference
+                cur.execute("""
+                    UPDATE sources
+                    SET pdf_file_id = ?, source_type = 'pdf', status = 'READY', url = ?, updated_at = ?
+                    WHERE id = ?
+                """, (pdf_id, original_url, now, job_id))
+                
+                # Check if all jobs complete
+                check_and_update_run_crawl_status(conn, run_id, user_id)
         
-        conn.commit()
         log_message(f"PDF received and saved: {pdf_size} bytes from extension", "SUCCESS", run_id)
         
-        # Check if all jobs complete
-        check_and_update_run_crawl_status(conn, run_id, user_id)
-        
         return jsonify({"status": "DONE", "jobId": job_id, "fileId": pdf_id, "size": pdf_size})
     except Exception as e:
         log_message(f"Error in submit_crawl_result_pdf_binary: {str(e)}", "ERROR")
         return jsonify({"error": str(e)}), 500
-    finally:
-        if conn:
-            conn.close()
 
 
 @app.route("/runs/<run_id>/logs/append", methods=["POST"])
@@ -8818,25 +9383,27 @@ def append_run_logs(run_id):
     if not entries:
         return jsonify({"status": "ok", "appended": 0})
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    now = iso_now()
+    rows = [
+        (
+            now,
+            entry.get("level", "INFO"),
+            f"[{(source := entry.get('source', 'extension'))}] {entry.get('message', '')}",
+            run_id,
+            source,
+            orjson.dumps(context).decode() if (context := entry.get("context")) else None,
+        )
+        for entry in entries
+    ]
     
-    for entry in entries:
-        level = entry.get("level", "INFO")
-        message = entry.get("message", "")
-        source = entry.get("source", "extension")
-        context = json.dumps(entry.get("context")) if entry.get("context") else None
-        
-        cur.execute("""
-            INSERT INTO logs (created_at, level, message, run_id, source, context)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (now, level, f"[{source}] {message}", run_id, source, context))
+    if log_queue.qsize() + len(rows) > LOG_QUEUE_MAX_BACKLOG:
+        return jsonify({"error": "Log backlog full, retry later"}), 503
     
-    conn.commit()
-    conn.close()
+    # Persisted by the log writer thread alongside server logs; the client only waits for the enqueue
+    for row in rows:
+        log_queue.put(row)
     
-    return jsonify({"status": "ok", "appended": len(entries)})
+    return jsonify({"status": "ok", "appended": len(entries)}), 202
 
 
 @app.route("/crawl/scripts", methods=["GET"])
@@ -8845,16 +9412,13 @@ def list_domain_scripts():
     """List all domain scripts for the user."""
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT id, domain, script, condition, wait_before_ms, wait_after_ms, created_at, updated_at
-        FROM domain_scripts
-        WHERE user_id IS NULL OR user_id = ?
-        ORDER BY domain
-    """, (user_id,))
-    rows = cur.fetchall()
-    conn.close()
+    with borrow_conn(readonly=True) as conn:
+        rows = conn.execute("""
+            SELECT id, domain, script, condition, wait_before_ms, wait_after_ms, created_at, updated_at
+            FROM domain_scripts
+            WHERE user_id IS NULL OR user_id = ?
+            ORDER BY domain
+        """, (user_id,)).fetchall()
     
     scripts = []
     for row in rows:
@@ -8888,30 +9452,42 @@ def upsert_domain_script():
     wait_before = int(data.get("waitBeforeMs", 0))
     wait_after = int(data.get("waitAfterMs", 0))
     
-    conn = get_db()
-    cur = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    
-    # Check if exists
-    cur.execute("SELECT id FROM domain_scripts WHERE domain = ? AND (user_id = ? OR user_id IS NULL)", (domain, user_id))
-    existing = cur.fetchone()
+    now = iso_now()
     
-    if existing:
+    with borrow_conn() as conn:
+        cur = conn.cursor()
+        # Update the visible script for this domain in place (the user's own before a global one)
         cur.execute("""
             UPDATE domain_scripts 
             SET script = ?, condition = ?, wait_before_ms = ?, wait_after_ms = ?, updated_at = ?
-            WHERE id = ?
-        """, (script, condition, wait_before, wait_after, now, existing["id"]))
-        script_id = existing["id"]
-    else:
-        script_id = str(uuid.uuid4())
-        cur.execute("""
-            INSERT INTO domain_scripts (id, domain, user_id, script, condition, wait_before_ms, wait_after_ms, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (script_id, domain, user_id, script, condition, wait_before, wait_after, now, now))
-    
-    conn.commit()
-    conn.close()
+            WHERE id = (
+                SELECT id FROM domain_scripts
+                WHERE domain = ? AND (user_id = ? OR user_id IS NULL)
+                ORDER BY user_id IS NULL
+                LIMIT 1
+            )
+            RETURNING id
+        """, (script, condition, wait_before, wait_after, now, domain, user_id))
+        existing = cur.fetchone()
+        
+        if existing:
+            script_id = existing["id"]
+        else:
+            # ON CONFLICT covers a concurrent insert of the same (domain, user_id) since the UPDATE
+            cur.execute("""
+                INSERT INTO domain_scripts (id, domain, user_id, script, condition, wait_before_ms, wait_after_ms, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(domain, user_id) DO UPDATE SET
+                    script = excluded.script,
+                    condition = excluded.condition,
+                    wait_before_ms = excluded.wait_before_ms,
+                    wait_after_ms = excluded.wait_after_ms,
+                    updated_at = excluded.updated_at
+                RETURNING id
+            """, (str(uuid.uuid4()), domain, user_id, script, condition, wait_before, wait_after, now, now))
+            script_id = cur.fetchone()["id"]
+        
+        conn.commit()
     
     return jsonify({
         "id": script_id,
@@ -8929,12 +9505,9 @@ def delete_domain_script(script_id):
     """Delete a domain script."""
     user_id = g.current_user["id"]
     
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM domain_scripts WHERE id = ? AND user_id = ?", (script_id, user_id))
-    deleted = cur.rowcount
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        deleted = conn.execute("DELETE FROM domain_scripts WHERE id = ? AND user_id = ?", (script_id, user_id)).rowcount
+        conn.commit()
     
     if deleted == 0:
         return jsonify({"error": "Script not found"}), 404
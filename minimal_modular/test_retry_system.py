@@ -7,70 +7,82 @@ Reads columns from validation config and generates test data dynamically.
 NO MOCKS. NO PLACEHOLDERS. REAL EXECUTION.
 """
 import json
+import re
+from functools import lru_cache
+from itertools import chain
+import numpy as np
 import pandas as pd
 from validation.rule_engine import RuleEngine
 from validation.validation_utils import load_validation_config
 from validation_feedback import generate_validation_feedback, build_retry_prompt
 
 
+@lru_cache(maxsize=None)
+def _load_engine(config_path):
+    """Load a validation config and its RuleEngine once per process; the engine is reused for every DataFrame."""
+    config = load_validation_config(config_path)
+    return config, RuleEngine(config)
+
+
 def extract_columns_from_config(config):
     """Extract all unique column names from validation config rules."""
-    columns = set()
-    for rule in config.rules:
-        if rule.columns:
-            columns.update(rule.columns)
+    columns = set(chain.from_iterable(rule.columns for rule in config.rules if rule.columns))
     # Also include paper_group_column if specified
     if config.paper_group_column:
         columns.add(config.paper_group_column)
     return list(columns)
 
 
-def generate_bad_test_data(columns, paper_group_column=None, source='test.pdf'):
-    """Generate BAD test data with empty/invalid values for all columns."""
+def generate_bad_test_data(columns, paper_group_column=None, source='test.pdf', n=1):
+    """Generate n rows of BAD test data with empty/invalid values for all columns."""
     row = {'__source': source}
     for col in columns:
         if col == paper_group_column:
             row[col] = 'Test_Paper_Bad'  # Group column needs a value
         else:
             row[col] = ''  # Empty = invalid
-    return [row]
+    return [row] + [dict(row) for _ in range(n - 1)]
+
+
+# (pattern, value) in priority order; first match wins, otherwise a generic valid number
+_COLUMN_DEFAULTS = tuple((re.compile(pattern), value) for pattern, value in (
+    (r'percent|content', '5.0'),  # Middle of typical percent ranges
+    (r'^(?=.*cement).*kg', '400'),  # Cement is main binder
+    (r'slag|fly_ash|silica_fume|metakaolin|limestone_powder', '0'),  # Supplementary cementitious materials - set to 0
+    (r'^(?=.*water).*kg', '180'),  # Typical water content
+    (r'kg', '200'),  # Middle of typical mass ranges
+    (r'mm|size', '50'),  # Middle of typical size ranges
+    (r'days|age', '28'),  # Common age value
+    (r'temperature|_c', '20'),  # Room temperature
+    (r'w_b|ratio', '0.45'),  # Common w/b ratio
+    (r'dnssm', '8.5'),  # Typical Dnssm value
+    (r'_m', '0.3'),  # Molar concentration (kg columns matched above)
+))
+
 
+@lru_cache(maxsize=None)
+def _default_value_for_column(col):
+    """Sensible default value based on column name patterns."""
+    col_lower = col.lower()
+    return next((value for pattern, value in _COLUMN_DEFAULTS if pattern.search(col_lower)), '100')
 
-def generate_good_test_data(columns, paper_group_column=None, source='test.pdf'):
-    """Generate GOOD test data with valid values for all columns."""
+
+def generate_good_test_data(columns, paper_group_column=None, source='test.pdf', n=1):
+    """Generate n rows of GOOD test data with valid values for all columns."""
     row = {'__source': source}
     for col in columns:
         # paper_group_column gets a string identifier
         if col == paper_group_column:
             row[col] = 'Test_Paper_Good'
             continue
-        # Provide sensible default values based on column name patterns
-        col_lower = col.lower()
-        if 'percent' in col_lower or 'content' in col_lower:
-            row[col] = '5.0'  # Middle of typical percent ranges
-        elif 'cement' in col_lower and 'kg' in col_lower:
-            row[col] = '400'  # Cement is main binder
-        elif any(x in col_lower for x in ['slag', 'fly_ash', 'silica_fume', 'metakaolin', 'limestone_powder']):
-            row[col] = '0'  # Supplementary cementitious materials - set to 0
-        elif 'water' in col_lower and 'kg' in col_lower:
-            row[col] = '180'  # Typical water content
-        elif 'kg_m3' in col_lower or 'kg' in col_lower:
-            row[col] = '200'  # Middle of typical mass ranges
-        elif 'mm' in col_lower or 'size' in col_lower:
-            row[col] = '50'  # Middle of typical size ranges
-        elif 'days' in col_lower or 'age' in col_lower:
-            row[col] = '28'  # Common age value
-        elif 'temperature' in col_lower or '_c' in col_lower:
-            row[col] = '20'  # Room temperature
-        elif 'w_b' in col_lower or 'ratio' in col_lower:
-            row[col] = '0.45'  # Common w/b ratio
-        elif 'dnssm' in col_lower:
-            row[col] = '8.5'  # Typical Dnssm value
-        elif '_m' in col_lower and 'kg' not in col_lower:
-            row[col] = '0.3'  # Molar concentration
-        else:
-            row[col] = '100'  # Generic valid number
-    return [row]
+        row[col] = _default_value_for_column(col)
+    return [row] + [dict(row) for _ in range(n - 1)]
+
+
+def _test_frame(rows):
+    """DataFrame of identical generated rows, built column-wise from the first row rather than dict by dict."""
+    n = len(rows)
+    return pd.DataFrame({col: np.full(n, value, dtype=object) for col, value in rows[0].items()})
 
 
 def test_retry_system():
@@ -86,8 +98,7 @@ def test_retry_system():
     
     # 1. Load validation config
     print("[1/6] Loading validation config...")
-    config = load_validation_config('validation/configs/nt_build_492.json')
-    engine = RuleEngine(config)
+    config, engine = _load_engine('validation/configs/nt_build_492.json')
     print(f"✓ Loaded config: {config.name}")
     print(f"  Rules: {len(config.rules)}")
     
@@ -99,7 +110,7 @@ def test_retry_system():
     # 2. Generate BAD test data dynamically
     print("[2/6] Generating BAD test data (empty values for all columns)...")
     bad_extraction = generate_bad_test_data(columns, config.paper_group_column)
-    bad_df = pd.DataFrame(bad_extraction)
+    bad_df = _test_frame(bad_extraction)
     print(f"  Created {len(bad_df)} row(s) with {len(bad_df.columns)} columns")
     print()
     
@@ -140,7 +151,7 @@ def test_retry_system():
     # 6. Generate GOOD test data and validate
     print("[6/6] Generating GOOD test data (valid values)...")
     good_extraction = generate_good_test_data(columns, config.paper_group_column)
-    good_df = pd.DataFrame(good_extraction)
+    good_df = _test_frame(good_extraction)
     print(f"  Created {len(good_df)} row(s) with valid values")
     
     try:
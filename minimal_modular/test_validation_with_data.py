@@ -49,17 +49,17 @@ print("Running validation with real data...")
 print("=" * 80)
 report = engine.validate(test_data)
 
+results = report.all_results
+passed = sum(1 for r in results if r.passed)
 print("\nValidation Results:")
-print(f"Total Rules: {len(report.all_results)}")
-print(f"Passed: {sum(1 for r in report.all_results if r.passed)}")
-print(f"Failed: {sum(1 for r in report.all_results if not r.passed)}")
+print(f"Total Rules: {len(results)}")
+print(f"Passed: {passed}")
+print(f"Failed: {len(results) - passed}")
 print()
 
 print("Per-Rule Results:")
-for result in report.all_results:
-    status = "✓ PASS" if result.passed else "✗ FAIL"
-    skipped = result.details.get('skipped', False)
-    if skipped:
-        print(f"  {result.rule_id}: SKIPPED - {result.details.get('error', 'unknown')}")
-    else:
-        print(f"  {result.rule_id}: {status}")
+print("\n".join(
+    f"  {r.rule_id}: SKIPPED - {r.details.get('error', 'unknown')}" if r.details.get('skipped', False)
+    else f"  {r.rule_id}: {'✓ PASS' if r.passed else '✗ FAIL'}"
+    for r in results
+))
@@ -8,6 +8,7 @@ Usage:
 """
 import argparse
 import json
+import orjson
 import pandas as pd
 import sys
 from pathlib import Path
@@ -23,28 +24,70 @@ from validation import (
     create_composite_flags
 )
 
+JSONL_CHUNK_ROWS = 10_000  # rows parsed per chunk for --format jsonl
+CATEGORY_MAX_UNIQUE_RATIO = 0.5  # --categorical converts object columns below this distinct/rows ratio
+
+
+def load_json_records(path: str) -> pd.DataFrame:
+    """Load a JSON array of records; orjson first, stdlib json for NaN/Infinity literals it rejects."""
+    raw = Path(path).read_bytes()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        data = json.loads(raw)
+    del raw
+    return pd.DataFrame(data)
+
+
+def load_jsonl_records(path: str) -> pd.DataFrame:
+    """Load line-delimited JSON in chunks so only one chunk of parsed dicts is alive at a time."""
+    reader = pd.read_json(path, lines=True, chunksize=JSONL_CHUNK_ROWS, dtype=False, convert_dates=False)
+    with reader:
+        chunks = list(reader)
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+
+def categorize_low_cardinality_strings(df: pd.DataFrame, max_unique_ratio: float = CATEGORY_MAX_UNIQUE_RATIO) -> int:
+    """Convert object columns with few distinct values to category dtype in place; returns columns converted."""
+    converted = 0
+    for col in df.select_dtypes(include='object').columns:
+        try:
+            n_unique = df[col].nunique()
+        except TypeError:  # list/dict cells are unhashable
+            continue
+        if n_unique / len(df) < max_unique_ratio:
+            df[col] = df[col].astype('category')
+            converted += 1
+    return converted
+
 
 def main():
     parser = argparse.ArgumentParser(description='Validate extracted data against quality rules')
     parser.add_argument('--data', required=True, help='Path to JSON data file to validate')
     parser.add_argument('--config', required=True, help='Path to validation config JSON file')
     parser.add_argument('--output', default='validation_results', help='Output directory for reports')
-    parser.add_argument('--export-validated', help='Export validated data to this JSON file')
-    parser.add_argument('--format', choices=['json', 'csv'], default='json', 
-                       help='Input data format (default: json)')
+    parser.add_argument('--export-validated',
+                       help='Export validated data to this file (.json, .jsonl, .parquet or .csv)')
+    parser.add_argument('--pretty', action='store_true', help='Indent exported JSON (larger and slower to write)')
+    parser.add_argument('--format', choices=['json', 'jsonl', 'csv'], default='json', 
+                       help='Input data format (default: json; jsonl = one record per line)')
+    parser.add_argument('--categorical', action='store_true',
+                       help='Store low-cardinality string columns as category dtype to cut memory on large inputs')
     
     args = parser.parse_args()
     
     # Load data
     print(f"Loading data from {args.data}...")
     if args.format == 'json':
-        with open(args.data, 'r') as f:
-            data = json.load(f)
-        df = pd.DataFrame(data)
+        df = load_json_records(args.data)
+    elif args.format == 'jsonl':
+        df = load_jsonl_records(args.data)
     else:  # CSV
         df = pd.read_csv(args.data)
     
     print(f"Loaded {len(df)} rows")
+    if args.categorical and len(df):
+        print(f"Converted {categorize_low_cardinality_strings(df)} string columns to category dtype")
     
     # Load validation config
     print(f"Loading validation config from {args.config}...")
@@ -66,13 +109,20 @@ def main():
     print()
     
     # Show failed rules
-    failed_results = [r for r in report.all_results if not r.passed]
-    if failed_results:
-        print(f"Failed Rules: {len(failed_results)}")
-        for result in failed_results[:10]:  # Show first 10
+    # One pass: count every failure but keep only the first 10 for display
+    fail_count = 0
+    shown_failures = []
+    for result in report.all_results:
+        if not result.passed:
+            fail_count += 1
+            if len(shown_failures) < 10:
+                shown_failures.append(result)
+    if fail_count:
+        print(f"Failed Rules: {fail_count}")
+        for result in shown_failures:
             print(f"  - [{result.severity.value.upper()}] {result.rule_id}: {result.message}")
-        if len(failed_results) > 10:
-            print(f"  ... and {len(failed_results) - 10} more")
+        if fail_count > 10:
+            print(f"  ... and {fail_count - 10} more")
     else:
         print("✓ All rules passed!")
     
@@ -85,12 +135,19 @@ def main():
         df_validated = create_composite_flags(df_validated, config)
         
         # Filter to accepted rows only
-        accepted_df = df_validated[df_validated.get('row_accept_candidate', True)]
+        if 'row_accept_candidate' in df_validated.columns:
+            accepted_df = df_validated.loc[df_validated['row_accept_candidate']]
+        else:
+            accepted_df = df_validated
         
         print(f"Exporting {len(accepted_df)} accepted rows to {args.export_validated}...")
         
         if args.export_validated.endswith('.json'):
-            accepted_df.to_json(args.export_validated, orient='records', indent=2)
+            accepted_df.to_json(args.export_validated, orient='records', indent=2 if args.pretty else None)
+        elif args.export_validated.endswith('.jsonl'):
+            accepted_df.to_json(args.export_validated, orient='records', lines=True)
+        elif args.export_validated.endswith('.parquet'):
+            accepted_df.to_parquet(args.export_validated, index=False)  # needs pyarrow or fastparquet
         else:
             accepted_df.to_csv(args.export_validated, index=False)
         
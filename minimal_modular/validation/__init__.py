@@ -32,12 +32,6 @@ from .validation_utils import (
     filter_accepted_rows
 )
 
-from .source_grounding import (
-    run_source_grounding,
-    SourceGroundingReport,
-    CellGroundingResult
-)
-
 from .row_count_validator import (
     validate_row_counts,
     RowCountValidationReport,
@@ -50,43 +44,46 @@ from .column_metrics import (
     ColumnMetric
 )
 
-from .error_classifier import (
-    classify_errors,
-    ErrorClassificationReport,
-    ErrorType,
-    CellError
-)
-
-from .ai_report_generator import (
-    generate_ai_report,
-    AIValidationReport,
-    AIIssue
-)
-
-from .enhanced_validation import (
-    run_enhanced_validation,
-    EnhancedValidationReport
-)
+import importlib
 
-from .full_validation import (
-    run_full_validation_pipeline,
-    FullValidationResult
-)
+# Submodules that pull in PDF parsing (source_grounding) or the LLM client are
+# imported on first attribute access (PEP 562), so the rule-engine CLI path
+# does not pay for them.
+_LAZY_EXPORTS = {
+    'run_source_grounding': 'source_grounding',
+    'SourceGroundingReport': 'source_grounding',
+    'CellGroundingResult': 'source_grounding',
+    'classify_errors': 'error_classifier',
+    'ErrorClassificationReport': 'error_classifier',
+    'ErrorType': 'error_classifier',
+    'CellError': 'error_classifier',
+    'generate_ai_report': 'ai_report_generator',
+    'generate_ai_reports_batch': 'ai_report_generator',
+    'AIValidationReport': 'ai_report_generator',
+    'AIIssue': 'ai_report_generator',
+    'run_enhanced_validation': 'enhanced_validation',
+    'EnhancedValidationReport': 'enhanced_validation',
+    'run_full_validation_pipeline': 'full_validation',
+    'FullValidationResult': 'full_validation',
+    'generate_objective_assessment': 'objective_assessment',
+    'save_objective_assessment': 'objective_assessment',
+    'ObjectiveAssessmentReport': 'objective_assessment',
+    'DataIssue': 'objective_assessment',
+    'compute_cell_scores': 'cell_scoring',
+    'save_scoring_report': 'cell_scoring',
+    'load_scoring_report': 'cell_scoring',
+    'ScoringReport': 'cell_scoring',
+    'CellScore': 'cell_scoring',
+}
 
-from .objective_assessment import (
-    generate_objective_assessment,
-    save_objective_assessment,
-    ObjectiveAssessmentReport,
-    DataIssue
-)
 
-from .cell_scoring import (
-    compute_cell_scores,
-    save_scoring_report,
-    load_scoring_report,
-    ScoringReport,
-    CellScore
-)
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Types
@@ -126,6 +123,7 @@ __all__ = [
     'ErrorType',
     'CellError',
     'generate_ai_report',
+    'generate_ai_reports_batch',
     'AIValidationReport',
     'AIIssue',
     
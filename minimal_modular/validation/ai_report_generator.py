@@ -9,6 +9,10 @@ Default provider: Gemini (same as extraction). Configurable via VALIDATION_LLM_P
 import os
 import json
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import orjson
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
@@ -18,9 +22,18 @@ from response_parser import parse_json_from_text
 from config import LLM_PROVIDER
 
 VALIDATION_LLM_PROVIDER = os.environ.get("VALIDATION_LLM_PROVIDER", LLM_PROVIDER)
+# Full tracebacks for failed AI report calls; off by default since rate limits fail every call
+VALIDATION_LLM_DEBUG = os.environ.get("VALIDATION_LLM_DEBUG") == "1"
+# Concurrent LLM calls in generate_ai_reports_batch; matches the llm_client pool size
+AI_REPORT_BATCH_WORKERS = 8
 
+_JSON_DECODER = json.JSONDecoder()
 
-@dataclass
+# Fallback score weights for: pass rate, grounding, coverage, row count accuracy, non-outlier rate
+_FALLBACK_SCORE_WEIGHTS = np.array([30, 25, 20, 15, 10], dtype=np.float64)
+
+
+@dataclass(frozen=True, slots=True)
 class AIIssue:
     """An issue identified by the AI."""
     study: Optional[str]
@@ -29,7 +42,7 @@ class AIIssue:
     affected_rows: Optional[int]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AIValidationReport:
     """AI-generated validation report."""
     overall_quality_score: int
@@ -58,6 +71,40 @@ Be objective, specific, and actionable in your analysis.
 Output ONLY valid JSON, no other text."""
 
 
+_AI_REPORT_TASK_SECTION = """
+## YOUR TASK
+Provide a JSON response with:
+1. overall_quality_score: Integer 0-100 based on all metrics
+2. data_completeness: String percentage (e.g., "92%")
+3. grounding_confidence: String percentage (e.g., "78%")
+4. row_count_accuracy: String percentage (e.g., "80%")
+5. issues: Array of {study, issue, severity, affected_rows} - identify top problems
+6. recommendations: Array of strings - actionable suggestions
+7. summary: String - 2-3 sentence overall assessment
+
+SCORING GUIDELINES:
+- 90-100: Publication-grade, minimal issues
+- 80-89: High quality, minor issues
+- 65-79: Usable with caution, some concerns
+- <65: Unreliable, significant issues
+
+OUTPUT FORMAT (JSON only):
+{
+  "overall_quality_score": 85,
+  "data_completeness": "92%",
+  "grounding_confidence": "78%",
+  "row_count_accuracy": "80%",
+  "issues": [
+    {"study": "Study 2", "issue": "Missing water-cement ratio", "severity": "high", "affected_rows": 5}
+  ],
+  "recommendations": [
+    "Review Study 13 - multiple values appear hallucinated"
+  ],
+  "summary": "Data extraction quality is acceptable..."
+}
+"""
+
+
 def build_ai_report_prompt(
     total_rows: int,
     total_columns: int,
@@ -75,7 +122,7 @@ def build_ai_report_prompt(
 ) -> str:
     """Build the prompt for AI report generation."""
     
-    prompt = f"""Analyze the following data extraction validation results and provide a quality assessment.
+    parts = [f"""Analyze the following data extraction validation results and provide a quality assessment.
 
 ## EXTRACTION SUMMARY
 - Total rows extracted: {total_rows}
@@ -91,59 +138,26 @@ def build_ai_report_prompt(
 - Average outlier rate: {avg_outlier_rate:.1%}
 
 ## ERROR BREAKDOWN
-"""
-    for error_type, count in error_counts.items():
-        if count > 0:
-            prompt += f"- {error_type}: {count} errors\n"
+"""]
+    parts.extend(
+        f"- {error_type}: {count} errors\n"
+        for error_type, count in error_counts.items() if count > 0
+    )
     
     if low_coverage_columns:
-        prompt += f"\n## LOW COVERAGE COLUMNS (<50%)\n"
-        for col in low_coverage_columns[:10]:
-            prompt += f"- {col}\n"
+        parts.append("\n## LOW COVERAGE COLUMNS (<50%)\n")
+        parts.extend(f"- {col}\n" for col in low_coverage_columns[:10])
     
     if high_outlier_columns:
-        prompt += f"\n## HIGH OUTLIER COLUMNS (>10%)\n"
-        for col in high_outlier_columns[:10]:
-            prompt += f"- {col}\n"
+        parts.append("\n## HIGH OUTLIER COLUMNS (>10%)\n")
+        parts.extend(f"- {col}\n" for col in high_outlier_columns[:10])
     
     if sources_with_mismatch:
-        prompt += f"\n## SOURCES WITH ROW COUNT MISMATCH\n"
-        for src in sources_with_mismatch[:10]:
-            prompt += f"- {src}\n"
+        parts.append("\n## SOURCES WITH ROW COUNT MISMATCH\n")
+        parts.extend(f"- {src}\n" for src in sources_with_mismatch[:10])
     
-    prompt += """
-## YOUR TASK
-Provide a JSON response with:
-1. overall_quality_score: Integer 0-100 based on all metrics
-2. data_completeness: String percentage (e.g., "92%")
-3. grounding_confidence: String percentage (e.g., "78%")
-4. row_count_accuracy: String percentage (e.g., "80%")
-5. issues: Array of {study, issue, severity, affected_rows} - identify top problems
-6. recommendations: Array of strings - actionable suggestions
-7. summary: String - 2-3 sentence overall assessment
-
-SCORING GUIDELINES:
-- 90-100: Publication-grade, minimal issues
-- 80-89: High quality, minor issues
-- 65-79: Usable with caution, some concerns
-- <65: Unreliable, significant issues
-
-OUTPUT FORMAT (JSON only):
-{
-  "overall_quality_score": 85,
-  "data_completeness": "92%",
-  "grounding_confidence": "78%",
-  "row_count_accuracy": "80%",
-  "issues": [
-    {"study": "Study 2", "issue": "Missing water-cement ratio", "severity": "high", "affected_rows": 5}
-  ],
-  "recommendations": [
-    "Review Study 13 - multiple values appear hallucinated"
-  ],
-  "summary": "Data extraction quality is acceptable..."
-}
-"""
-    return prompt
+    parts.append(_AI_REPORT_TASK_SECTION)
+    return "".join(parts)
 
 
 def generate_ai_report(
@@ -216,9 +230,6 @@ def generate_ai_report(
         response_text = response['choices'][0]['message']['content']
         
         # Parse JSON - handle both dict and list responses
-        import json
-        import re
-        
         # Try to extract JSON object from response
         parsed = None
         
@@ -230,11 +241,12 @@ def generate_ai_report(
         
         # If that failed or returned a list, try to find JSON object in text
         if parsed is None or isinstance(parsed, list):
-            # Try to find JSON object with curly braces
-            obj_match = re.search(r'\{[\s\S]*\}', response_text)
-            if obj_match:
+            # Decode the first JSON object starting at the first curly brace;
+            # raw_decode is linear and ignores any trailing prose
+            obj_start = response_text.find('{')
+            if obj_start != -1:
                 try:
-                    parsed = json.loads(obj_match.group(0))
+                    parsed, _ = _JSON_DECODER.raw_decode(response_text, obj_start)
                 except json.JSONDecodeError:
                     pass
         
@@ -283,21 +295,21 @@ def generate_ai_report(
     except Exception as e:
         if verbose:
             print(f"  → AI report generation failed: {e}")
-            import traceback
-            traceback.print_exc()
+            if VALIDATION_LLM_DEBUG:
+                traceback.print_exc()
             print("  → Using fallback report")
             print("=" * 80)
         
-        base_score = int(
-            validation_pass_rate * 30 +
-            grounding_score * 25 +
-            avg_coverage * 20 +
-            row_count_accuracy * 15 +
-            (1 - avg_outlier_rate) * 10
-        )
+        base_score = int(np.clip(_FALLBACK_SCORE_WEIGHTS @ np.array([
+            validation_pass_rate,
+            grounding_score,
+            avg_coverage,
+            row_count_accuracy,
+            1 - avg_outlier_rate
+        ]), 0, 100))
         
         return AIValidationReport(
-            overall_quality_score=min(100, max(0, base_score)),
+            overall_quality_score=base_score,
             data_completeness=f"{avg_coverage:.0%}",
             grounding_confidence=f"{grounding_score:.0%}",
             row_count_accuracy=f"{row_count_accuracy:.0%}",
@@ -307,11 +319,32 @@ def generate_ai_report(
         )
 
 
+def generate_ai_reports_batch(
+    report_inputs: List[Dict[str, Any]],
+    max_workers: int = AI_REPORT_BATCH_WORKERS
+) -> List[AIValidationReport]:
+    """
+    Generate several AI reports concurrently.
+    
+    Each entry of report_inputs holds the keyword arguments of generate_ai_report.
+    The LLM calls are network-bound, so threads sharing the llm_client keep-alive
+    session overlap their round-trips. Reports are returned in input order.
+    """
+    if not report_inputs:
+        return []
+    
+    def _generate(kwargs: Dict[str, Any]) -> AIValidationReport:
+        return generate_ai_report(**{"verbose": False, **kwargs})
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(report_inputs))) as ex:
+        return list(ex.map(_generate, report_inputs))
+
+
 def save_ai_report(report: AIValidationReport, output_path: str):
     """Save AI validation report to JSON file."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2))
 
 
 def load_ai_report(input_path: str) -> Optional[AIValidationReport]:
@@ -319,8 +352,12 @@ def load_ai_report(input_path: str) -> Optional[AIValidationReport]:
     if not os.path.isfile(input_path):
         return None
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(input_path, 'rb') as f:
+        raw = f.read()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        data = json.loads(raw)
     
     issues = [
         AIIssue(**i) for i in data.get("issues", [])
@@ -11,8 +11,10 @@ Scores range from 0-100 where 100 is perfect quality.
 """
 import os
 import json
-from typing import List, Dict, Any, Optional, Set
+import orjson
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict, field
+import numpy as np
 import pandas as pd
 
 from .source_grounding import SourceGroundingReport, load_source_grounding_report
@@ -27,6 +29,19 @@ PENALTY_CONSTRAINT_WARNING = 10
 PENALTY_OUTLIER = 20
 PENALTY_NULL_EMPTY = 50
 
+# Cell values treated as null/empty
+NA_VALUES = frozenset({'N.A.', 'N.A', 'n.a.', 'n.a', 'NA', 'na', 'null', 'NULL', 'None', ''})
+
+# Penalty labels for error types that lower a non-null cell's score
+ERROR_PENALTY_LABELS = {
+    "OUTLIER": f"OUTLIER (-{PENALTY_OUTLIER})",
+    "SCHEMA_VIOLATION": f"SCHEMA_VIOLATION (-{PENALTY_CONSTRAINT_ERROR})",
+    "PHYSICS_VIOLATION": f"PHYSICS_VIOLATION (-{PENALTY_CONSTRAINT_ERROR})",
+}
+
+# CellScore.found_in_source indexed by the int8 grounding state (-1 = not checked)
+FOUND_IN_SOURCE_STATES = (False, True, None)
+
 
 @dataclass
 class CellScore:
@@ -77,7 +92,7 @@ def compute_cell_scores(
     Args:
         extracted_data: List of extracted rows (dictionaries)
         grounding_report: Source grounding report with per-cell found_in_pdf
-        validation_report: Rule validation report with row_results
+        validation_report: Rule validation report (accepted for API compatibility; not used in scoring)
         error_report: Error classification report with per-cell errors
         schema_fields: List of schema field names to score (excludes internal columns)
         verbose: Print progress information
@@ -111,118 +126,100 @@ def compute_cell_scores(
     if verbose:
         print(f"  Scoring {len(columns_to_score)} columns across {len(df)} rows")
     
-    # Build lookup maps for efficient access
-    grounding_lookup: Dict[tuple, bool] = {}
+    n_rows = len(extracted_data)
+    n_cols = len(columns_to_score)
+    n_cells = n_rows * n_cols
+    col_to_idx = {col: i for i, col in enumerate(columns_to_score)}
+    
+    # Raw cell values in row-major order (a missing key counts as None)
+    values = [row.get(col) for row in extracted_data for col in columns_to_score]
+    is_null = np.fromiter(
+        (value is None or (isinstance(value, str) and value.strip() in NA_VALUES) for value in values),
+        dtype=bool,
+        count=n_cells
+    ).reshape(n_rows, n_cols)
+    
+    # Source grounding per scored cell: -1 = not checked, 0 = not found, 1 = found (last entry wins)
+    grounding = np.full((n_rows, n_cols), -1, dtype=np.int8)
     if grounding_report and grounding_report.per_cell:
         for cell in grounding_report.per_cell:
-            grounding_lookup[(cell.row, cell.column)] = cell.found_in_pdf
+            col_idx = col_to_idx.get(cell.column)
+            if col_idx is not None and 0 <= cell.row < n_rows:
+                grounding[cell.row, col_idx] = -1 if cell.found_in_pdf is None else bool(cell.found_in_pdf)
+    not_found = grounding == 0
     
-    # Build error lookup from error_report
-    error_lookup: Dict[tuple, List[str]] = {}
+    # Penalized error hits per scored cell, plus their labels in report order (None = no errors)
+    cell_error_labels: List[Optional[List[str]]] = [None] * n_cells
+    outlier_cells: List[int] = []
+    constraint_cells: List[int] = []
     if error_report and error_report.per_cell_errors:
         for err in error_report.per_cell_errors:
-            key = (err.row, err.column)
-            if key not in error_lookup:
-                error_lookup[key] = []
-            error_lookup[key].append(err.error_type)
+            label = ERROR_PENALTY_LABELS.get(err.error_type)
+            col_idx = col_to_idx.get(err.column)
+            if label is None or col_idx is None or not 0 <= err.row < n_rows:
+                continue
+            cell_idx = err.row * n_cols + col_idx
+            (outlier_cells if err.error_type == "OUTLIER" else constraint_cells).append(cell_idx)
+            if cell_error_labels[cell_idx] is None:
+                cell_error_labels[cell_idx] = []
+            cell_error_labels[cell_idx].append(label)
+    outlier_hits = np.bincount(outlier_cells, minlength=n_cells).reshape(n_rows, n_cols)
+    constraint_hits = np.bincount(constraint_cells, minlength=n_cells).reshape(n_rows, n_cols)
     
-    # Build row validation lookup from validation_report
-    row_rule_failures: Dict[int, Set[str]] = {}
-    if validation_report and validation_report.row_results:
-        for row_idx, row_result in enumerate(validation_report.row_results):
-            failures = set()
-            for rule_id, passed in row_result.items():
-                if rule_id != "row_accept_candidate" and passed is False:
-                    failures.add(rule_id)
-            if failures:
-                row_rule_failures[row_idx] = failures
+    # Null cells take only the null penalty; every other penalty applies to non-null cells
+    scores = np.clip(np.where(
+        is_null,
+        100.0 - PENALTY_NULL_EMPTY,
+        100.0
+        - PENALTY_NOT_FOUND_IN_SOURCE * not_found
+        - PENALTY_OUTLIER * outlier_hits
+        - PENALTY_CONSTRAINT_ERROR * constraint_hits
+    ), 0.0, 100.0)
     
-    # Compute cell scores
+    # Build per-cell records
     cell_scores: List[CellScore] = []
-    row_score_sums: Dict[int, float] = {}
-    row_score_counts: Dict[int, int] = {}
-    column_score_sums: Dict[str, float] = {}
-    column_score_counts: Dict[str, int] = {}
-    
-    na_values = {'N.A.', 'N.A', 'n.a.', 'n.a', 'NA', 'na', 'null', 'NULL', 'None', ''}
     
-    for row_idx, row in enumerate(extracted_data):
+    flat_scores = scores.ravel().tolist()
+    flat_null = is_null.ravel().tolist()
+    flat_grounding = grounding.ravel().tolist()
+    cell_idx = 0
+    for row_idx in range(n_rows):
         for col in columns_to_score:
-            value = row.get(col)
-            
-            # Check if null/empty
-            is_null = value is None or (isinstance(value, str) and value.strip() in na_values)
+            value = values[cell_idx]
+            score = flat_scores[cell_idx]
+            is_null_cell = flat_null[cell_idx]
+            found_in_source = FOUND_IN_SOURCE_STATES[flat_grounding[cell_idx]]
+            error_labels = cell_error_labels[cell_idx]
+            cell_idx += 1
             
-            # Start with base score
-            score = 100.0
-            penalties = []
-            
-            # Apply penalties
-            if is_null:
-                score -= PENALTY_NULL_EMPTY
-                penalties.append(f"NULL_EMPTY (-{PENALTY_NULL_EMPTY})")
+            if is_null_cell:
+                penalties = [f"NULL_EMPTY (-{PENALTY_NULL_EMPTY})"]
             else:
-                # Check source grounding
-                found_in_source = grounding_lookup.get((row_idx, col))
+                penalties = []
                 if found_in_source is False:
-                    score -= PENALTY_NOT_FOUND_IN_SOURCE
                     penalties.append(f"NOT_FOUND_IN_SOURCE (-{PENALTY_NOT_FOUND_IN_SOURCE})")
-                
-                # Check errors
-                errors = error_lookup.get((row_idx, col), [])
-                for err_type in errors:
-                    if err_type == "OUTLIER":
-                        score -= PENALTY_OUTLIER
-                        penalties.append(f"OUTLIER (-{PENALTY_OUTLIER})")
-                    elif err_type == "SCHEMA_VIOLATION":
-                        score -= PENALTY_CONSTRAINT_ERROR
-                        penalties.append(f"SCHEMA_VIOLATION (-{PENALTY_CONSTRAINT_ERROR})")
-                    elif err_type == "PHYSICS_VIOLATION":
-                        score -= PENALTY_CONSTRAINT_ERROR
-                        penalties.append(f"PHYSICS_VIOLATION (-{PENALTY_CONSTRAINT_ERROR})")
-            
-            # Clamp score to 0-100
-            score = max(0.0, min(100.0, score))
+                if error_labels:
+                    penalties.extend(error_labels)
             
-            cell_score = CellScore(
+            cell_scores.append(CellScore(
                 row=row_idx,
                 column=col,
                 value=str(value) if value is not None else None,
                 score=score,
                 penalties=penalties,
-                found_in_source=grounding_lookup.get((row_idx, col)),
-                is_null=is_null
-            )
-            cell_scores.append(cell_score)
-            
-            # Accumulate for row/column averages
-            if row_idx not in row_score_sums:
-                row_score_sums[row_idx] = 0.0
-                row_score_counts[row_idx] = 0
-            row_score_sums[row_idx] += score
-            row_score_counts[row_idx] += 1
-            
-            if col not in column_score_sums:
-                column_score_sums[col] = 0.0
-                column_score_counts[col] = 0
-            column_score_sums[col] += score
-            column_score_counts[col] += 1
+                found_in_source=found_in_source,
+                is_null=is_null_cell
+            ))
     
-    # Compute row scores
-    row_scores = {}
-    for row_idx in row_score_sums:
-        if row_score_counts[row_idx] > 0:
-            row_scores[row_idx] = round(row_score_sums[row_idx] / row_score_counts[row_idx], 2)
-    
-    # Compute column scores
-    column_scores = {}
-    for col in column_score_sums:
-        if column_score_counts[col] > 0:
-            column_scores[col] = round(column_score_sums[col] / column_score_counts[col], 2)
-    
-    # Compute table score
-    total_score = sum(cs.score for cs in cell_scores)
-    table_score = round(total_score / len(cell_scores), 2) if cell_scores else 0.0
+    # Row, column and table scores are means over the score array (no scored cells, no scores)
+    if scores.size:
+        row_scores = {row_idx: round(mean, 2) for row_idx, mean in enumerate(scores.mean(axis=1).tolist())}
+        column_scores = {col: round(mean, 2) for col, mean in zip(columns_to_score, scores.mean(axis=0).tolist())}
+        table_score = round(float(scores.mean()), 2)
+    else:
+        row_scores = {}
+        column_scores = {}
+        table_score = 0.0
     
     if verbose:
         print(f"  Total cells scored: {len(cell_scores)}")
@@ -244,8 +241,11 @@ def compute_cell_scores(
 def save_scoring_report(report: ScoringReport, output_path: str):
     """Save scoring report to JSON file."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(
+            report.to_dict(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
 
 
 def load_scoring_report(input_path: str) -> Optional[ScoringReport]:
@@ -253,8 +253,13 @@ def load_scoring_report(input_path: str) -> Optional[ScoringReport]:
     if not os.path.isfile(input_path):
         return None
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(input_path, 'rb') as f:
+        raw = f.read()
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # Reports written by stdlib json may contain NaN literals
+        data = json.loads(raw)
     
     cell_scores = [
         CellScore(**cell) for cell in data.get("cell_scores", [])
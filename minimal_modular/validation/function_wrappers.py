@@ -9,6 +9,17 @@ import numpy as np
 from typing import List, Dict, Any
 
 
+def _numeric_block(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """Present columns as one float (n_rows, n_cols) array; non-numeric values become NaN."""
+    sub = df[[col for col in columns if col in df.columns]]
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in sub.dtypes):
+        return sub.to_numpy(dtype=np.float64, na_value=np.nan)
+    arr = np.empty(sub.shape, dtype=np.float64)
+    for i in range(sub.shape[1]):
+        arr[:, i] = pd.to_numeric(sub.iloc[:, i], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return arr
+
+
 def validate_range(df: pd.DataFrame, columns: List[str], parameters: Dict[str, Any]) -> pd.Series:
     """
     Validate that values are within specified range.
@@ -20,49 +31,29 @@ def validate_range(df: pd.DataFrame, columns: List[str], parameters: Dict[str, A
     min_val = parameters.get('min_value', -np.inf)
     max_val = parameters.get('max_value', np.inf)
     
-    result = pd.Series(True, index=df.index)
-    
-    for col in columns:
-        if col in df.columns:
-            col_data = pd.to_numeric(df[col], errors='coerce')
-            result &= (col_data >= min_val) & (col_data <= max_val)
-    
-    return result
+    arr = _numeric_block(df, columns)
+    return pd.Series(((arr >= min_val) & (arr <= max_val)).all(axis=1), index=df.index)
 
 
 def validate_positive(df: pd.DataFrame, columns: List[str], parameters: Dict[str, Any]) -> pd.Series:
     """Validate that values are positive (> 0)"""
-    result = pd.Series(True, index=df.index)
-    
-    for col in columns:
-        if col in df.columns:
-            col_data = pd.to_numeric(df[col], errors='coerce')
-            result &= col_data > 0
-    
-    return result
+    return pd.Series((_numeric_block(df, columns) > 0).all(axis=1), index=df.index)
 
 
 def validate_non_negative(df: pd.DataFrame, columns: List[str], parameters: Dict[str, Any]) -> pd.Series:
     """Validate that values are non-negative (>= 0)"""
-    result = pd.Series(True, index=df.index)
-    
-    for col in columns:
-        if col in df.columns:
-            col_data = pd.to_numeric(df[col], errors='coerce')
-            result &= col_data >= 0
-    
-    return result
+    return pd.Series((_numeric_block(df, columns) >= 0).all(axis=1), index=df.index)
 
 
 def check_not_empty(df: pd.DataFrame, columns: List[str], parameters: Dict[str, Any]) -> pd.Series:
     """Check that specified columns are not empty/null"""
-    result = pd.Series(True, index=df.index)
-    
-    for col in columns:
-        if col in df.columns:
-            result &= df[col].notna() & (df[col].astype(str) != '')
-    
-    return result
+    sub = df[[col for col in columns if col in df.columns]]
+    mask = sub.notna().to_numpy().all(axis=1)
+    # Only text-like columns can stringify to ''; numeric/bool columns skip the str cast
+    text = sub.select_dtypes(exclude=['number', 'bool'])
+    if text.shape[1]:
+        mask &= (text.astype(str).to_numpy() != '').all(axis=1)
+    return pd.Series(mask, index=df.index)
 
 
 def validate_sum(df: pd.DataFrame, columns: List[str], parameters: Dict[str, Any]) -> pd.Series:
@@ -10,6 +10,7 @@ not validation metrics.
 import os
 import json
 import sys
+import orjson
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict, field
 import pandas as pd
@@ -428,5 +429,5 @@ def generate_objective_assessment(
 
 def save_objective_assessment(report: ObjectiveAssessmentReport, path: str) -> None:
     """Save objective assessment report to JSON file."""
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(report.to_dict(), f, indent=2)
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2))
@@ -31,6 +31,8 @@ class RuleEngine:
         """
         self.config = config
         self.rule_functions: Dict[str, RuleFunction] = {}
+        # Compiled condition/aggregation expressions, reused across validate() calls and groups
+        self._code_cache: Dict[str, Any] = {}
         self._load_rule_functions()
     
     def _load_rule_functions(self):
@@ -59,6 +61,16 @@ class RuleEngine:
         """Register a custom rule function."""
         self.rule_functions[name] = func
     
+    def _compile(self, expression: str):
+        """Compile an eval expression once per engine (SyntaxWarnings suppressed, as for eval)."""
+        code = self._code_cache.get(expression)
+        if code is None:
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', category=SyntaxWarning)
+                code = compile(expression, '<string>', 'eval')
+            self._code_cache[expression] = code
+        return code
+    
     def validate(self, df: pd.DataFrame) -> ValidationReport:
         """
         Run validation on a dataframe.
@@ -167,9 +179,10 @@ class RuleEngine:
         
         # Execute row-level rules
         row_flags = pd.DataFrame(index=filtered_df.index)
+        batched_masks = self._batch_range_rules(filtered_df)
         for rule in self.config.rules:
             if rule.scope == RuleScope.ROW and rule.enabled:
-                result = self._execute_row_rule(filtered_df, rule, row_flags)
+                result = self._execute_row_rule(filtered_df, rule, row_flags, batched_masks.get(id(rule)))
                 report.all_results.append(result)
         
         # Compute row_accept_candidate: True if row passes all error-severity rules
@@ -205,9 +218,10 @@ class RuleEngine:
         self, 
         df: pd.DataFrame, 
         rule: RuleDefinition,
-        row_flags: pd.DataFrame
+        row_flags: pd.DataFrame,
+        batched_pass_mask: Optional[pd.Series] = None
     ) -> ValidationResult:
-        """Execute a single row-level validation rule."""
+        """Execute a single row-level validation rule (batched_pass_mask: precomputed by _batch_range_rules)."""
         
         # Check if required columns exist
         missing_cols = [col for col in rule.columns if col not in df.columns]
@@ -259,6 +273,8 @@ class RuleEngine:
                 )
         
         # Priority 2: Function name lookup (legacy support)
+        elif batched_pass_mask is not None:
+            pass_mask = batched_pass_mask
         elif rule.condition and rule.condition in self.rule_functions:
             func = self.rule_functions[rule.condition]
             try:
@@ -307,8 +323,16 @@ class RuleEngine:
         
         # Store result in flag column (always store using rule_id if no flag_column specified)
         flag_col = rule.flag_column or rule.rule_id
-        row_flags.loc[mask, flag_col] = False
-        row_flags.loc[mask & pass_mask, flag_col] = True
+        if flag_col in row_flags.columns:
+            row_flags.loc[mask, flag_col] = False
+            row_flags.loc[mask & pass_mask, flag_col] = True
+        else:
+            # New flag column: one assignment instead of two .loc column inserts
+            # (same object dtype as before: NaN outside the rule filter, bools inside)
+            flags = np.full(len(row_flags), np.nan, dtype=object)
+            flags[mask.reindex(row_flags.index, fill_value=False).to_numpy(dtype=bool)] = False
+            flags[(mask & pass_mask).reindex(row_flags.index, fill_value=False).to_numpy(dtype=bool)] = True
+            row_flags[flag_col] = flags
         
         # Compute overall result
         total_applicable = mask.sum()
@@ -333,6 +357,57 @@ class RuleEngine:
             metadata={"rule_definition": rule.__dict__}
         )
     
+    def _batch_range_rules(self, df: pd.DataFrame) -> Dict[int, pd.Series]:
+        """
+        Evaluate all plain validate_range rules in one vectorized pass.
+        
+        Eligible rules (enabled row rules using the built-in validate_range with numeric
+        bounds, no python_expression or filter, all columns present) share one float block
+        of their columns, so each column is converted once and every (rule, column) bound
+        is checked in a single broadcast comparison. Returns pass masks keyed by id(rule);
+        other rules go through _execute_row_rule's function lookup as before.
+        """
+        from .function_wrappers import validate_range, _numeric_block
+        
+        if self.rule_functions.get('validate_range') is not validate_range or not df.columns.is_unique:
+            return {}
+        
+        plan_rules = []
+        for rule in self.config.rules:
+            if not (rule.scope == RuleScope.ROW and rule.enabled and rule.condition == 'validate_range'):
+                continue
+            if rule.python_expression or rule.filter_condition or not rule.columns:
+                continue
+            if not all(col in df.columns for col in rule.columns):
+                continue
+            bounds = (rule.parameters.get('min_value', -np.inf), rule.parameters.get('max_value', np.inf))
+            if not all(isinstance(b, (int, float)) for b in bounds):
+                continue
+            plan_rules.append((rule, bounds))
+        
+        if len(plan_rules) < 2:
+            return {}
+        
+        # Flatten to one (rule, column) pair per comparison; pairs of a rule are contiguous
+        block_columns = list(dict.fromkeys(col for rule, _ in plan_rules for col in rule.columns))
+        col_pos = {col: i for i, col in enumerate(block_columns)}
+        col_idx, mins, maxs, starts = [], [], [], []
+        for rule, (min_val, max_val) in plan_rules:
+            starts.append(len(col_idx))
+            for col in rule.columns:
+                col_idx.append(col_pos[col])
+                mins.append(min_val)
+                maxs.append(max_val)
+        
+        vals = _numeric_block(df, block_columns)[:, col_idx]
+        ok = (vals >= np.array(mins, dtype=np.float64)) & (vals <= np.array(maxs, dtype=np.float64))
+        per_rule = np.logical_and.reduceat(ok, starts, axis=1)
+        
+        return {
+            id(rule): pd.Series(per_rule[:, i], index=df.index)
+            for i, (rule, _) in enumerate(plan_rules)
+        }
+    
     def _execute_paper_rules(
         self, 
         df: pd.DataFrame, 
@@ -429,7 +504,7 @@ class RuleEngine:
         try:
             with warnings.catch_warnings():
                 warnings.filterwarnings('ignore', category=SyntaxWarning)
-                result = eval(condition, {"__builtins__": {}}, context)
+                result = eval(self._compile(condition), {"__builtins__": {}}, context)
             if isinstance(result, pd.Series):
                 return result
             elif isinstance(result, bool):
@@ -463,7 +538,7 @@ class RuleEngine:
         try:
             with warnings.catch_warnings():
                 warnings.filterwarnings('ignore', category=SyntaxWarning)
-                result = eval(expression, {"__builtins__": {}}, context)
+                result = eval(self._compile(expression), {"__builtins__": {}}, context)
             return bool(result)
         except Exception as e:
             raise ValueError(f"Failed to evaluate aggregation '{expression}': {str(e)}")
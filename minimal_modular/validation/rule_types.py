@@ -25,7 +25,7 @@ class RuleScope(Enum):
     DATASET = "dataset"       # Global dataset validation
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of a single validation check."""
     rule_id: str